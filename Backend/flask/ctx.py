@@ -11,11 +11,13 @@ from werkzeug.exceptions import HTTPException
 from . import typing as ft
 from .globals import _cv_app
 from .globals import _cv_request
+from .sessions import StatelessSession
 from .signals import appcontext_popped
 from .signals import appcontext_pushed
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from _typeshed.wsgi import WSGIEnvironment
+    from werkzeug.routing import MapAdapter
 
     from .app import Flask
     from .sessions import SessionMixin
@@ -240,14 +242,33 @@ class AppContext:
     context is created and pushed at the beginning of each request if
     one is not already active. An app context is also pushed when
     running CLI commands.
+
+    .. versionchanged:: 3.0.4
+        The URL adapter is created the first time it is accessed. During
+        a request the request context's adapter is used instead, so it is
+        usually never created.
     """
 
     def __init__(self, app: Flask) -> None:
         self.app = app
-        self.url_adapter = app.create_url_adapter(None)
+        self._url_adapter: MapAdapter | None = _sentinel  # type: ignore[assignment]
         self.g: _AppCtxGlobals = app.app_ctx_globals_class()
         self._cv_tokens: list[contextvars.Token[AppContext]] = []
 
+    @property
+    def url_adapter(self) -> MapAdapter | None:
+        """The URL adapter for the app, created from ``SERVER_NAME`` by
+        :meth:`~flask.Flask.create_url_adapter`, or ``None``.
+        """
+        if self._url_adapter is _sentinel:
+            self._url_adapter = self.app.create_url_adapter(None)
+
+        return self._url_adapter
+
+    @url_adapter.setter
+    def url_adapter(self, value: MapAdapter | None) -> None:
+        self._url_adapter = value
+
     def push(self) -> None:
         """Binds the app context to the current context."""
         self._cv_tokens.append(_cv_app.set(self))
@@ -324,7 +345,7 @@ class RequestContext:
         except HTTPException as e:
             self.request.routing_exception = e
         self.flashes: list[tuple[str, str]] | None = None
-        self.session: SessionMixin | None = session
+        self._session: SessionMixin | None = session
         # Functions that should be executed after the request on the response
         # object.  These will be called before the regular "after_request"
         # functions.
@@ -377,22 +398,59 @@ class RequestContext:
 
         self._cv_tokens.append((_cv_request.set(self), app_ctx))
 
-        # Open the session at the moment that the request context is available.
-        # This allows a custom open_session method to use the request context.
-        # Only open a new session if this is the first time the request was
-        # pushed, otherwise stream_with_context loses the session.
-        if self.session is None:
-            session_interface = self.app.session_interface
-            self.session = session_interface.open_session(self.app, self.request)
-
-            if self.session is None:
-                self.session = session_interface.make_null_session(self.app)
-
-        # Match the request URL after loading the session, so that the
-        # session is available in custom URL converters.
+        # The session is opened the first time it is accessed, see the
+        # session property. The session is available in custom URL
+        # converters, but only matched stateless routes skip it.
         if self.url_adapter is not None:
             self.match_request()
 
+    @property
+    def session(self) -> SessionMixin:
+        """The session for this request. It is opened with
+        :meth:`~flask.sessions.SessionInterface.open_session` the first
+        time it is accessed, so requests that never use the session
+        don't load it, and :meth:`.Flask.process_response` doesn't save
+        it. The exception is a request with a session cookie when
+        :data:`SESSION_REFRESH_EACH_REQUEST` is set, where the session
+        is opened and saved so a permanent session's cookie is
+        refreshed. That is the default, so with the default config only
+        ``stateless`` routes skip session work for clients that have a
+        session cookie. If the matched route is ``stateless``, it is a
+        :class:`~flask.sessions.StatelessSession` instead.
+
+        .. versionchanged:: 3.0.4
+            The session is opened when first accessed, not when the
+            context is pushed.
+        """
+        if self._session is None:
+            rule = self.request.url_rule
+
+            if rule is not None and getattr(rule, "stateless", False):
+                self._session = StatelessSession()
+            else:
+                session_interface = self.app.session_interface
+                session = session_interface.open_session(self.app, self.request)
+
+                if session is None:
+                    session = session_interface.make_null_session(self.app)
+
+                self._session = session
+
+        return self._session
+
+    @session.setter
+    def session(self, value: SessionMixin) -> None:
+        self._session = value
+
+    @property
+    def session_opened(self) -> bool:
+        """The session for this request was accessed, or was passed in
+        when creating the context.
+
+        .. versionadded:: 3.0.4
+        """
+        return self._session is not None
+
     def pop(self, exc: BaseException | None = _sentinel) -> None:  # type: ignore
         """Pops the request context and unbinds it by doing that.  This will
         also trigger the execution of functions registered by the
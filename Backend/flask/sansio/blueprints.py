@@ -84,6 +84,9 @@ class BlueprintSetupState:
         self.url_defaults = dict(self.blueprint.url_values_defaults)
         self.url_defaults.update(self.options.get("url_defaults", ()))
 
+        #: Mark every URL defined with the blueprint as stateless.
+        self.stateless: bool = self.options.get("stateless", blueprint.stateless)
+
     def add_url_rule(
         self,
         rule: str,
@@ -106,6 +109,8 @@ class BlueprintSetupState:
         defaults = self.url_defaults
         if "defaults" in options:
             defaults = dict(defaults, **options.pop("defaults"))
+        if self.stateless:
+            options.setdefault("stateless", True)
 
         self.app.add_url_rule(
             rule,
@@ -160,6 +165,12 @@ class Blueprint(Scaffold):
         this based on ``import_name``. In certain situations this
         automatic detection can fail, so the path can be specified
         manually instead.
+    :param stateless: Mark all of the blueprint's routes, including
+        those of nested blueprints, as ``stateless``. See
+        :meth:`.Flask.add_url_rule`.
+
+    .. versionchanged:: 3.0.4
+        Added the ``stateless`` parameter.
 
     .. versionchanged:: 1.1.0
         Blueprints have a ``cli`` group to register nested CLI commands.
@@ -183,6 +194,7 @@ class Blueprint(Scaffold):
         url_defaults: dict[str, t.Any] | None = None,
         root_path: str | None = None,
         cli_group: str | None = _sentinel,  # type: ignore[assignment]
+        stateless: bool = False,
     ):
         super().__init__(
             import_name=import_name,
@@ -208,6 +220,7 @@ class Blueprint(Scaffold):
 
         self.url_values_defaults = url_defaults
         self.cli_group = cli_group
+        self.stateless = stateless
         self._blueprints: list[tuple[Blueprint, dict[str, t.Any]]] = []
 
     def _check_setup_finished(self, f_name: str) -> None:
@@ -373,6 +386,9 @@ class Blueprint(Scaffold):
             elif state.url_prefix is not None:
                 bp_options["url_prefix"] = state.url_prefix
 
+            if state.stateless:
+                bp_options.setdefault("stateless", True)
+
             bp_options["name_prefix"] = name
             blueprint.register(app, bp_options)
 
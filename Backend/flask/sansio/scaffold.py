@@ -417,7 +417,24 @@ class Scaffold:
         If ``view_func`` has a ``required_methods`` attribute, those
         methods are added to the passed and automatic methods. If it
         has a ``provide_automatic_methods`` attribute, it is used as the
-        default if the parameter is not passed.
+        default if the parameter is not passed. If it has a
+        ``stateless`` attribute, it is used as the default for the
+        ``stateless`` option.
+
+        A view that never uses the session can pass ``stateless=True``.
+        The session is not loaded or saved for requests to the route,
+        and :data:`.session` is an empty session that can't be changed.
+        Views that aren't marked still skip that work if they never
+        access the session.
+
+        A route can set ``max_content_length`` and ``max_json_depth``
+        options, or the view function can have attributes with those
+        names, to use instead of the :data:`MAX_CONTENT_LENGTH` and
+        :data:`MAX_JSON_DEPTH` config for requests to the route. If the
+        ``Content-Length`` header is larger than the limit, a ``413
+        Content Too Large`` error is raised before any
+        :meth:`before_request` functions or the view are called, and
+        before any data is read.
 
         :param rule: The URL rule string.
         :param endpoint: The endpoint name to associate with the rule
@@ -429,6 +446,10 @@ class Scaffold:
             respond to ``OPTIONS`` requests automatically.
         :param options: Extra options passed to the
             :class:`~werkzeug.routing.Rule` object.
+
+        .. versionchanged:: 3.0.4
+            Added the ``stateless``, ``max_content_length``, and
+            ``max_json_depth`` options.
         """
         raise NotImplementedError
 
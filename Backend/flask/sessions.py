@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import hashlib
+import secrets
+import sqlite3
+import threading
+import time
 import typing as t
+from collections import OrderedDict
 from collections.abc import MutableMapping
+from contextlib import closing
 from datetime import datetime
 from datetime import timezone
 
@@ -109,6 +115,25 @@ class NullSession(SecureCookieSession):
     del _fail
 
 
+class StatelessSession(NullSession):
+    """The session for requests to views marked as ``stateless``. It is
+    not loaded from or saved to the session interface, so it is always
+    empty and fails on setting.
+
+    .. versionadded:: 3.0.4
+    """
+
+    def _fail(self, *args: t.Any, **kwargs: t.Any) -> t.NoReturn:
+        raise RuntimeError(
+            "The session is unavailable because the view is marked as"
+            " stateless. Remove 'stateless' from the route to use the"
+            " session."
+        )
+
+    __setitem__ = __delitem__ = clear = pop = popitem = update = setdefault = _fail  # type: ignore # noqa: B950
+    del _fail
+
+
 class SessionInterface:
     """The basic interface you have to implement in order to replace the
     default session interface which uses werkzeug's securecookie
@@ -377,3 +402,522 @@ class SecureCookieSessionInterface(SessionInterface):
             samesite=samesite,
         )
         response.vary.add("Cookie")
+
+
+class SessionStore:
+    """The storage used by :class:`ServerSideSessionInterface`. Session
+    data is passed to and from the store as serialized text, and
+    expiration times as POSIX timestamps. Subclasses implement
+    :meth:`load`, :meth:`save`, :meth:`delete`, and
+    :meth:`delete_expired`, and may implement :meth:`touch` more
+    efficiently.
+
+    Multiple requests for the same session may be handled concurrently,
+    so each method must be safe to call from multiple threads.
+
+    .. versionadded:: 3.0.4
+    """
+
+    def load(self, sid: str) -> str | None:
+        """Return the data for a session, or ``None`` if the session
+        does not exist or has expired.
+        """
+        raise NotImplementedError()
+
+    def save(self, sid: str, data: str, expires: float) -> None:
+        """Create or replace the data for a session."""
+        raise NotImplementedError()
+
+    def touch(self, sid: str, expires: float) -> None:
+        """Extend the expiration time of a session without changing its
+        data. The default implementation loads and saves the data.
+        """
+        data = self.load(sid)
+
+        if data is not None:
+            self.save(sid, data, expires)
+
+    def delete(self, sid: str) -> None:
+        """Delete a session if it exists."""
+        raise NotImplementedError()
+
+    def delete_expired(self, now: float, limit: int | None = None) -> int:
+        """Delete sessions that expired before ``now``, at most
+        ``limit`` at once, and return how many were deleted.
+        """
+        raise NotImplementedError()
+
+
+class MemorySessionStore(SessionStore):
+    """Store sessions in memory in the current process. When there are
+    more than ``maxsize`` sessions, the least recently used are
+    discarded. Sessions are not shared between worker processes and are
+    lost on restart, so this is most useful for development and tests.
+
+    :param maxsize: The maximum number of sessions to keep.
+
+    .. versionadded:: 3.0.4
+    """
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, sid: str) -> str | None:
+        with self._lock:
+            try:
+                data, expires = self._data[sid]
+            except KeyError:
+                return None
+
+            if expires <= time.time():
+                del self._data[sid]
+                return None
+
+            self._data.move_to_end(sid)
+            return data
+
+    def save(self, sid: str, data: str, expires: float) -> None:
+        with self._lock:
+            self._data[sid] = (data, expires)
+            self._data.move_to_end(sid)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def touch(self, sid: str, expires: float) -> None:
+        with self._lock:
+            try:
+                data, _ = self._data[sid]
+            except KeyError:
+                return
+
+            self._data[sid] = (data, expires)
+            self._data.move_to_end(sid)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def delete_expired(self, now: float, limit: int | None = None) -> int:
+        with self._lock:
+            expired = [
+                sid for sid, (_, expires) in self._data.items() if expires <= now
+            ]
+
+            if limit is not None:
+                del expired[limit:]
+
+            for sid in expired:
+                del self._data[sid]
+
+        return len(expired)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Store sessions in a table in a SQLite database file, such as the
+    app's ``instance/site.db``. The table is created if it does not
+    exist. Each thread uses its own connection, and the database is
+    switched to WAL journal mode so that reads and writes from
+    concurrent requests don't block each other.
+
+    .. code-block:: python
+
+        store = SQLiteSessionStore(os.path.join(app.instance_path, "site.db"))
+        app.session_interface = ServerSideSessionInterface(store)
+
+    :param path: The path to the database file.
+    :param table: The name of the table to store sessions in.
+
+    .. versionadded:: 3.0.4
+    """
+
+    def __init__(self, path: str, table: str = "flask_sessions") -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name {table!r}.")
+
+        self.path = path
+        self.table = table
+        self._local = threading.local()
+
+        # WAL mode is stored in the database file, so the schema and
+        # journal mode are set up once rather than by every thread.
+        with closing(sqlite3.connect(path, timeout=10, isolation_level=None)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}"
+                " (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_expires ON {table} (expires)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            return self._local.connection  # type: ignore[no-any-return]
+        except AttributeError:
+            pass
+
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        # Session writes don't need to wait for each commit to be synced
+        # to disk. This is a per-connection setting.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._local.connection = conn
+        return conn
+
+    def load(self, sid: str) -> str | None:
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT data FROM {self.table} WHERE id = ? AND expires > ?",
+                (sid, time.time()),
+            )
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def save(self, sid: str, data: str, expires: float) -> None:
+        self._connect().execute(
+            f"INSERT OR REPLACE INTO {self.table} (id, data, expires)"
+            " VALUES (?, ?, ?)",
+            (sid, data, expires),
+        )
+
+    def touch(self, sid: str, expires: float) -> None:
+        self._connect().execute(
+            f"UPDATE {self.table} SET expires = ? WHERE id = ?", (expires, sid)
+        )
+
+    def delete(self, sid: str) -> None:
+        self._connect().execute(f"DELETE FROM {self.table} WHERE id = ?", (sid,))
+
+    def delete_expired(self, now: float, limit: int | None = None) -> int:
+        conn = self._connect()
+
+        if limit is None:
+            cur = conn.execute(f"DELETE FROM {self.table} WHERE expires <= ?", (now,))
+        else:
+            cur = conn.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN (SELECT rowid FROM"
+                f" {self.table} WHERE expires <= ? LIMIT ?)",
+                (now, limit),
+            )
+
+        return cur.rowcount
+
+
+class MongoSessionStore(SessionStore):
+    """Store sessions as documents in a MongoDB collection, using the
+    session ID as the ``_id``.
+
+    .. code-block:: python
+
+        store = MongoSessionStore(db["sessions"])
+        app.session_interface = ServerSideSessionInterface(store)
+
+    MongoDB can also remove expired documents itself with a TTL index on
+    the ``expires_at`` field, in which case :meth:`delete_expired` has
+    little left to do.
+
+    :param collection: A :class:`pymongo.collection.Collection`.
+
+    .. versionadded:: 3.0.4
+    """
+
+    def __init__(self, collection: t.Any) -> None:
+        self.collection = collection
+
+    def load(self, sid: str) -> str | None:
+        doc = self.collection.find_one(
+            {"_id": sid, "expires": {"$gt": time.time()}}, {"data": True}
+        )
+        return None if doc is None else doc["data"]  # type: ignore[no-any-return]
+
+    def save(self, sid: str, data: str, expires: float) -> None:
+        self.collection.replace_one(
+            {"_id": sid},
+            {
+                "data": data,
+                "expires": expires,
+                "expires_at": datetime.fromtimestamp(expires, timezone.utc),
+            },
+            upsert=True,
+        )
+
+    def touch(self, sid: str, expires: float) -> None:
+        self.collection.update_one(
+            {"_id": sid},
+            {
+                "$set": {
+                    "expires": expires,
+                    "expires_at": datetime.fromtimestamp(expires, timezone.utc),
+                }
+            },
+        )
+
+    def delete(self, sid: str) -> None:
+        self.collection.delete_one({"_id": sid})
+
+    def delete_expired(self, now: float, limit: int | None = None) -> int:
+        query: dict[str, t.Any] = {"expires": {"$lte": now}}
+
+        if limit is not None:
+            ids = [
+                doc["_id"]
+                for doc in self.collection.find(query, {"_id": True}).limit(limit)
+            ]
+
+            if not ids:
+                return 0
+
+            query = {"_id": {"$in": ids}}
+
+        result = self.collection.delete_many(query)
+        return result.deleted_count  # type: ignore[no-any-return]
+
+
+class ServerSideSession(SessionMixin):
+    """A session whose data is kept in a :class:`SessionStore`, with
+    only its ID in the cookie. The data is not loaded from the store
+    until the session is first used, so requests that don't use the
+    session don't access the store.
+
+    Like :class:`SecureCookieSession`, this tracks :attr:`modified` and
+    :attr:`accessed`, and changes to mutable values in the session must
+    be marked by setting :attr:`modified` manually.
+
+    .. versionadded:: 3.0.4
+    """
+
+    modified = False
+    accessed = False
+
+    def __init__(
+        self,
+        sid: str | None = None,
+        loader: t.Callable[[str], dict[str, t.Any] | None] | None = None,
+    ) -> None:
+        #: The session ID, or ``None`` if the session is not stored yet.
+        self.sid = sid
+        self._loader = loader
+        self._data: dict[str, t.Any] | None = None if sid and loader else {}
+
+    @property
+    def new(self) -> bool:  # type: ignore[override]
+        """The session was not loaded from the store."""
+        return self.sid is None
+
+    @property
+    def loaded(self) -> bool:
+        """The session data was loaded from the store, or there was none
+        to load.
+        """
+        return self._data is not None
+
+    def _load(self) -> dict[str, t.Any]:
+        self.accessed = True
+
+        if self._data is None:
+            data = self._loader(self.sid)  # type: ignore[arg-type, misc]
+
+            if data is None:
+                # The session expired or was deleted, start a new one.
+                self.sid = None
+                data = {}
+
+            self._data = data
+
+        return self._data
+
+    def __getitem__(self, key: str) -> t.Any:
+        return self._load()[key]
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        self._load()[key] = value
+        self.modified = True
+
+    def __delitem__(self, key: str) -> None:
+        del self._load()[key]
+        self.modified = True
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self._load().get(key, default)
+
+    def clear(self) -> None:
+        self._load().clear()
+        self.modified = True
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"<{type(self).__name__} {self.sid!r} (not loaded)>"
+
+        return f"<{type(self).__name__} {self._data!r}>"
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """A session interface that keeps session data in a
+    :class:`SessionStore`, such as :class:`MemorySessionStore`,
+    :class:`SQLiteSessionStore`, or :class:`MongoSessionStore`. The
+    cookie only contains a random session ID, so it stays small and
+    doesn't need to be signed.
+
+    .. code-block:: python
+
+        app.session_interface = ServerSideSessionInterface(
+            SQLiteSessionStore(os.path.join(app.instance_path, "site.db"))
+        )
+
+    The session is loaded from the store the first time it is used
+    during a request, and only written back if it was modified. If the
+    session is permanent and :data:`SESSION_REFRESH_EACH_REQUEST` is
+    set, only its expiration time is updated.
+
+    Sessions that are not permanent are kept in the store for
+    :attr:`~flask.Flask.permanent_session_lifetime` after they were last
+    saved. At most once every :attr:`sweep_interval` seconds, while
+    saving a session, up to :attr:`sweep_batch` expired sessions are
+    deleted from the store. Call :meth:`sweep` to delete expired
+    sessions at other times, such as from a scheduled command.
+
+    :param store: The store to use. Defaults to a
+        :class:`MemorySessionStore`.
+
+    .. versionadded:: 3.0.4
+    """
+
+    session_class = ServerSideSession
+    #: Serializes the session data for the store. Supports the same
+    #: types as the default cookie session.
+    serializer = session_json_serializer
+    #: The number of random bytes in a session ID.
+    sid_bytes = 32
+    #: Seconds between deleting expired sessions. Set to ``None`` to
+    #: only delete them by calling :meth:`sweep`.
+    sweep_interval: float | None = 60
+    #: The maximum number of expired sessions to delete in a sweep.
+    sweep_batch: int | None = 1000
+
+    def __init__(self, store: SessionStore | None = None) -> None:
+        self.store = store if store is not None else MemorySessionStore()
+        self._next_sweep = time.monotonic() + (self.sweep_interval or 0)
+        self._sweep_lock = threading.Lock()
+
+    def generate_sid(self) -> str:
+        """Generate a new random session ID."""
+        return secrets.token_urlsafe(self.sid_bytes)
+
+    def _load_data(self, sid: str) -> dict[str, t.Any] | None:
+        data = self.store.load(sid)
+
+        if data is None:
+            return None
+
+        try:
+            return self.serializer.loads(data)  # type: ignore[no-any-return]
+        except ValueError:
+            return None
+
+    def open_session(self, app: Flask, request: Request) -> ServerSideSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+
+        # Reject values that can't be generated IDs without a lookup.
+        if not sid or len(sid) > 2 * self.sid_bytes:
+            return self.session_class()
+
+        return self.session_class(sid, self._load_data)
+
+    def save_session(
+        self, app: Flask, session: SessionMixin, response: Response
+    ) -> None:
+        # The session was never used, there is nothing to write.
+        if not session.accessed and not session.modified:
+            return
+
+        response.vary.add("Cookie")
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+        sid = getattr(session, "sid", None)
+
+        # If the session is modified to be empty, delete it.
+        if not session:
+            if session.modified:
+                if sid is not None:
+                    self.store.delete(sid)
+
+                response.delete_cookie(
+                    name,
+                    domain=domain,
+                    path=path,
+                    secure=secure,
+                    samesite=samesite,
+                    httponly=httponly,
+                )
+
+            return
+
+        if not self.should_set_cookie(app, session):
+            return
+
+        expires = self.get_expiration_time(app, session)
+        store_expires = (
+            expires.timestamp()
+            if expires is not None
+            else time.time() + app.permanent_session_lifetime.total_seconds()
+        )
+
+        if sid is None or session.modified:
+            if sid is None:
+                sid = self.generate_sid()
+                session.sid = sid  # type: ignore[attr-defined]
+
+            self.store.save(sid, self.serializer.dumps(dict(session)), store_expires)
+        else:
+            self.store.touch(sid, store_expires)
+
+        response.set_cookie(
+            name,
+            sid,
+            expires=expires,
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+        self._maybe_sweep()
+
+    def sweep(self, limit: int | None = None) -> int:
+        """Delete expired sessions from the store, and return how many
+        were deleted.
+
+        :param limit: The maximum number to delete.
+        """
+        return self.store.delete_expired(time.time(), limit)
+
+    def _maybe_sweep(self) -> None:
+        if self.sweep_interval is None or time.monotonic() < self._next_sweep:
+            return
+
+        # Only one thread sweeps, others continue without waiting.
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._next_sweep = time.monotonic() + self.sweep_interval
+            self.sweep(self.sweep_batch)
+        finally:
+            self._sweep_lock.release()
@@ -6,11 +6,13 @@ from jinja2 import BaseLoader
 from jinja2 import Environment as BaseEnvironment
 from jinja2 import Template
 from jinja2 import TemplateNotFound
+from jinja2.environment import TemplateStream
 
 from .globals import _cv_app
 from .globals import _cv_request
 from .globals import current_app
 from .globals import request
+from .globals import session
 from .helpers import stream_with_context
 from .signals import before_render_template
 from .signals import template_rendered
@@ -32,7 +34,8 @@ def _default_template_ctx_processor() -> dict[str, t.Any]:
         rv["g"] = appctx.g
     if reqctx is not None:
         rv["request"] = reqctx.request
-        rv["session"] = reqctx.session
+        # Don't open the session unless the template uses it.
+        rv["session"] = session
     return rv
 
 
@@ -176,7 +179,15 @@ def _stream(
             app, _async_wrapper=app.ensure_sync, template=template, context=context
         )
 
-    rv = generate()
+    rv: t.Iterator[str] = generate()
+    buffer_size = app.config["TEMPLATES_STREAM_BUFFER_SIZE"]
+
+    # Yield chunks of about this many bytes, or up to a {% flush %} tag,
+    # instead of every fragment of the template.
+    if buffer_size:
+        stream = TemplateStream(rv)
+        stream.enable_byte_buffering(buffer_size)
+        rv = stream
 
     # If a request context is active, keep it while generating.
     if request:
@@ -193,10 +204,19 @@ def stream_template(
     This returns an iterator of strings, which can be used as a
     streaming response from a view.
 
+    If the ``TEMPLATES_STREAM_BUFFER_SIZE`` config is set, output is
+    yielded in chunks of at least that many bytes, or up to a
+    ``{% flush %}`` tag in the template. The tag is available if
+    ``"jinja2.ext.flush"`` is added to the ``extensions`` in
+    :attr:`~flask.Flask.jinja_options`.
+
     :param template_name_or_list: The name of the template to render. If
         a list is given, the first name to exist will be rendered.
     :param context: The variables to make available in the template.
 
+    .. versionchanged:: 3.0.4
+        Buffered with the ``TEMPLATES_STREAM_BUFFER_SIZE`` config.
+
     .. versionadded:: 2.2
     """
     app = current_app._get_current_object()  # type: ignore[attr-defined]
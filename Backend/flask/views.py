@@ -55,6 +55,20 @@ class View:
     #: ``add_url_rule`` by default.
     provide_automatic_options: t.ClassVar[bool | None] = None
 
+    #: Mark the view as not using the session. See
+    #: :meth:`.Flask.add_url_rule`.
+    #:
+    #: .. versionadded:: 3.0.4
+    stateless: t.ClassVar[bool] = False
+
+    #: Limit the size of request data and the depth of JSON data for
+    #: the view, instead of the app's config. See
+    #: :meth:`.Flask.add_url_rule`.
+    #:
+    #: .. versionadded:: 3.0.4
+    max_content_length: t.ClassVar[int | None] = None
+    max_json_depth: t.ClassVar[int | None] = None
+
     #: A list of decorators to apply, in order, to the generated view
     #: function. Remember that ``@decorator`` syntax is applied bottom
     #: to top, so the first decorator in the list would be the bottom
@@ -132,6 +146,9 @@ class View:
         view.__module__ = cls.__module__
         view.methods = cls.methods  # type: ignore
         view.provide_automatic_options = cls.provide_automatic_options  # type: ignore
+        view.stateless = cls.stateless  # type: ignore
+        view.max_content_length = cls.max_content_length  # type: ignore
+        view.max_json_depth = cls.max_json_depth  # type: ignore
         return view
 
 
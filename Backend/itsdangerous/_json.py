@@ -4,6 +4,11 @@ import json as _json
 import typing as t
 
 
+# Reused for every call without extra options, like json.dumps does with
+# its default encoder, instead of creating an encoder each time.
+_compact_encoder = _json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 class _CompactJSON:
     """Wrapper around json module that strips whitespace."""
 
@@ -13,6 +18,9 @@ class _CompactJSON:
 
     @staticmethod
     def dumps(obj: t.Any, **kwargs: t.Any) -> str:
+        if not kwargs:
+            return _compact_encoder.encode(obj)
+
         kwargs.setdefault("ensure_ascii", False)
         kwargs.setdefault("separators", (",", ":"))
         return _json.dumps(obj, **kwargs)
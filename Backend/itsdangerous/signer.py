@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import functools
 import hashlib
 import hmac
 import typing as t
@@ -60,10 +61,42 @@ class HMACAlgorithm(SigningAlgorithm):
         self.digest_method: t.Any = digest_method
 
     def get_signature(self, key: bytes, value: bytes) -> bytes:
-        mac = hmac.new(key, msg=value, digestmod=self.digest_method)
+        mac = _keyed_hmac(key, self.digest_method).copy()
+        mac.update(value)
         return mac.digest()
 
 
+@functools.lru_cache(maxsize=64)
+def _keyed_hmac(key: bytes, digest_method: t.Any) -> hmac.HMAC:
+    """An HMAC object that has processed the key but no message yet.
+    Copying it is faster than creating an HMAC for each signature, which
+    hashes the padded key again.
+    """
+    return hmac.new(key, digestmod=digest_method)
+
+
+@functools.lru_cache(maxsize=64)
+def _derive_key(
+    key_derivation: str, digest_method: t.Any, salt: bytes, secret_key: bytes
+) -> bytes:
+    """Derive the signing key for :meth:`Signer.derive_key`. The result
+    only depends on the arguments, so it's cached for the serializers
+    that create a new signer to sign or verify each value.
+    """
+    if key_derivation == "concat":
+        return t.cast(bytes, digest_method(salt + secret_key).digest())
+    elif key_derivation == "django-concat":
+        return t.cast(bytes, digest_method(salt + b"signer" + secret_key).digest())
+    elif key_derivation == "hmac":
+        mac = hmac.new(secret_key, digestmod=digest_method)
+        mac.update(salt)
+        return mac.digest()
+    elif key_derivation == "none":
+        return secret_key
+    else:
+        raise TypeError("Unknown key derivation method")
+
+
 def _make_keys_list(
     secret_key: str | bytes | cabc.Iterable[str] | cabc.Iterable[bytes],
 ) -> list[bytes]:
@@ -189,6 +222,9 @@ class Signer:
         :param secret_key: A specific secret key to derive from.
             Defaults to the last item in :attr:`secret_keys`.
 
+        .. versionchanged:: 2.2.1
+            Derived keys are cached per secret key, salt, and method.
+
         .. versionchanged:: 2.0
             Added the ``secret_key`` parameter.
         """
@@ -197,20 +233,9 @@ class Signer:
         else:
             secret_key = want_bytes(secret_key)
 
-        if self.key_derivation == "concat":
-            return t.cast(bytes, self.digest_method(self.salt + secret_key).digest())
-        elif self.key_derivation == "django-concat":
-            return t.cast(
-                bytes, self.digest_method(self.salt + b"signer" + secret_key).digest()
-            )
-        elif self.key_derivation == "hmac":
-            mac = hmac.new(secret_key, digestmod=self.digest_method)
-            mac.update(self.salt)
-            return mac.digest()
-        elif self.key_derivation == "none":
-            return secret_key
-        else:
-            raise TypeError("Unknown key derivation method")
+        return _derive_key(
+            self.key_derivation, self.digest_method, self.salt, secret_key
+        )
 
     def get_signature(self, value: str | bytes) -> bytes:
         """Returns the signature for the given value."""
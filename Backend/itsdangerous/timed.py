@@ -11,6 +11,7 @@ from .encoding import base64_encode
 from .encoding import bytes_to_int
 from .encoding import int_to_bytes
 from .encoding import want_bytes
+from .exc import BadData
 from .exc import BadSignature
 from .exc import BadTimeSignature
 from .exc import SignatureExpired
@@ -196,10 +197,23 @@ class TimedSerializer(Serializer[_TSerialized]):
         raised. All arguments are forwarded to the signer's
         :meth:`~TimestampSigner.unsign` method.
         """
-        s = want_bytes(s)
+        return self._load_with(
+            want_bytes(s),
+            self.iter_unsigners(salt),
+            max_age=max_age,
+            return_timestamp=return_timestamp,
+        )
+
+    def _load_with(  # type: ignore[override]
+        self,
+        s: bytes,
+        unsigners: cabc.Iterable[TimestampSigner],
+        max_age: int | None = None,
+        return_timestamp: bool = False,
+    ) -> t.Any:
         last_exception = None
 
-        for signer in self.iter_unsigners(salt):
+        for signer in unsigners:
             try:
                 base64d, timestamp = signer.unsign(
                     s, max_age=max_age, return_timestamp=True
@@ -219,6 +233,27 @@ class TimedSerializer(Serializer[_TSerialized]):
 
         raise t.cast(BadSignature, last_exception)
 
+    def loads_many(  # type: ignore[override]
+        self,
+        values: cabc.Iterable[str | bytes],
+        max_age: int | None = None,
+        return_timestamp: bool = False,
+        salt: str | bytes | None = None,
+        processes: int | None = None,
+    ) -> list[tuple[t.Any, BadData | None]]:
+        """Like :meth:`loads`, but for many values at once, returning
+        ``(obj, error)`` pairs like :meth:`.Serializer.loads_many`. An
+        expired value gives a :exc:`.SignatureExpired` error.
+
+        .. versionadded:: 2.2.1
+        """
+        return self._loads_many_batch(
+            values,
+            salt,
+            processes,
+            {"max_age": max_age, "return_timestamp": return_timestamp},
+        )
+
     def loads_unsafe(  # type: ignore[override]
         self,
         s: str | bytes,
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import typing as t
 from functools import WRAPPER_ASSIGNMENTS
@@ -82,3 +83,32 @@ async def auto_to_list(
     value: "t.Union[t.AsyncIterable[V], t.Iterable[V]]",
 ) -> t.List["V"]:
     return [x async for x in auto_aiter(value)]
+
+
+async def gather_awaitables(values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+    """Await the awaitable values of a template context at the same time
+    and replace them with their results.
+    """
+    keys = [key for key, value in values.items() if inspect.isawaitable(value)]
+
+    if keys:
+        results = await render_concurrently(values[key] for key in keys)
+        values.update(zip(keys, results))
+
+    return values
+
+
+async def render_concurrently(parts: t.Iterable[t.Awaitable["V"]]) -> t.List["V"]:
+    """Await the parts of a ``{% concurrent %}`` block at the same time
+    and return their results in order. If one fails, the others are
+    cancelled.
+    """
+    tasks = [asyncio.ensure_future(part) for part in parts]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+
+        raise
@@ -9,11 +9,14 @@ are initialized on the first request.
 import errno
 import fnmatch
 import marshal
+import mmap
 import os
 import pickle
 import stat
+import struct
 import sys
 import tempfile
+import threading
 import typing as t
 from hashlib import sha1
 from io import BytesIO
@@ -406,3 +409,226 @@ class MemcachedBytecodeCache(BytecodeCache):
         except Exception:
             if not self.ignore_memcache_errors:
                 raise
+
+
+# Packed cache files start with the bytecode magic, then the size of the
+# marshalled index that follows it. The index maps cache keys to the
+# offset and length of their bucket data after the index.
+_pack_magic = bc_magic + b"pack"
+_pack_header = struct.Struct(">Q")
+
+
+class PackedBytecodeCache(BytecodeCache):
+    """A bytecode cache that stores the bytecode for all templates in one
+    indexed file. The file is memory mapped when it is first used, and a
+    template's bytecode is only unmarshalled when that template is
+    loaded. Pre-fork worker processes share the mapped pages instead of
+    each reading its own copy of every cache file.
+
+    The file is meant to be built once at deploy time with
+    :meth:`compile_templates`, for example with the
+    ``flask templates precompile`` command. At runtime it is read only.
+    Bytecode for templates that are missing from the file or whose
+    source changed is kept in memory, and is added to the file by
+    calling :meth:`write`.
+
+    >>> bcc = PackedBytecodeCache('/srv/app/templates.jinja-pack')
+
+    The cache keys include the template's filename, so build the file
+    with templates at the same paths they are loaded from at runtime.
+
+    .. versionadded:: 3.1.5
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._mmap: t.Optional[mmap.mmap] = None
+        self._index: t.Optional[t.Dict[str, t.Tuple[int, int]]] = None
+        self._pending: t.Dict[str, bytes] = {}
+
+    def _load_index(self) -> t.Dict[str, t.Tuple[int, int]]:
+        with self._lock:
+            if self._index is not None:
+                return self._index
+
+            index: t.Dict[str, t.Tuple[int, int]] = {}
+
+            try:
+                f = open(self.filename, "rb")
+            except (FileNotFoundError, IsADirectoryError, PermissionError):
+                self._index = index
+                return index
+
+            with f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # An empty file can't be mapped.
+                    self._index = index
+                    return index
+
+            start = len(_pack_magic) + _pack_header.size
+
+            if mm[: len(_pack_magic)] == _pack_magic and len(mm) >= start:
+                (size,) = _pack_header.unpack(mm[len(_pack_magic) : start])
+
+                try:
+                    raw = marshal.loads(mm[start : start + size])
+                except (EOFError, ValueError, TypeError):
+                    raw = {}
+
+                data_start = start + size
+                index = {
+                    key: (data_start + offset, length)
+                    for key, (offset, length) in raw.items()
+                }
+                self._mmap = mm
+            else:
+                mm.close()
+
+            self._index = index
+            return index
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        data = self._pending.get(bucket.key)
+
+        if data is None:
+            if self._index is None:
+                self._load_index()
+
+            # write() and clear() close the mapping, read it under the lock.
+            with self._lock:
+                if self._index is None or self._mmap is None:
+                    return
+
+                try:
+                    offset, length = self._index[bucket.key]
+                except KeyError:
+                    return
+
+                data = self._mmap[offset : offset + length]
+
+        bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        self._pending[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self) -> None:
+        """Remove the pending bytecode and the cache file."""
+        with self._lock:
+            self._pending.clear()
+            self._close()
+
+            try:
+                os.remove(self.filename)
+            except OSError:
+                pass
+
+    def _close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+
+        self._mmap = None
+        self._index = None
+
+    def write(self) -> None:
+        """Write the bytecode in the file and the pending bytecode to a
+        new file, then replace the cache file with it.
+        """
+        index = self._load_index()
+
+        with self._lock:
+            buckets: t.Dict[str, bytes] = {
+                key: self._mmap[offset : offset + length]  # type: ignore[index]
+                for key, (offset, length) in index.items()
+            }
+            buckets.update(self._pending)
+            raw_index = {}
+            offset = 0
+
+            for key, data in buckets.items():
+                raw_index[key] = (offset, len(data))
+                offset += len(data)
+
+            packed_index = marshal.dumps(raw_index)
+            fd, tmp_name = self._create_temp_file()
+
+            try:
+                with open(fd, "wb") as f:
+                    f.write(_pack_magic)
+                    f.write(_pack_header.pack(len(packed_index)))
+                    f.write(packed_index)
+
+                    for data in buckets.values():
+                        f.write(data)
+
+                # Other processes keep their mapping of the old file.
+                os.replace(tmp_name, self.filename)
+            except BaseException:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+
+                raise
+
+            self._pending.clear()
+            self._close()
+
+    def _create_temp_file(self) -> t.Tuple[int, str]:
+        # Unlike NamedTemporaryFile, which is only readable by the
+        # current user, create the file with the permissions allowed by
+        # the umask, so that workers running as other users can read the
+        # pack once it replaces the cache file.
+        directory, base = os.path.split(os.path.abspath(self.filename))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+        for _ in range(100):
+            name = os.path.join(directory, f"{base}.{os.urandom(6).hex()}.tmp")
+
+            try:
+                return os.open(name, flags, 0o666), name
+            except FileExistsError:
+                continue
+
+        raise FileExistsError(
+            errno.EEXIST, "No usable temporary file name found", directory
+        )
+
+    def compile_templates(
+        self,
+        environment: "Environment",
+        names: t.Optional[t.Iterable[str]] = None,
+    ) -> t.List[str]:
+        """Compile templates with the environment and write their
+        bytecode to the cache file. Returns the names of the compiled
+        templates.
+
+        :param environment: The environment to load and compile the
+            templates with. Its loader must support listing templates if
+            ``names`` is not given.
+        :param names: The names of the templates to compile. Defaults to
+            all the templates in the environment.
+        """
+        if environment.loader is None:
+            raise TypeError("no loader for this environment specified")
+
+        if names is None:
+            names = environment.list_templates()
+
+        compiled = []
+
+        for name in names:
+            source, filename, _ = environment.loader.get_source(environment, name)
+            bucket = Bucket(
+                environment,
+                self.get_cache_key(name, filename),
+                self.get_source_checksum(source),
+            )
+            bucket.code = environment.compile(source, name, filename)  # type: ignore[assignment]
+            self.dump_bytecode(bucket)
+            compiled.append(name)
+
+        self.write()
+        return compiled
@@ -3,6 +3,7 @@ options.
 """
 
 import os
+import time
 import typing
 import typing as t
 import weakref
@@ -15,6 +16,7 @@ from types import CodeType
 from markupsafe import Markup
 
 from . import nodes
+from .async_utils import gather_awaitables
 from .compiler import CodeGenerator
 from .compiler import generate
 from .defaults import BLOCK_END_STRING
@@ -44,9 +46,13 @@ from .lexer import TokenStream
 from .nodes import EvalContext
 from .parser import Parser
 from .runtime import Context
+from .runtime import flush_marker
 from .runtime import new_context
+from .runtime import profile_render_func
+from .runtime import RenderProfiler
 from .runtime import Undefined
 from .utils import _PassArg
+from .utils import ClockCache
 from .utils import concat
 from .utils import consume
 from .utils import import_string
@@ -81,14 +87,31 @@ def get_spontaneous_environment(cls: t.Type[_env_bound], *args: t.Any) -> _env_b
 
 def create_cache(
     size: int,
+    clock: bool = False,
+    ttl: t.Optional[float] = None,
 ) -> t.Optional[t.MutableMapping[t.Tuple["weakref.ref[t.Any]", str], "Template"]]:
-    """Return the cache class for the given size."""
+    """Return the cache class for the given size.
+
+    :param size: The maximum number of templates. ``0`` disables the
+        cache, a negative size never evicts.
+    :param clock: Use a :class:`~jinja2.utils.ClockCache`, which doesn't
+        lock on reads and counts hits, misses, and evictions. Use it when
+        many threads render templates from the same environment.
+    :param ttl: Expire templates this many seconds after they were
+        cached. Implies ``clock``.
+
+    .. versionchanged:: 3.1.5
+        Added the ``clock`` and ``ttl`` parameters.
+    """
     if size == 0:
         return None
 
     if size < 0:
         return {}
 
+    if clock or ttl is not None:
+        return ClockCache(size, ttl)  # type: ignore
+
     return LRUCache(size)  # type: ignore
 
 
@@ -102,6 +125,9 @@ def copy_cache(
     if type(cache) is dict:  # noqa E721
         return {}
 
+    if isinstance(cache, ClockCache):
+        return ClockCache(cache.capacity, cache.ttl)  # type: ignore
+
     return LRUCache(cache.capacity)  # type: ignore
 
 
@@ -251,6 +277,29 @@ class Environment:
             will reload the template.  For higher performance it's possible to
             disable that.
 
+        `auto_reload_interval`
+            With ``auto_reload`` enabled, check if a cached template's source
+            changed at most once every this many seconds instead of every
+            time it is requested. For the :class:`FileSystemLoader` each check
+            is a ``stat`` call per template, including every included and
+            imported template. The default ``0`` checks every time.
+
+            .. versionadded:: 3.1.5
+
+        `cache_loop_lookups`
+            If set to ``True``, attribute lookups inside a ``for`` loop,
+            such as ``config.site.name``, are evaluated once the first
+            time they are reached and the value is reused for the rest
+            of the loop. This only applies to lookups that start from a
+            name the loop body doesn't assign and doesn't call a method
+            on. Only enable this if the objects looked up don't change
+            while the loop renders. Changes made by functions, filters,
+            tests, or properties are not detected, so a lookup whose
+            value changes between iterations keeps its first value.
+            The default is ``False``.
+
+            .. versionadded:: 3.1.5
+
         `bytecode_cache`
             If set to a bytecode cache object, this object will provide a
             cache for the internal Jinja bytecode so that templates don't
@@ -291,6 +340,10 @@ class Environment:
 
     template_class: t.Type["Template"]
 
+    #: The :class:`~jinja2.runtime.RenderProfiler` recording render
+    #: times, set by :meth:`enable_profiling`.
+    profiler: t.Optional[RenderProfiler] = None
+
     def __init__(
         self,
         block_start_string: str = BLOCK_START_STRING,
@@ -315,6 +368,8 @@ class Environment:
         auto_reload: bool = True,
         bytecode_cache: t.Optional["BytecodeCache"] = None,
         enable_async: bool = False,
+        auto_reload_interval: float = 0,
+        cache_loop_lookups: bool = False,
     ):
         # !!Important notice!!
         #   The constructor accepts quite a few arguments that should be
@@ -344,6 +399,7 @@ class Environment:
         # runtime information
         self.undefined: t.Type[Undefined] = undefined
         self.optimized = optimized
+        self.cache_loop_lookups = cache_loop_lookups
         self.finalize = finalize
         self.autoescape = autoescape
 
@@ -357,6 +413,7 @@ class Environment:
         self.cache = create_cache(cache_size)
         self.bytecode_cache = bytecode_cache
         self.auto_reload = auto_reload
+        self.auto_reload_interval = auto_reload_interval
 
         # configurable policies
         self.policies = DEFAULT_POLICIES.copy()
@@ -407,6 +464,8 @@ class Environment:
         auto_reload: bool = missing,
         bytecode_cache: t.Optional["BytecodeCache"] = missing,
         enable_async: bool = False,
+        auto_reload_interval: float = missing,
+        cache_loop_lookups: bool = missing,
     ) -> "Environment":
         """Create a new overlay environment that shares all the data with the
         current environment except for cache and the overridden attributes.
@@ -419,6 +478,10 @@ class Environment:
         copied over so modifications on the original environment may not shine
         through.
 
+        .. versionchanged:: 3.1.5
+            Added the ``auto_reload_interval`` and ``cache_loop_lookups``
+            parameters.
+
         .. versionchanged:: 3.1.2
             Added the ``newline_sequence``,, ``keep_trailing_newline``,
             and ``enable_async`` parameters to match ``__init__``.
@@ -460,6 +523,44 @@ class Environment:
         """Iterates over the extensions by priority."""
         return iter(sorted(self.extensions.values(), key=lambda x: x.priority))
 
+    def enable_profiling(
+        self, profiler: t.Optional[RenderProfiler] = None
+    ) -> RenderProfiler:
+        """Record the wall time and output size of every template, block,
+        and macro rendered from now on, and return the
+        :class:`~jinja2.runtime.RenderProfiler` with the stats.
+
+        Templates loaded before this are discarded from the cache so
+        they are loaded again with profiling. Template objects that
+        were already created, such as with :meth:`from_string`, are not
+        profiled.
+
+        :param profiler: Record to this profiler instead of a new one,
+            for example to aggregate multiple environments.
+
+        .. versionadded:: 3.1.5
+        """
+        if profiler is None:
+            profiler = RenderProfiler()
+
+        self.profiler = profiler
+
+        if self.cache is not None:
+            self.cache.clear()
+
+        return profiler
+
+    def disable_profiling(self) -> None:
+        """Stop recording render times and discard the cached templates
+        that were loaded with profiling.
+
+        .. versionadded:: 3.1.5
+        """
+        self.profiler = None
+
+        if self.cache is not None:
+            self.cache.clear()
+
     def getitem(
         self, obj: t.Any, argument: t.Union[str, t.Any]
     ) -> t.Union[t.Any, Undefined]:
@@ -836,6 +937,12 @@ class Environment:
         syntax errors to abort the compilation you can set `ignore_errors`
         to `False` and you will get an exception on syntax errors.
 
+        Each compiled module stores the checksum of its source, which
+        :class:`ModuleLoader` can check with a ``source_loader``.
+
+        .. versionchanged:: 3.1.5
+            Compiled modules store a ``source_checksum``.
+
         .. versionadded:: 2.4
         """
         from .loaders import ModuleLoader
@@ -884,8 +991,9 @@ class Environment:
                     continue
 
                 filename = ModuleLoader.get_module_filename(name)
+                checksum = ModuleLoader.get_source_checksum(source)
 
-                write_file(filename, code)
+                write_file(filename, f"{code}\nsource_checksum = {checksum!r}\n")
                 log_function(f'Compiled "{name}" as {filename}')
         finally:
             if zip:
@@ -960,7 +1068,7 @@ class Environment:
         if self.cache is not None:
             template = self.cache.get(cache_key)
             if template is not None and (
-                not self.auto_reload or template.is_up_to_date
+                not self.auto_reload or self._is_up_to_date(template)
             ):
                 # template.globals is a ChainMap, modifying it will only
                 # affect the template, not the environment globals.
@@ -972,9 +1080,30 @@ class Environment:
         template = self.loader.load(self, name, self.make_globals(globals))
 
         if self.cache is not None:
+            template._last_checked = time.monotonic()
             self.cache[cache_key] = template
         return template
 
+    def _is_up_to_date(self, template: "Template") -> bool:
+        """Check if a cached template is up to date, at most once every
+        :attr:`auto_reload_interval` seconds.
+        """
+        interval = self.auto_reload_interval
+
+        if interval <= 0:
+            return template.is_up_to_date
+
+        now = time.monotonic()
+
+        if now - template._last_checked < interval:
+            return True
+
+        if template.is_up_to_date:
+            template._last_checked = now
+            return True
+
+        return False
+
     @internalcode
     def get_template(
         self,
@@ -1160,6 +1289,7 @@ class Template:
     _module: t.Optional["TemplateModule"]
     _debug_info: str
     _uptodate: t.Optional[t.Callable[[], bool]]
+    _last_checked: float
 
     def __new__(
         cls,
@@ -1259,9 +1389,19 @@ class Template:
         t.root_render_func = namespace["root"]
         t._module = None
 
+        if environment.profiler is not None:
+            t.root_render_func = profile_render_func(
+                environment, "template", t.name, None, t.root_render_func
+            )
+            t.blocks = {
+                name: profile_render_func(environment, "block", t.name, name, func)
+                for name, func in t.blocks.items()
+            }
+
         # debug and loader helpers
         t._debug_info = namespace["debug_info"]
         t._uptodate = None
+        t._last_checked = 0.0
 
         # store the reference
         namespace["environment"] = environment
@@ -1311,13 +1451,20 @@ class Template:
         Example usage::
 
             await template.render_async(knights='that say nih; asynchronously')
+
+        Awaitable values in the context, like coroutines for data that
+        the template needs, are awaited at the same time before
+        rendering.
+
+        .. versionchanged:: 3.1.5
+            Awaitable context values are awaited concurrently.
         """
         if not self.environment.is_async:
             raise RuntimeError(
                 "The environment was not created with async mode enabled."
             )
 
-        ctx = self.new_context(dict(*args, **kwargs))
+        ctx = self.new_context(await gather_awaitables(dict(*args, **kwargs)))
 
         try:
             return self.environment.concat(  # type: ignore
@@ -1361,13 +1508,16 @@ class Template:
     ) -> t.AsyncIterator[str]:
         """An async version of :meth:`generate`.  Works very similarly but
         returns an async iterator instead.
+
+        .. versionchanged:: 3.1.5
+            Awaitable context values are awaited concurrently.
         """
         if not self.environment.is_async:
             raise RuntimeError(
                 "The environment was not created with async mode enabled."
             )
 
-        ctx = self.new_context(dict(*args, **kwargs))
+        ctx = self.new_context(await gather_awaitables(dict(*args, **kwargs)))
 
         try:
             async for event in self.root_render_func(ctx):  # type: ignore
@@ -1585,6 +1735,13 @@ class TemplateStream:
     If buffering is enabled with a buffer size of 5, five items are combined
     into a new string.  This is mainly useful if you are streaming
     big templates to a client via WSGI which flushes after each iteration.
+    Buffering can also be based on the encoded size of the output with
+    :meth:`enable_byte_buffering`. Either way, the buffer is yielded
+    early at a ``{% flush %}`` tag, see :class:`~jinja2.ext.FlushExtension`.
+
+    .. versionchanged:: 3.1.5
+        Added :meth:`enable_byte_buffering` and support for
+        ``{% flush %}``.
     """
 
     def __init__(self, gen: t.Iterator[str]) -> None:
@@ -1645,6 +1802,13 @@ class TemplateStream:
             try:
                 while c_size < size:
                     c = next(self._gen)
+
+                    if c is flush_marker:
+                        if c_size:
+                            break
+
+                        continue
+
                     push(c)
                     if c:
                         c_size += 1
@@ -1663,6 +1827,50 @@ class TemplateStream:
         self.buffered = True
         self._next = partial(next, self._buffered_generator(size))
 
+    def _byte_buffered_generator(self, size: int, encoding: str) -> t.Iterator[str]:
+        buf: t.List[str] = []
+        b_size = 0
+        push = buf.append
+
+        for c in self._gen:
+            if c is flush_marker:
+                if b_size:
+                    yield concat(buf)
+                    del buf[:]
+                    b_size = 0
+
+                continue
+
+            if not c:
+                continue
+
+            push(c)
+            # ASCII is one byte per character in every encoding this is
+            # useful for, and checking for it doesn't scan the string.
+            b_size += len(c) if c.isascii() else len(c.encode(encoding, "replace"))
+
+            if b_size >= size:
+                yield concat(buf)
+                del buf[:]
+                b_size = 0
+
+        if b_size:
+            yield concat(buf)
+
+    def enable_byte_buffering(self, size: int = 8192, encoding: str = "utf-8") -> None:
+        """Enable buffering by size. Output is buffered until it is at
+        least `size` bytes when encoded with `encoding`, or until a
+        ``{% flush %}`` tag, so that a WSGI server writes fewer, larger
+        chunks.
+
+        .. versionadded:: 3.1.5
+        """
+        if size < 1:
+            raise ValueError("buffer size too small")
+
+        self.buffered = True
+        self._next = partial(next, self._byte_buffered_generator(size, encoding))
+
     def __iter__(self) -> "TemplateStream":
         return self
 
@@ -612,6 +612,62 @@ class LoopControlExtension(Extension):
         return nodes.Continue(lineno=token.lineno)
 
 
+class ConcurrentExtension(Extension):
+    """Adds a ``{% concurrent %}`` block. In async mode, the includes
+    in the block are rendered at the same time, and their output is
+    placed in order. This is useful when each included template waits
+    for its own data, so the page waits for the slowest one instead of
+    all of them in turn. In sync mode, the block renders as usual.
+
+    .. code-block:: html+jinja
+
+        {% concurrent %}
+          {% include "projects.html" %}
+          {% include "messages.html" %}
+        {% endconcurrent %}
+
+    Only includes and template data are allowed in the block, so that
+    the includes can't depend on each other.
+
+    .. versionadded:: 3.1.5
+    """
+
+    tags = {"concurrent"}
+
+    def parse(self, parser: "Parser") -> nodes.Concurrent:
+        lineno = next(parser.stream).lineno
+        body = parser.parse_statements(("name:endconcurrent",), drop_needle=True)
+
+        for node in body:
+            if not isinstance(node, (nodes.Include, nodes.Output)):
+                parser.fail(
+                    "Only includes are allowed in a concurrent block.", node.lineno
+                )
+
+        return nodes.Concurrent(body, lineno=lineno)
+
+
+class FlushExtension(Extension):
+    """Adds a ``{% flush %}`` tag. When the template is streamed with
+    buffering enabled, the stream yields what it has buffered so far, so
+    that a client can start on the first part of a page while the rest
+    renders.
+
+    .. code-block:: html+jinja
+
+        <head>...</head>
+        {% flush %}
+        <body>...</body>
+
+    .. versionadded:: 3.1.5
+    """
+
+    tags = {"flush"}
+
+    def parse(self, parser: "Parser") -> nodes.Flush:
+        return nodes.Flush(lineno=next(parser.stream).lineno)
+
+
 class DebugExtension(Extension):
     """A ``{% debug %}`` tag that dumps the available variables,
     filters, and tests.
@@ -867,4 +923,6 @@ def babel_extract(
 i18n = InternationalizationExtension
 do = ExprStmtExtension
 loopcontrols = LoopControlExtension
+flush = FlushExtension
+concurrent = ConcurrentExtension
 debug = DebugExtension
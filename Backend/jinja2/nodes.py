@@ -764,11 +764,17 @@ class _FilterTestCommon(Expr):
         if func is None or pass_arg is _PassArg.context:
             raise Impossible()
 
-        if eval_ctx.environment.is_async and (
-            getattr(func, "jinja_async_variant", False) is True
-            or inspect.iscoroutinefunction(func)
-        ):
-            raise Impossible()
+        if eval_ctx.environment.is_async:
+            if getattr(func, "jinja_async_variant", False) is True:
+                # Constant arguments can't be async iterables, so the
+                # sync variant gives the same result.
+                func = func.__wrapped__
+                pass_arg = _PassArg.from_obj(func)  # type: ignore
+
+                if pass_arg is _PassArg.context:
+                    raise Impossible()
+            elif inspect.iscoroutinefunction(func):
+                raise Impossible()
 
         args, kwargs = args_as_const(self, eval_ctx)
         args.insert(0, self.node.as_const(eval_ctx))
@@ -1148,6 +1154,25 @@ class Break(Stmt):
     """Break a loop."""
 
 
+class Concurrent(Stmt):
+    """Render each node in the body at the same time in async mode and
+    output the results in order. The body only contains
+    :class:`Include` and :class:`Output` nodes.
+
+    .. versionadded:: 3.1.5
+    """
+
+    fields = ("body",)
+    body: t.List[Node]
+
+
+class Flush(Stmt):
+    """Flush the buffer of a template stream.
+
+    .. versionadded:: 3.1.5
+    """
+
+
 class Scope(Stmt):
     """An artificial scope."""
 
@@ -36,13 +36,43 @@ def escape(s: t.Any, /) -> Markup:
     # conversion. This is the most common use case.
     # Use type(s) instead of s.__class__ because a proxy object may be reporting
     # the __class__ of the proxied value.
+    # The escaped text is a plain string, so create the Markup with
+    # str.__new__ to skip the __html__ check in Markup.__new__.
     if type(s) is str:
-        return Markup(_escape_inner(s))
+        return str.__new__(Markup, _escape_inner(s))
 
     if hasattr(s, "__html__"):
         return Markup(s.__html__())
 
-    return Markup(_escape_inner(str(s)))
+    return str.__new__(Markup, _escape_inner(str(s)))
+
+
+def escape_many(values: cabc.Iterable[t.Any], /) -> list[Markup]:
+    """Escape each value in an iterable like :func:`escape`, and return
+    a list of :class:`Markup` strings. This is faster than calling
+    :func:`escape` for each value.
+
+    >>> escape_many(["<em>", Markup("<em>"), 42])
+    [Markup('&lt;em&gt;'), Markup('<em>'), Markup('42')]
+
+    :param values: Objects to be converted to strings and escaped.
+    """
+    return [str.__new__(Markup, s) for s in _escape_strs(values)]
+
+
+def _escape_strs(values: cabc.Iterable[t.Any], /) -> list[str]:
+    """Escape each value like :func:`escape`, but return a list of plain
+    strings to avoid creating a :class:`Markup` for each value when
+    they will be joined anyway.
+    """
+    return [
+        _escape_inner(s)
+        if type(s) is str
+        else s.__html__()
+        if hasattr(s, "__html__")
+        else _escape_inner(str(s))
+        for s in values
+    ]
 
 
 def escape_silent(s: t.Any | None, /) -> Markup:
@@ -135,12 +165,19 @@ class Markup(str):
 
     def __add__(self, value: str | _HasHTML, /) -> te.Self:
         if isinstance(value, str) or hasattr(value, "__html__"):
+            if type(self).escape.__func__ is Markup.escape.__func__:  # type: ignore[attr-defined]
+                # Add the escaped text without creating a Markup for it.
+                return self.__class__(super().__add__(_escape_strs((value,))[0]))
+
             return self.__class__(super().__add__(self.escape(value)))
 
         return NotImplemented
 
     def __radd__(self, value: str | _HasHTML, /) -> te.Self:
         if isinstance(value, str) or hasattr(value, "__html__"):
+            if type(self).escape.__func__ is Markup.escape.__func__:  # type: ignore[attr-defined]
+                return self.__class__(str.__add__(_escape_strs((value,))[0], self))
+
             return self.escape(value).__add__(self)
 
         return NotImplemented
@@ -168,6 +205,9 @@ class Markup(str):
         return f"{self.__class__.__name__}({super().__repr__()})"
 
     def join(self, iterable: cabc.Iterable[str | _HasHTML], /) -> te.Self:
+        if type(self).escape.__func__ is Markup.escape.__func__:  # type: ignore[attr-defined]
+            return self.__class__(super().join(_escape_strs(iterable)))
+
         return self.__class__(super().join(map(self.escape, iterable)))
 
     def split(  # type: ignore[override]
@@ -329,6 +369,86 @@ class Markup(str):
         return self
 
 
+class MarkupBuilder:
+    """Build a :class:`Markup` string from many parts. Text is escaped
+    and objects with an ``__html__`` method are marked safe, like
+    :meth:`Markup.join`, but the parts are kept as plain strings and
+    the text is only escaped when :meth:`build` is called. This avoids
+    creating a :class:`Markup` for each escaped part and for each
+    intermediate result, as adding parts with ``+`` would.
+
+    >>> builder = MarkupBuilder()
+    >>> builder.append_safe("<li>")
+    >>> builder.append("Tom & Jerry")
+    >>> builder.append(Markup("<em>new</em>"))
+    >>> builder.append_safe("</li>")
+    >>> builder.build()
+    Markup('<li>Tom &amp; Jerry<em>new</em></li>')
+
+    :param values: Parts to :meth:`extend` the builder with.
+    """
+
+    __slots__ = ("_parts", "_unsafe")
+
+    def __init__(self, values: cabc.Iterable[t.Any] = (), /) -> None:
+        self._parts: list[str] = []
+        # The indexes of the parts that still need to be escaped.
+        self._unsafe: list[int] = []
+
+        if values:
+            self.extend(values)
+
+    def __len__(self, /) -> int:
+        return len(self._parts)
+
+    def append(self, value: t.Any, /) -> None:
+        """Add a part. It is escaped unless it has an ``__html__``
+        method, and objects are converted to strings.
+        """
+        if type(value) is str:
+            self._unsafe.append(len(self._parts))
+            self._parts.append(value)
+        elif hasattr(value, "__html__"):
+            self._parts.append(value.__html__())
+        else:
+            self._unsafe.append(len(self._parts))
+            self._parts.append(str(value))
+
+    def append_safe(self, value: str, /) -> None:
+        """Add a part that is known to be safe without escaping it, like
+        :class:`Markup` does.
+        """
+        self._parts.append(value)
+
+    def extend(self, values: cabc.Iterable[t.Any], /) -> None:
+        """Add each part in an iterable with :meth:`append`."""
+        parts = self._parts
+        unsafe = self._unsafe
+
+        for value in values:
+            if type(value) is str:
+                unsafe.append(len(parts))
+                parts.append(value)
+            elif hasattr(value, "__html__"):
+                parts.append(value.__html__())
+            else:
+                unsafe.append(len(parts))
+                parts.append(str(value))
+
+    def build(self, /) -> Markup:
+        """Escape the parts that need it and join all the parts into one
+        :class:`Markup` string. The builder can be added to and built
+        again afterwards.
+        """
+        parts = self._parts
+
+        for i in self._unsafe:
+            parts[i] = _escape_inner(parts[i])
+
+        self._unsafe.clear()
+        return str.__new__(Markup, "".join(parts))
+
+
 class EscapeFormatter(string.Formatter):
     __slots__ = ("escape",)
 
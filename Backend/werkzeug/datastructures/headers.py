@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import typing as t
+from functools import lru_cache
 
 from .._internal import _missing
 from ..exceptions import BadRequestKeyError
@@ -464,6 +465,43 @@ def _str_header_value(value: t.Any) -> str:
     return value
 
 
+# Translations between header names and WSGI environ keys. Header names
+# repeat across requests, so they are translated once per process instead
+# of on every lookup and iteration. The names come from clients, so the
+# caches are LRU and junk names are evicted by the names in regular use.
+@lru_cache(maxsize=512)
+def _environ_key(key: str) -> str:
+    """Translate a header name like ``Foo-Bar`` to its WSGI environ key
+    ``HTTP_FOO_BAR``.
+    """
+    rv = key.upper().replace("-", "_")
+
+    if rv not in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
+        rv = f"HTTP_{rv}"
+
+    return rv
+
+
+@lru_cache(maxsize=512)
+def _header_name(key: str) -> str | None:
+    """Translate a WSGI environ key like ``HTTP_FOO_BAR`` to its header
+    name ``Foo-Bar``. Returns ``None`` if the key is not a header.
+    """
+    rv: str | None
+
+    if key.startswith("HTTP_") and key not in {
+        "HTTP_CONTENT_TYPE",
+        "HTTP_CONTENT_LENGTH",
+    }:
+        rv = key[5:].replace("_", "-").title()
+    elif key in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
+        rv = key.replace("_", "-").title()
+    else:
+        rv = None
+
+    return rv
+
+
 class EnvironHeaders(ImmutableHeadersMixin, Headers):
     """Read only version of the headers from a WSGI environment.  This
     provides the same interface as `Headers` and is constructed from
@@ -472,6 +510,10 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):
     subclass of the :exc:`~exceptions.BadRequest` HTTP exception and will
     render a page for a ``400 BAD REQUEST`` if caught in a catch-all for
     HTTP exceptions.
+
+    .. versionchanged:: 3.0.7
+        Translations between header names and environ keys are cached,
+        so repeated lookups and iteration don't rebuild the names.
     """
 
     def __init__(self, environ):
@@ -487,25 +529,37 @@ class EnvironHeaders(ImmutableHeadersMixin, Headers):
         # used because get() calls it.
         if not isinstance(key, str):
             raise KeyError(key)
-        key = key.upper().replace("-", "_")
-        if key in {"CONTENT_TYPE", "CONTENT_LENGTH"}:
-            return self.environ[key]
-        return self.environ[f"HTTP_{key}"]
+        return self.environ[_environ_key(key)]
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return False
+        return _environ_key(key) in self.environ
 
     def __len__(self):
-        # the iter is necessary because otherwise list calls our
-        # len which would call list again and so forth.
-        return len(list(iter(self)))
+        # Count without building the pairs, iterating would translate
+        # every key and allocate a tuple for each.
+        count = 0
+
+        for key, value in self.environ.items():
+            name = _header_name(key)
+
+            if name is not None and (value or key[0] == "H"):
+                count += 1
+
+        return count
 
     def __iter__(self):
         for key, value in self.environ.items():
-            if key.startswith("HTTP_") and key not in {
-                "HTTP_CONTENT_TYPE",
-                "HTTP_CONTENT_LENGTH",
-            }:
-                yield key[5:].replace("_", "-").title(), value
-            elif key in {"CONTENT_TYPE", "CONTENT_LENGTH"} and value:
-                yield key.replace("_", "-").title(), value
+            name = _header_name(key)
+
+            if name is None:
+                continue
+
+            # CONTENT_TYPE and CONTENT_LENGTH are set to empty strings by
+            # some servers when the client didn't send them.
+            if value or key[0] == "H":
+                yield name, value
 
     def copy(self):
         raise TypeError(f"cannot create {type(self).__name__!r} copies")
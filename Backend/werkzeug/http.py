@@ -10,6 +10,7 @@ from datetime import time
 from datetime import timedelta
 from datetime import timezone
 from enum import Enum
+from functools import lru_cache
 from hashlib import sha1
 from time import mktime
 from time import struct_time
@@ -1223,6 +1224,29 @@ _cookie_slash_map.update(
 )
 
 
+@lru_cache(maxsize=64)
+def _cookie_path(path: str) -> str:
+    # safe = https://url.spec.whatwg.org/#url-path-segment-string
+    # as well as percent for things that are already quoted
+    # excluding semicolon since it's part of the header syntax
+    return quote(path, safe="%!$&'()*+,/:=@")
+
+
+@lru_cache(maxsize=64)
+def _cookie_domain(domain: str) -> str:
+    return domain.partition(":")[0].lstrip(".").encode("idna").decode("ascii")
+
+
+@lru_cache(maxsize=8)
+def _cookie_samesite(samesite: str) -> str:
+    samesite = samesite.title()
+
+    if samesite not in {"Strict", "Lax", "None"}:
+        raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
+
+    return samesite
+
+
 def dump_cookie(
     key: str,
     value: str = "",
@@ -1274,6 +1298,10 @@ def dump_cookie(
 
     .. _`cookie`: http://browsercookielimits.squawky.net/
 
+    .. versionchanged:: 3.0.7
+        The normalized ``path``, ``domain``, and ``samesite`` values are
+        cached.
+
     .. versionchanged:: 3.0
         Passing bytes, and the ``charset`` parameter, were removed.
 
@@ -1293,14 +1321,13 @@ def dump_cookie(
     .. versionchanged:: 1.0.0
         The string ``'None'`` is accepted for ``samesite``.
     """
+    # An app sets cookies with the same few paths, domains, and SameSite
+    # values, so their normalized forms are cached.
     if path is not None:
-        # safe = https://url.spec.whatwg.org/#url-path-segment-string
-        # as well as percent for things that are already quoted
-        # excluding semicolon since it's part of the header syntax
-        path = quote(path, safe="%!$&'()*+,/:=@")
+        path = _cookie_path(path)
 
     if domain:
-        domain = domain.partition(":")[0].lstrip(".").encode("idna").decode("ascii")
+        domain = _cookie_domain(domain)
 
     if isinstance(max_age, timedelta):
         max_age = int(max_age.total_seconds())
@@ -1312,10 +1339,7 @@ def dump_cookie(
         expires = http_date(datetime.now(tz=timezone.utc).timestamp() + max_age)
 
     if samesite is not None:
-        samesite = samesite.title()
-
-        if samesite not in {"Strict", "Lax", "None"}:
-            raise ValueError("SameSite must be 'Strict', 'Lax', or 'None'.")
+        samesite = _cookie_samesite(samesite)
 
     # Quote value if it contains characters not allowed by RFC 6265. Slash-escape with
     # three octal digits, which matches http.cookies, although the RFC suggests base64.
@@ -1328,7 +1352,10 @@ def dump_cookie(
 
     # Send a non-ASCII key as mojibake. Everything else should already be ASCII.
     # TODO Remove encoding dance, it seems like clients accept UTF-8 keys
-    buf = [f"{key.encode().decode('latin1')}={value}"]
+    if not key.isascii():
+        key = key.encode().decode("latin1")
+
+    buf = [f"{key}={value}"]
 
     for k, v in (
         ("Domain", domain),
@@ -135,6 +135,10 @@ def parse_cookie(
     :param cls: A dict-like class to store the parsed cookies in.
         Defaults to :class:`MultiDict`.
 
+    .. versionchanged:: 3.0.7
+        Headers without quoted values are split without the regex, and
+        quoted values are only decoded if they contain escapes.
+
     .. versionchanged:: 3.0
         Passing bytes, and the ``charset`` and ``errors`` parameters, were removed.
 
@@ -146,9 +150,23 @@ def parse_cookie(
     if not cookie:
         return cls()
 
-    cookie = f"{cookie};"
     out = []
 
+    if '"' not in cookie:
+        # Fast path for the common case where no value is quoted. Without
+        # quotes a semicolon always ends a pair, so plain string splitting
+        # gives the same result as the regex.
+        for item in cookie.split(";"):
+            ck, _, cv = item.partition("=")
+            ck = ck.strip()
+
+            if ck:
+                out.append((ck, cv.strip()))
+
+        return cls(out)
+
+    cookie = f"{cookie};"
+
     for ck, cv in _cookie_re.findall(cookie):
         ck = ck.strip()
         cv = cv.strip()
@@ -157,10 +175,15 @@ def parse_cookie(
             continue
 
         if len(cv) >= 2 and cv[0] == cv[-1] == '"':
-            # Work with bytes here, since a UTF-8 character could be multiple bytes.
-            cv = _cookie_unslash_re.sub(
-                _cookie_unslash_replace, cv[1:-1].encode()
-            ).decode(errors="replace")
+            cv = cv[1:-1]
+
+            # Only values with escapes need to be decoded.
+            if "\\" in cv:
+                # Work with bytes here, since a UTF-8 character could be multiple
+                # bytes.
+                cv = _cookie_unslash_re.sub(
+                    _cookie_unslash_replace, cv.encode()
+                ).decode(errors="replace")
 
         out.append((ck, cv))
 
@@ -16,20 +16,28 @@ from __future__ import annotations
 
 import errno
 import io
+import json
+import logging
 import os
+import queue
+import random
 import selectors
 import socket
 import socketserver
 import sys
+import time
 import typing as t
 from datetime import datetime as dt
 from datetime import timedelta
 from datetime import timezone
 from http.server import BaseHTTPRequestHandler
 from http.server import HTTPServer
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from urllib.parse import unquote
 from urllib.parse import urlsplit
 
+from ._internal import _get_logger
 from ._internal import _log
 from ._internal import _wsgi_encoding_dance
 from .exceptions import InternalServerError
@@ -438,32 +446,21 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
     _control_char_table[ord("\\")] = r"\\"
 
     def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
-        try:
-            path = uri_to_iri(self.path)
-            msg = f"{self.command} {path} {self.request_version}"
-        except AttributeError:
-            # path isn't set if the requestline was bad
-            msg = self.requestline
+        request_log = getattr(self.server, "request_log", None)
 
-        # Escape control characters that may be in the decoded path.
-        msg = msg.translate(self._control_char_table)
-        code = str(code)
-
-        if code[0] == "1":  # 1xx - Informational
-            msg = _ansi_style(msg, "bold")
-        elif code == "200":  # 2xx - Success
-            pass
-        elif code == "304":  # 304 - Resource Not Modified
-            msg = _ansi_style(msg, "cyan")
-        elif code[0] == "3":  # 3xx - Redirection
-            msg = _ansi_style(msg, "green")
-        elif code == "404":  # 404 - Resource Not Found
-            msg = _ansi_style(msg, "yellow")
-        elif code[0] == "4":  # 4xx - Client Error
-            msg = _ansi_style(msg, "bold", "red")
-        else:  # 5xx, or any other response
-            msg = _ansi_style(msg, "bold", "magenta")
+        if request_log is not None:
+            # Formatting and writing happen on the log's thread.
+            request_log.log_request(self, code, size)
+            return
 
+        code = str(code)
+        msg = _style_request_line(
+            getattr(self, "command", None),
+            getattr(self, "path", None),
+            self.request_version,
+            self.requestline,
+            code,
+        )
         self.log("info", '"%s" %s %s', msg, code, size)
 
     def log_error(self, format: str, *args: t.Any) -> None:
@@ -482,6 +479,46 @@ class WSGIRequestHandler(BaseHTTPRequestHandler):
         )
 
 
+def _request_line(
+    command: str | None, path: str | None, request_version: str, requestline: str
+) -> str:
+    if command is None or path is None:
+        # path isn't set if the requestline was bad
+        msg = requestline
+    else:
+        msg = f"{command} {uri_to_iri(path)} {request_version}"
+
+    # Escape control characters that may be in the decoded path.
+    return msg.translate(WSGIRequestHandler._control_char_table)
+
+
+def _style_request_line(
+    command: str | None,
+    path: str | None,
+    request_version: str,
+    requestline: str,
+    code: str,
+) -> str:
+    msg = _request_line(command, path, request_version, requestline)
+
+    if code[0] == "1":  # 1xx - Informational
+        msg = _ansi_style(msg, "bold")
+    elif code == "200":  # 2xx - Success
+        pass
+    elif code == "304":  # 304 - Resource Not Modified
+        msg = _ansi_style(msg, "cyan")
+    elif code[0] == "3":  # 3xx - Redirection
+        msg = _ansi_style(msg, "green")
+    elif code == "404":  # 404 - Resource Not Found
+        msg = _ansi_style(msg, "yellow")
+    elif code[0] == "4":  # 4xx - Client Error
+        msg = _ansi_style(msg, "bold", "red")
+    else:  # 5xx, or any other response
+        msg = _ansi_style(msg, "bold", "magenta")
+
+    return msg
+
+
 def _ansi_style(value: str, *styles: str) -> str:
     if not _log_add_style:
         return value
@@ -501,6 +538,193 @@ def _ansi_style(value: str, *styles: str) -> str:
     return f"{value}\x1b[0m"
 
 
+class QueuedRequestLog:
+    """Format and write request log lines on a background thread, so log
+    I/O doesn't add to request latency. Pass it to :func:`run_simple`, or
+    set it as the ``request_log`` attribute of a server from
+    :func:`make_server` and call :meth:`start`.
+
+    While the log is running, the ``werkzeug`` logger only has a
+    :class:`~logging.handlers.QueueHandler`. The handlers that were
+    handling its messages, including those of parent loggers, write
+    the lines from a :class:`~logging.handlers.QueueListener` thread.
+
+    .. code-block:: python
+
+        run_simple("localhost", 5000, app, request_log=QueuedRequestLog(json=True))
+
+    :param json: Write each request as a JSON object instead of the
+        styled text line.
+    :param sample_rate: The fraction of requests to log, between 0 and
+        1. Client and server errors are always logged.
+    :param maxsize: The maximum number of lines waiting to be written.
+        Lines for requests logged while the queue is full are dropped and
+        counted in :attr:`dropped`.
+
+    .. versionadded:: 3.0.7
+    """
+
+    def __init__(
+        self, json: bool = False, sample_rate: float = 1.0, maxsize: int = 10_000
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("'sample_rate' must be between 0 and 1.")
+
+        self.json = json
+        self.sample_rate = sample_rate
+        self.queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize)
+        #: The number of lines dropped because the queue was full.
+        self.dropped = 0
+        self._queue_handler = QueueHandler(self.queue)
+        self._logger: logging.Logger | None = None
+        self._listener: QueueListener | None = None
+        self._saved: tuple[list[logging.Handler], bool] | None = None
+
+    def start(self) -> None:
+        """Route the ``werkzeug`` logger through the queue and start the
+        thread that writes the lines.
+        """
+        if self._listener is not None:
+            return
+
+        self._logger = logger = _get_logger()
+        handlers: list[logging.Handler] = []
+        current: logging.Logger | None = logger
+
+        # Collect the handlers that would have handled the logger's
+        # messages, the queue replaces all of them.
+        while current is not None:
+            handlers.extend(current.handlers)
+
+            if not current.propagate:
+                break
+
+            current = current.parent
+
+        self._saved = (logger.handlers[:], logger.propagate)
+        logger.handlers = [self._queue_handler]
+        logger.propagate = False
+        self._listener = _RequestLogListener(
+            self, self.queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Write the lines still in the queue, stop the thread, and
+        restore the ``werkzeug`` logger's handlers.
+        """
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._listener = None
+
+        if self._saved is not None:
+            logger = _get_logger()
+            logger.handlers, logger.propagate = self._saved
+            self._saved = None
+
+    def log_request(
+        self, handler: WSGIRequestHandler, code: int | str, size: int | str
+    ) -> None:
+        """Queue a request to be logged. Only the raw values are
+        collected here, the line is built on the listener thread.
+        """
+        logger = self._logger
+
+        if logger is not None and not logger.isEnabledFor(logging.INFO):
+            return
+
+        code = str(code)
+
+        if (
+            self.sample_rate < 1.0
+            and code[0] not in {"4", "5"}
+            and random.random() >= self.sample_rate
+        ):
+            return
+
+        record = logging.LogRecord(
+            "werkzeug", logging.INFO, __file__, 0, "", None, None
+        )
+        record.werkzeug_request = (  # type: ignore[attr-defined]
+            handler.address_string(),
+            getattr(handler, "command", None),
+            getattr(handler, "path", None),
+            handler.request_version,
+            handler.requestline,
+            code,
+            size,
+        )
+
+        if self._listener is None:
+            # Not started, write the line directly.
+            _log("info", self.format(record))
+            return
+
+        try:
+            self._queue_handler.enqueue(record)
+        except queue.Full:
+            # Requests are logged from many handler threads.
+            with self.queue.mutex:
+                self.dropped += 1
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Build the log line for a queued request record."""
+        address, command, path, version, requestline, code, size = (
+            record.werkzeug_request  # type: ignore[attr-defined]
+        )
+
+        if self.json:
+            return json.dumps(
+                {
+                    "time": dt.fromtimestamp(record.created, timezone.utc).isoformat(),
+                    "remote_addr": address,
+                    "method": command,
+                    "path": None if path is None else uri_to_iri(path),
+                    "protocol": version,
+                    "request_line": _request_line(
+                        command, path, version, requestline
+                    ),
+                    "status": int(code) if code.isdigit() else code,
+                    "size": int(size) if str(size).isdigit() else size,
+                }
+            )
+
+        msg = _style_request_line(command, path, version, requestline, code)
+        now = time.localtime(record.created)
+        date = (
+            f"{now.tm_mday:02d}/{BaseHTTPRequestHandler.monthname[now.tm_mon]}"
+            f"/{now.tm_year:04d} {now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        )
+        return f'{address} - - [{date}] "{msg}" {code} {size}'
+
+
+class _RequestLogListener(QueueListener):
+    """Build request log lines on the listener thread before passing the
+    records to the handlers.
+    """
+
+    def __init__(
+        self,
+        request_log: QueuedRequestLog,
+        queue: queue.Queue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(
+            queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.request_log = request_log
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if hasattr(record, "werkzeug_request"):
+            record.msg = self.request_log.format(record)
+            record.args = None
+
+        return record
+
+
 def generate_adhoc_ssl_pair(
     cn: str | None = None,
 ) -> tuple[Certificate, RSAPrivateKeyWithSerialization]:
@@ -707,6 +931,9 @@ class BaseWSGIServer(HTTPServer):
     multiprocess = False
     request_queue_size = LISTEN_QUEUE
     allow_reuse_address = True
+    #: Write request log lines on a background thread instead of
+    #: the request thread.
+    request_log: QueuedRequestLog | None = None
 
     def __init__(
         self,
@@ -974,6 +1201,7 @@ def run_simple(
     static_files: dict[str, str | tuple[str, str]] | None = None,
     passthrough_errors: bool = False,
     ssl_context: _TSSLContextArg | None = None,
+    request_log: QueuedRequestLog | None = None,
 ) -> None:
     """Start a development server for a WSGI application. Various
     optional features can be enabled.
@@ -1027,6 +1255,12 @@ def run_simple(
         :class:`ssl.SSLContext` object, a ``(cert_file, key_file)``
         tuple to create a typical context, or the string ``'adhoc'`` to
         generate a temporary self-signed certificate.
+    :param request_log: A :class:`QueuedRequestLog` that writes the
+        request log lines on a background thread, optionally as JSON
+        and sampled.
+
+    .. versionchanged:: 3.0.7
+        Added the ``request_log`` parameter.
 
     .. versionchanged:: 2.1
         Instructions are shown for dealing with an "address already in
@@ -1108,18 +1342,26 @@ def run_simple(
         srv.log_startup()
         _log("info", _ansi_style("Press CTRL+C to quit", "yellow"))
 
-    if use_reloader:
-        from ._reloader import run_with_reloader
+    if request_log is not None:
+        srv.request_log = request_log
+        request_log.start()
 
-        try:
-            run_with_reloader(
-                srv.serve_forever,
-                extra_files=extra_files,
-                exclude_patterns=exclude_patterns,
-                interval=reloader_interval,
-                reloader_type=reloader_type,
-            )
-        finally:
-            srv.server_close()
-    else:
-        srv.serve_forever()
+    try:
+        if use_reloader:
+            from ._reloader import run_with_reloader
+
+            try:
+                run_with_reloader(
+                    srv.serve_forever,
+                    extra_files=extra_files,
+                    exclude_patterns=exclude_patterns,
+                    interval=reloader_interval,
+                    reloader_type=reloader_type,
+                )
+            finally:
+                srv.server_close()
+        else:
+            srv.serve_forever()
+    finally:
+        if request_log is not None:
+            request_log.stop()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import collections.abc as cabc
 import functools
 import json
+import re
 import typing as t
 from io import BytesIO
 
@@ -27,6 +28,55 @@ if t.TYPE_CHECKING:
     from _typeshed.wsgi import WSGIApplication
     from _typeshed.wsgi import WSGIEnvironment
 
+_json_special_re = re.compile(rb'["\[\]{}]')
+
+
+def _json_depth_exceeds(data: bytes, max_depth: int) -> bool:
+    """Check if the arrays and objects in a JSON document are nested
+    deeper than ``max_depth``, without parsing it. The data is scanned
+    once, skipping over strings, so the time is linear in its size.
+    """
+    # A document can't be nested deeper than its number of brackets.
+    if data.count(b"[") + data.count(b"{") <= max_depth:
+        return False
+
+    search = _json_special_re.search
+    find = data.find
+    depth = 0
+    pos = 0
+
+    while (m := search(data, pos)) is not None:
+        pos = m.start()
+        c = data[pos]
+
+        if c == 34:  # quote, skip to the end of the string
+            while True:
+                pos = find(b'"', pos + 1)
+
+                if pos == -1:
+                    return False
+
+                # The quote ends the string unless it is escaped by an
+                # odd number of backslashes.
+                start = pos - 1
+
+                while data[start] == 92:
+                    start -= 1
+
+                if (pos - 1 - start) % 2 == 0:
+                    break
+        elif c == 91 or c == 123:  # [ {
+            depth += 1
+
+            if depth > max_depth:
+                return True
+        else:  # ] }
+            depth -= 1
+
+        pos += 1
+
+    return False
+
 
 class Request(_SansIORequest):
     """Represents an incoming WSGI HTTP request, with headers and body
@@ -94,6 +144,14 @@ class Request(_SansIORequest):
     #: .. versionadded:: 2.2.3
     max_form_parts = 1000
 
+    #: The maximum depth that arrays and objects may be nested in JSON
+    #: data. When set, :meth:`get_json` fails for deeper data without
+    #: parsing it, as if the data was invalid. Without a limit, very
+    #: deeply nested data can exhaust the interpreter's recursion limit.
+    #:
+    #: .. versionadded:: 3.0.7
+    max_json_depth: int | None = None
+
     #: The form data parser that should be used.  Can be replaced to customize
     #: the form date parsing.
     form_data_parser_class: type[FormDataParser] = FormDataParser
@@ -581,12 +639,22 @@ class Request(_SansIORequest):
         its return value is used as the return value. By default this
         raises a 415 Unsupported Media Type resp.
 
+        The data is read from :attr:`stream`, so it is limited by
+        :attr:`max_content_length` while reading. If
+        :attr:`max_json_depth` is set, data that is nested too deeply
+        fails to parse.
+
         :param force: Ignore the mimetype and always try to parse JSON.
         :param silent: Silence mimetype and parsing errors, and
             return ``None`` instead.
         :param cache: Store the parsed JSON to return for subsequent
             calls.
 
+        .. versionchanged:: 3.0.7
+            Check :attr:`max_json_depth`, and fail to parse data that
+            exceeds the recursion limit instead of raising
+            ``RecursionError``.
+
         .. versionchanged:: 2.3
             Raise a 415 error instead of 400.
 
@@ -603,9 +671,18 @@ class Request(_SansIORequest):
                 return None
 
         data = self.get_data(cache=cache)
+        max_depth = self.max_json_depth
 
         try:
-            rv = self.json_module.loads(data)
+            if max_depth is not None and _json_depth_exceeds(data, max_depth):
+                raise ValueError(
+                    f"JSON data is nested deeper than the limit of {max_depth}."
+                )
+
+            try:
+                rv = self.json_module.loads(data)
+            except RecursionError:
+                raise ValueError("JSON data is nested too deeply to parse.") from None
         except ValueError as e:
             if silent:
                 rv = None
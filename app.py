@@ -7,6 +7,7 @@ from flask_cors import CORS
 from pymongo import MongoClient
 import pymongo
 from config import Config
+import bson_json
 from dotenv import load_dotenv
 from flask_pymongo import PyMongo
 from flask_mail import Mail, Message
@@ -25,7 +26,10 @@ load_dotenv()
 app = Flask(__name__)
 mail = Mail(app)
 app.config.from_object(Config)
+bson_json.init_app(app)
 app.config['WTF_CSRF_ENABLED'] = False
+# Reject JSON bodies nested deeper than this without parsing them
+app.config['MAX_JSON_DEPTH'] = 20
 
 
 mongo_uri = os.getenv('MONGO_URI')
@@ -92,7 +96,7 @@ def protected():
 # Route to add a test project
 
 # register to let user new entry
-@app.route('/register', methods=['POST'])
+@app.route('/register', methods=['POST'], max_content_length=4 * 1024)
 def register_user():
     data = request.get_json()
     email = data.get('email')
@@ -115,7 +119,7 @@ def register_user():
     return jsonify(message="User registered successfully"), 201
 
 
-@app.route('/signup', methods=['POST'])
+@app.route('/signup', methods=['POST'], max_content_length=4 * 1024)
 def signup():
     data = request.get_json()
     email = data.get('email')
@@ -140,7 +144,8 @@ def signup():
 
 # login
 
-@app.route('/login', methods=['POST'])
+@app.route('/login', methods=['POST'], stateless=True,
+           max_content_length=4 * 1024)
 def login():
     data = request.get_json()
 
@@ -180,17 +185,15 @@ def add_test_project():
 # GET route to fetch all projects
 
 
-@app.route('/projects', methods=['GET'])
+@app.route('/projects', methods=['GET'], stateless=True)
 def get_projects():
-    projects = list(projects_collection.find())
-    for project in projects:
-        project["_id"] = str(project["_id"])  # Convert ObjectId to string
-    return jsonify(projects)
+    # Stream the documents as JSON, ObjectId is converted to string
+    return bson_json.cursor_response(projects_collection)
 
 # POST route to handle contact messages name email and messages
 
 
-@app.route('/contact', methods=['POST'])
+@app.route('/contact', methods=['POST'], max_content_length=16 * 1024)
 def contact():
 
     data = request.get_json()
@@ -228,21 +231,18 @@ def contact():
 # GET route to fetch all messages
 
 
-@app.route('/messages', methods=['GET'])
+@app.route('/messages', methods=['GET'], stateless=True)
 def get_messages():
    # messages = Message.query.all()
     # message_list = [{"name": msg.name, "email": msg.email,
     #                "message": msg.message} for msg in messages]
     # return jsonify(message_list), 200
-    messages = list(messages_collection.find())
-    for message in messages:
-        message["_id"] = str(message["_id"])  # Convert ObjectId to string
-    return jsonify(messages)
+    return bson_json.cursor_response(messages_collection)
 
 # POST route to add a new project
 
 
-@app.route('/projects', methods=['POST'])
+@app.route('/projects', methods=['POST'], max_content_length=64 * 1024)
 def add_project():
     data = request.get_json()
     project = {
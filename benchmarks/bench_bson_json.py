@@ -0,0 +1,93 @@
+"""Measure the portfolio's list views over a large collection.
+
+A stand-in collection returns 20,000 project documents from BSON, the
+way pymongo receives them from the server. The view either builds a
+list, converts each ``_id`` to a string and calls ``jsonify``, or
+returns ``bson_json.cursor_response``. Requires ``pymongo``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_bson_json
+"""
+from __future__ import annotations
+
+import timeit
+from datetime import datetime
+
+import bson
+from bson.codec_options import DEFAULT_CODEC_OPTIONS
+
+import bson_json
+from flask import Flask
+from flask import jsonify
+
+COUNT = 20_000
+BATCH = 101
+
+
+class Collection:
+    """Returns documents from BSON batches like a pymongo collection."""
+
+    def __init__(self, batches: list[bytes]) -> None:
+        self.batches = batches
+
+    def find(self, filter=None, **kwargs):  # type: ignore[no-untyped-def]
+        for batch in self.batches:
+            yield from bson.decode_all(batch, DEFAULT_CODEC_OPTIONS)
+
+
+def make_collection() -> Collection:
+    docs = [
+        bson.encode(
+            {
+                "_id": bson.ObjectId(),
+                "title": f"Project {i}",
+                "description": "A project built with Flask and MongoDB.",
+                "tech_stack": ["Python", "Flask", "MongoDB"],
+                "created_at": datetime(2024, 1, 1 + i % 28),
+            }
+        )
+        for i in range(COUNT)
+    ]
+    return Collection(
+        [b"".join(docs[i : i + BATCH]) for i in range(0, COUNT, BATCH)]
+    )
+
+
+def create_app(collection: Collection) -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/jsonify")
+    def list_jsonify():  # type: ignore[no-untyped-def]
+        projects = list(collection.find())
+
+        for project in projects:
+            project["_id"] = str(project["_id"])
+
+        return jsonify(projects)
+
+    @app.route("/stream")
+    def stream():  # type: ignore[no-untyped-def]
+        return bson_json.cursor_response(collection)
+
+    return app
+
+
+def main() -> None:
+    collection = make_collection()
+    app = create_app(collection)
+    client = app.test_client()
+    jsonify_seconds = min(
+        timeit.repeat(lambda: client.get("/jsonify").data, number=3, repeat=3)
+    )
+    bson_json.init_app(app)
+    stream_seconds = min(
+        timeit.repeat(lambda: client.get("/stream").data, number=3, repeat=3)
+    )
+
+    for label, seconds in [("jsonify", jsonify_seconds), ("stream", stream_seconds)]:
+        print(f"{label:<8} {seconds / 3 / COUNT * 1e6:6.2f} us/document")
+
+
+if __name__ == "__main__":
+    main()
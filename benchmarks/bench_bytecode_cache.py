@@ -0,0 +1,86 @@
+"""Measure a cold start that loads hundreds of templates.
+
+Each run uses a new environment, like a freshly forked worker, and
+loads every template once: compiling from source, from a
+``FileSystemBytecodeCache``, and from a ``PackedBytecodeCache`` built
+ahead of time.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_bytecode_cache
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+from jinja2 import BytecodeCache
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import PackedBytecodeCache
+
+COUNT = 300
+TEMPLATE = """\
+{% extends "base.html" %}
+{% block content %}
+<ul>
+{% for project in projects %}
+  <li class="{{ loop.cycle('odd', 'even') }}">
+    <a href="{{ project.link }}">{{ project.title|title }}</a>
+    {% if project.tech_stack %}{{ project.tech_stack|join(", ") }}{% endif %}
+  </li>
+{% else %}
+  <li>No projects yet.</li>
+{% endfor %}
+</ul>
+{% endblock %}
+"""
+
+
+def cold_load(directory: str, bytecode_cache: BytecodeCache | None = None) -> float:
+    env = Environment(
+        loader=FileSystemLoader(directory), bytecode_cache=bytecode_cache
+    )
+    start = time.perf_counter()
+
+    for name in env.list_templates():
+        env.get_template(name)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = os.path.join(tmp, "templates")
+        os.mkdir(templates)
+
+        with open(os.path.join(templates, "base.html"), "w") as f:
+            f.write("<html>{% block content %}{% endblock %}</html>")
+
+        for i in range(COUNT):
+            with open(os.path.join(templates, f"page{i}.html"), "w") as f:
+                f.write(TEMPLATE)
+
+        fs_dir = os.path.join(tmp, "fs-cache")
+        os.mkdir(fs_dir)
+        pack = os.path.join(tmp, "templates.jinja-pack")
+
+        # Fill both caches.
+        cold_load(templates, FileSystemBytecodeCache(fs_dir))
+        PackedBytecodeCache(pack).compile_templates(
+            Environment(loader=FileSystemLoader(templates))
+        )
+
+        for label, make_cache in [
+            ("compile", lambda: None),
+            ("FileSystemBytecodeCache", lambda: FileSystemBytecodeCache(fs_dir)),
+            ("PackedBytecodeCache", lambda: PackedBytecodeCache(pack)),
+        ]:
+            seconds = min(cold_load(templates, make_cache()) for _ in range(3))
+            print(f"{label:<24} {seconds * 1e3:8.1f} ms for {COUNT + 1} templates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure token size and speed with JSON and compact payloads.
+
+Dumps a few typical payloads with ``URLSafeTimedSerializer`` using the
+default JSON serializer and ``CompactSerializer``, and reports the
+length of the token and the time to dump and load it.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_compact_payload
+"""
+from __future__ import annotations
+
+import timeit
+
+from itsdangerous import CompactSerializer
+from itsdangerous import URLSafeTimedSerializer
+
+PAYLOADS = {
+    "session": {"_fresh": True, "_user_id": 1042, "_permanent": True},
+    "share link": {"project": 311, "perm": ["read", "comment"], "exp": 1767225600},
+    "ids": {"ids": list(range(1000, 1040))},
+    "scores": {"scores": [0.5, 0.25, 0.125, 1.0, 2.5, 3.75]},
+}
+
+
+def main() -> None:
+    number = 10_000
+    serializers = [
+        ("json", URLSafeTimedSerializer("secret")),
+        ("compact", URLSafeTimedSerializer("secret", serializer=CompactSerializer)),
+    ]
+
+    for name, payload in PAYLOADS.items():
+        for label, serializer in serializers:
+            token = serializer.dumps(payload)
+            dumps = min(
+                timeit.repeat(lambda: serializer.dumps(payload), number=number, repeat=3)
+            )
+            loads = min(
+                timeit.repeat(lambda: serializer.loads(token), number=number, repeat=3)
+            )
+            print(
+                f"{name:<12} {label:<8} {len(token):5d} chars"
+                f" {dumps / number * 1e6:7.2f} us dumps"
+                f" {loads / number * 1e6:7.2f} us loads"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure rendering includes that each wait for their own data.
+
+Each included template awaits a simulated data fetch of 50 ms. The page
+is rendered with the includes in sequence and inside a
+``{% concurrent %}`` block, with a context value that is also awaited.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_concurrent_include
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from jinja2 import DictLoader
+from jinja2 import Environment
+
+COUNT = 4
+DELAY = 0.05
+
+
+async def fetch(name: str) -> list[str]:
+    await asyncio.sleep(DELAY)
+    return [f"{name} {i}" for i in range(10)]
+
+
+def main() -> None:
+    templates = {
+        f"part{i}.html": (
+            f"<ul>{{% for item in fetch('part{i}') %}}<li>{{{{ item }}}}</li>"
+            "{% endfor %}</ul>"
+        )
+        for i in range(COUNT)
+    }
+    includes = "".join(f"{{% include 'part{i}.html' %}}" for i in range(COUNT))
+    templates["sequential.html"] = f"{{{{ user }}}}{includes}"
+    templates["concurrent.html"] = (
+        f"{{{{ user }}}}{{% concurrent %}}{includes}{{% endconcurrent %}}"
+    )
+    env = Environment(
+        loader=DictLoader(templates),
+        enable_async=True,
+        extensions=["jinja2.ext.concurrent"],
+    )
+    env.globals["fetch"] = fetch
+
+    for name in ["sequential.html", "concurrent.html"]:
+        template = env.get_template(name)
+
+        async def render() -> str:
+            return await template.render_async(user=fetch("user"))  # noqa: B023
+
+        start = time.perf_counter()
+        asyncio.run(render())
+        seconds = time.perf_counter() - start
+        print(f"{name:<16} {seconds * 1e3:7.1f} ms for {COUNT + 1} fetches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure the per-request floor of Flask's dispatch path.
+
+Calls ``Flask.wsgi_app`` directly with a prepared environ for small
+views like the portfolio's ``/`` and ``/protected``, and reports the
+time per request and the memory allocated while handling one request,
+as measured by :mod:`tracemalloc`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_dispatch
+"""
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+from flask import Flask
+from flask import jsonify
+from werkzeug.test import EnvironBuilder
+
+
+def create_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.route("/")
+    def home() -> str:
+        return "Welcome to my MongoDB-backed portfolio app!"
+
+    @app.route("/protected")
+    def protected():  # type: ignore[no-untyped-def]
+        return jsonify(message="this is a protected route"), 200
+
+    return app
+
+
+def start_response(status, headers, exc_info=None):  # type: ignore[no-untyped-def]
+    pass
+
+
+def run(app: Flask, path: str, number: int) -> tuple[float, float, float]:
+    environ = EnvironBuilder(path=path).get_environ()
+
+    def request() -> None:
+        b"".join(app(dict(environ), start_response))
+
+    for _ in range(100):
+        request()
+
+    start = time.perf_counter()
+
+    for _ in range(number):
+        request()
+
+    per_request = (time.perf_counter() - start) / number
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+
+    try:
+        request()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        request()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return per_request, peak - before, after - before
+
+
+def main() -> None:
+    app = create_app()
+
+    for path in ["/", "/protected"]:
+        per_request, peak, retained = run(app, path, 20_000)
+        print(
+            f"{path:<12} {per_request * 1e6:7.1f} us/req"
+            f" {peak:8d} B peak {retained:6d} B retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
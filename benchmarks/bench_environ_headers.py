@@ -0,0 +1,50 @@
+"""Measure header lookups and iteration on ``EnvironHeaders``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_environ_headers
+"""
+from __future__ import annotations
+
+import timeit
+
+from werkzeug.datastructures import EnvironHeaders
+from werkzeug.test import EnvironBuilder
+
+
+def make_environ() -> dict:
+    builder = EnvironBuilder(
+        path="/projects",
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Authorization": "Bearer abc.def.ghi",
+            "Origin": "http://localhost:4200",
+            "Referer": "http://localhost:4200/projects",
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64)",
+            "X-Requested-With": "XMLHttpRequest",
+        },
+        content_type="application/json",
+    )
+    return builder.get_environ()
+
+
+def main() -> None:
+    environ = make_environ()
+    headers = EnvironHeaders(environ)
+    number = 200_000
+
+    for label, stmt in [
+        ("getitem", lambda: headers["Authorization"]),
+        ("get missing", lambda: headers.get("X-Missing")),
+        ("contains", lambda: "Origin" in headers),
+        ("iterate", lambda: list(headers)),
+        ("len", lambda: len(headers)),
+    ]:
+        seconds = timeit.timeit(stmt, number=number)
+        print(f"{label:<12} {seconds / number * 1e9:8.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
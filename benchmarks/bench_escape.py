@@ -0,0 +1,58 @@
+"""Measure HTML escaping of typical short and long text.
+
+Reports which implementation of ``markupsafe`` escaping is in use. The
+compiled ``_speedups`` module is only shipped for macOS, so on Linux
+this measures the pure Python ``_native`` implementation.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_escape
+"""
+from __future__ import annotations
+
+import random
+import timeit
+
+import markupsafe
+from markupsafe import escape
+from markupsafe import escape_many
+from markupsafe import Markup
+
+WORDS = "portfolio project angular flask mongo deploy api design".split()
+
+
+def make_text(words: int, special: bool) -> str:
+    rng = random.Random(0)
+    choices = WORDS + ["<b>", "&", '"quoted"', "it's"] if special else WORDS
+    return " ".join(rng.choice(choices) for _ in range(words))
+
+
+def main() -> None:
+    module = markupsafe._escape_inner.__module__  # type: ignore[attr-defined]
+    print(f"using {module}")
+    cases = [
+        ("short plain", make_text(4, False), 500_000),
+        ("short special", make_text(4, True), 500_000),
+        ("long plain", make_text(2000, False), 5_000),
+        ("long special", make_text(2000, True), 1_000),
+    ]
+
+    for label, text, number in cases:
+        seconds = min(timeit.repeat(lambda: escape(text), number=number, repeat=3))
+        print(f"escape {label:<16} {seconds / number * 1e9:10.0f} ns")
+
+    values = [make_text(4, i % 4 == 0) for i in range(1_000)]
+    values[::10] = [Markup("<em>safe</em>")] * len(values[::10])
+    number = 500
+
+    for label, stmt in [
+        ("[escape(v) ...]", lambda: [escape(v) for v in values]),
+        ("escape_many", lambda: escape_many(values)),
+        ("Markup.join", lambda: Markup("").join(values)),
+    ]:
+        seconds = min(timeit.repeat(stmt, number=number, repeat=3))
+        print(f"{label:<23} {seconds / number * 1e6:10.1f} us per 1000 values")
+
+
+if __name__ == "__main__":
+    main()
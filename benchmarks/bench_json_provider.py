@@ -0,0 +1,81 @@
+"""Measure JSON responses for large lists of documents.
+
+Each view returns a list of project documents, like the portfolio's
+``/get_projects`` view, with dates and IDs that need the provider's
+``default`` function. The default provider is compared with
+``FastJSONProvider``, which streams large lists as UTF-8 bytes.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_json_provider
+"""
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from flask import Flask
+from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask.json.provider import FastJSONProvider
+
+SIZES = [10, 1_000, 20_000]
+
+
+def make_projects(count: int) -> list[dict]:
+    return [
+        {
+            "_id": uuid.UUID(int=i),
+            "title": f"Project {i}",
+            "description": "A project built with Flask and MongoDB. " * 3,
+            "tech_stack": ["Python", "Flask", "MongoDB"],
+            "created": datetime(2024, 1, 1 + i % 28),
+        }
+        for i in range(count)
+    ]
+
+
+def create_app(provider: type[DefaultJSONProvider], projects: list[dict]) -> Flask:
+    app = Flask(__name__)
+    app.json = provider(app)
+
+    @app.route("/get_projects")
+    def get_projects():  # type: ignore[no-untyped-def]
+        return jsonify(projects)
+
+    return app
+
+
+def main() -> None:
+    for count in SIZES:
+        projects = make_projects(count)
+
+        for provider in [DefaultJSONProvider, FastJSONProvider]:
+            client = create_app(provider, projects).test_client()
+            number = max(1, 2_000 // count)
+            seconds = min(
+                timeit.repeat(
+                    lambda: client.get("/get_projects").data,
+                    number=number,
+                    repeat=3,
+                )
+            )
+            tracemalloc.start()
+            response = client.get("/get_projects", buffered=False)
+
+            for _ in response.response:
+                pass
+
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            response.close()
+            print(
+                f"{provider.__name__:<20} {count:>6} items"
+                f" {seconds / number * 1e3:8.2f} ms {peak / 1024:8.0f} KiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure tokenizing large templates.
+
+Compares the lexer's combined-regex tokenizer, used when there are no
+line statements or line comments, with the general rule-by-rule
+tokenizer on a large HTML page full of tags and on a page that is
+mostly raw text.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_lexer
+"""
+from __future__ import annotations
+
+import time
+
+from jinja2 import Environment
+from jinja2.lexer import Lexer
+
+ROW = """\
+<tr class="{{ loop.cycle('odd', 'even') }}">
+  <td><a href="{{ url_for('project', id=project.id) }}">{{ project.title|e }}</a></td>
+  <td>{% if project.tech_stack %}{{ project.tech_stack|join(", ") }}{% endif %}</td>
+  {# the description can be long #}
+  <td>{{ project.description|truncate(200) }}</td>
+</tr>
+"""
+TEXT = """\
+<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do
+eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad
+minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip
+ex ea commodo consequat.</p>
+"""
+
+
+def make_templates(size: int = 512 * 1024) -> dict[str, str]:
+    tags = "{% for project in projects %}\n"
+    tags += ROW * (size // len(ROW))
+    tags += "{% endfor %}\n"
+    text = TEXT * (size // len(TEXT) // 50)
+    text = "{{ title }}\n".join([text] * 50)
+    return {"html": tags, "raw text": text}
+
+
+def run(lexer: Lexer, source: str) -> tuple[float, int]:
+    best = float("inf")
+
+    for _ in range(5):
+        start = time.perf_counter()
+        count = sum(1 for _ in lexer.tokeniter(source, "bench"))
+        best = min(best, time.perf_counter() - start)
+
+    return best, count
+
+
+def main() -> None:
+    env = Environment()
+
+    for label, source in make_templates().items():
+        fast = Lexer(env)
+        general = Lexer(env)
+        general._fast_rules = None
+        fast_seconds, fast_count = run(fast, source)
+        general_seconds, general_count = run(general, source)
+        assert fast_count == general_count
+        print(f"{label} ({len(source) // 1024} KB, {fast_count} tokens)")
+        print(f"  {'general':<10} {general_seconds * 1e3:8.1f} ms")
+        print(f"  {'combined':<10} {fast_seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
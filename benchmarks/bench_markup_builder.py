@@ -0,0 +1,71 @@
+"""Measure building one Markup string from many safe and unsafe parts.
+
+Builds a 500 row table, where the tags are safe ``Markup`` and the
+cell values are text or numbers that need escaping, by adding with
+``+``, with ``Markup.join``, with Jinja's ``markup_join``, and with a
+``MarkupBuilder``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_markup_builder
+"""
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+
+from jinja2.runtime import markup_join
+from markupsafe import Markup
+from markupsafe import MarkupBuilder
+
+ROWS = 500
+
+
+def make_parts() -> list[object]:
+    parts: list[object] = []
+
+    for i in range(ROWS):
+        parts += [Markup("<tr><td>"), f"Project <{i}> & co", Markup("</td><td>")]
+        parts += [i, Markup("</td></tr>")]
+
+    return parts
+
+
+def add(parts: list[object]) -> Markup:
+    rv = Markup()
+
+    for part in parts:
+        rv += str(part) if not isinstance(part, str) else part
+
+    return rv
+
+
+def build(parts: list[object]) -> Markup:
+    builder = MarkupBuilder()
+
+    for part in parts:
+        builder.append(part)
+
+    return builder.build()
+
+
+def main() -> None:
+    parts = make_parts()
+    number = 100
+
+    for label, func in [
+        ("Markup +", add),
+        ("Markup.join", Markup().join),
+        ("markup_join", markup_join),
+        ("MarkupBuilder", build),
+    ]:
+        seconds = min(timeit.repeat(lambda: func(parts), number=number, repeat=3))
+        tracemalloc.start()
+        func(parts)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<16} {seconds / number * 1e6:8.1f} us {peak:9d} B peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measure rendering templates with large static sections and tight
+loops.
+
+Compares templates compiled without the optimizer, with the optimizer,
+which folds constant expressions and yields each run of output at once,
+and with ``cache_loop_lookups``, which caches attribute lookups that
+don't change inside a loop.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_render
+"""
+from __future__ import annotations
+
+import timeit
+
+from jinja2 import Environment
+
+STATIC = """\
+<!doctype html>
+<html>
+<head><title>{{ title }}</title></head>
+<body>
+{% for i in range(50) %}
+<section><h2>Section</h2><p>Static text that never changes.</p>{# note #}
+<p>{{ "Built with " ~ "Flask" ~ " and " ~ "Jinja" }}</p></section>
+{% endfor %}
+</body>
+</html>
+"""
+LOOP = """\
+<table>
+{% for project in projects %}
+<tr><td>{{ project.title }}</td><td>{{ config.site.name }}</td>
+<td>{{ config.site.owner }}</td><td>{{ project.link }}</td></tr>
+{% endfor %}
+</table>
+"""
+
+
+class Site:
+    name = "Portfolio"
+    owner = "admin"
+
+
+class Config:
+    site = Site()
+
+
+class Project:
+    def __init__(self, i: int) -> None:
+        self.title = f"Project {i}"
+        self.link = f"https://example.com/{i}"
+
+
+def main() -> None:
+    context = {
+        "title": "Projects",
+        "config": Config(),
+        "projects": [Project(i) for i in range(1000)],
+    }
+
+    for label, source, number in [
+        ("static", STATIC, 2_000),
+        ("loop", LOOP, 100),
+    ]:
+        for mode, options in [
+            ("plain", {"optimized": False}),
+            ("optimized", {}),
+            ("cached lookups", {"cache_loop_lookups": True}),
+        ]:
+            env = Environment(**options)
+            template = env.from_string(source)
+            seconds = min(
+                timeit.repeat(lambda: template.render(context), number=number, repeat=5)
+            )
+            name = f"{label} {mode}"
+            print(f"{name:<22} {seconds / number * 1e6:8.1f} us/render")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Measure rejecting oversized and deeply nested JSON request bodies.
+
+Posts to a login view like the portfolio's ``/login``, which limits
+its body to 4 KiB and JSON depth to 20. It reports the time to handle a
+normal body, a 10 MiB body that is rejected from its ``Content-Length``
+before being read, and a body nested 1,000 levels deep that is
+rejected without being parsed, along with the memory allocated for
+each, as measured by :mod:`tracemalloc`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_request_limits
+"""
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+
+from flask import Flask
+from flask import request
+
+BODIES = {
+    "normal": b'{"email": "ada@example.com", "password": "secret"}',
+    "10 MiB": b'{"email": "' + b"a" * (10 * 1024 * 1024) + b'"}',
+    "nested": b"[" * 1000 + b"]" * 1000,
+}
+
+
+def create_app() -> Flask:
+    app = Flask(__name__)
+    app.config["MAX_JSON_DEPTH"] = 20
+
+    @app.route("/login", methods=["POST"], max_content_length=4 * 1024)
+    def login():  # type: ignore[no-untyped-def]
+        data = request.get_json()
+        return {"email": data["email"]}
+
+    return app
+
+
+def main() -> None:
+    client = create_app().test_client()
+
+    for label, body in BODIES.items():
+        def post() -> int:
+            return client.post(
+                "/login", data=body, content_type="application/json"
+            ).status_code
+
+        status = post()
+        seconds = min(timeit.repeat(post, number=50, repeat=3)) / 50
+        tracemalloc.start()
+        post()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:<8} {status} {seconds * 1e6:9.1f} us/req"
+            f" {peak / 1024:9.0f} KiB peak"
+        )
+
+
+if __name__ == "__main__":
+    main()
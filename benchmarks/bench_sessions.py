@@ -0,0 +1,86 @@
+"""Measure session handling with the cookie and server-side interfaces.
+
+Each request carries a session cookie. One view never uses the session,
+one is the same view marked ``stateless`` like the portfolio's JSON API,
+one reads a value, and one writes a value. With the default
+``SESSION_REFRESH_EACH_REQUEST``, the session of a request with a cookie
+is still opened and saved unless the route is stateless. The default ``SecureCookieSessionInterface`` is compared with
+``ServerSideSessionInterface`` using the memory and SQLite stores.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_sessions
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import timeit
+
+from flask import Flask
+from flask import session
+from flask.sessions import MemorySessionStore
+from flask.sessions import SecureCookieSessionInterface
+from flask.sessions import ServerSideSessionInterface
+from flask.sessions import SessionInterface
+from flask.sessions import SQLiteSessionStore
+
+NUMBER = 2_000
+
+
+def create_app(interface: SessionInterface) -> Flask:
+    app = Flask(__name__)
+    app.secret_key = "dev"
+    app.session_interface = interface
+
+    @app.route("/login")
+    def login() -> str:
+        session["user"] = {"email": "ada@example.com", "roles": ["admin"]}
+        return "ok"
+
+    @app.route("/projects")
+    def projects() -> str:
+        return "[]"
+
+    @app.route("/api", stateless=True)
+    def api() -> str:
+        return "[]"
+
+    @app.route("/profile")
+    def profile() -> str:
+        return session["user"]["email"]
+
+    @app.route("/visit")
+    def visit() -> str:
+        session["visits"] = session.get("visits", 0) + 1
+        return "ok"
+
+    return app
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, interface in [
+            ("cookie", SecureCookieSessionInterface()),
+            ("memory", ServerSideSessionInterface(MemorySessionStore())),
+            (
+                "sqlite",
+                ServerSideSessionInterface(
+                    SQLiteSessionStore(os.path.join(tmp, "site.db"))
+                ),
+            ),
+        ]:
+            client = create_app(interface).test_client()
+            client.get("/login")
+            cookie = client.get_cookie("session")
+            print(f"{label:<8} cookie {len(cookie.value):4d} bytes")
+
+            for path in ["/projects", "/api", "/profile", "/visit"]:
+                seconds = min(
+                    timeit.repeat(lambda: client.get(path), number=NUMBER, repeat=3)
+                )
+                print(f"{'':<8} {path:<10} {seconds / NUMBER * 1e6:8.1f} us/req")
+
+
+if __name__ == "__main__":
+    main()
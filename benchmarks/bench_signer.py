@@ -0,0 +1,46 @@
+"""Measure signing and verifying session cookies and tokens.
+
+Flask creates a ``URLSafeTimedSerializer`` for each request to load and
+save the session, so each measurement creates a new serializer too.
+The rotated case verifies a value signed with the oldest of three
+secret keys, which tries each newer key first.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_signer
+"""
+from __future__ import annotations
+
+import hashlib
+import timeit
+
+from itsdangerous import URLSafeTimedSerializer
+
+SESSION = {"_fresh": False, "user_id": "65f0c2d4e1a2b3c4d5e6f708", "csrf": "x" * 40}
+
+
+def make_serializer(secret_key: str | list[str]) -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(
+        secret_key,
+        salt="cookie-session",
+        signer_kwargs={"key_derivation": "hmac", "digest_method": hashlib.sha1},
+    )
+
+
+def main() -> None:
+    token = make_serializer("secret").dumps(SESSION)
+    old_token = make_serializer("old").dumps(SESSION)
+    rotated = ["old", "previous", "secret"]
+    number = 20_000
+
+    for label, stmt in [
+        ("dumps", lambda: make_serializer("secret").dumps(SESSION)),
+        ("loads", lambda: make_serializer("secret").loads(token)),
+        ("loads rotated", lambda: make_serializer(rotated).loads(old_token)),
+    ]:
+        seconds = min(timeit.repeat(stmt, number=number, repeat=3))
+        print(f"{label:<16} {seconds / number * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure template cache lookups from many rendering threads.
+
+Each thread repeatedly gets templates from one environment, the way a
+threaded server renders pages, using the default ``LRUCache`` and the
+lock-free ``ClockCache``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_template_cache
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from jinja2 import DictLoader
+from jinja2 import Environment
+from jinja2.environment import create_cache
+
+THREADS = 32
+LOOKUPS = 5_000
+TEMPLATES = {f"page{i}.html": f"<p>{{{{ value }}}} {i}</p>" for i in range(50)}
+
+
+def run(env: Environment) -> float:
+    names = list(TEMPLATES)
+
+    for name in names:
+        env.get_template(name)
+
+    barrier = threading.Barrier(THREADS + 1)
+
+    def worker() -> None:
+        barrier.wait()
+
+        for i in range(LOOKUPS):
+            env.get_template(names[i % len(names)])
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.join()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    total = THREADS * LOOKUPS
+
+    for label, cache in [
+        ("LRUCache", create_cache(400)),
+        ("ClockCache", create_cache(400, clock=True)),
+        ("ClockCache ttl", create_cache(400, ttl=300)),
+    ]:
+        env = Environment(loader=DictLoader(TEMPLATES), auto_reload=False)
+        env.cache = cache
+        seconds = run(env)
+        print(f"{label:<16} {seconds / total * 1e9:8.0f} ns/lookup")
+
+        if hasattr(cache, "stats"):
+            print(f"{'':<16} {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
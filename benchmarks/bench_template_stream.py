@@ -0,0 +1,73 @@
+"""Measure streaming a heavy page with different buffering.
+
+Reports the number of chunks a WSGI server would write, the time to the
+first chunk, and the total time, for an unbuffered stream, item count
+buffering, and byte size buffering with a ``{% flush %}`` after the
+page head.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_template_stream
+"""
+from __future__ import annotations
+
+import time
+
+from jinja2 import Environment
+
+SOURCE = """\
+<!doctype html>
+<html><head><title>{{ title }}</title></head>
+{% flush %}
+<body><table>
+{% for project in projects %}
+<tr><td>{{ project.title }}</td><td>{{ project.link }}</td></tr>
+{% endfor %}
+</table></body></html>
+"""
+
+
+def main() -> None:
+    env = Environment(extensions=["jinja2.ext.flush"], autoescape=True)
+    template = env.from_string(SOURCE)
+    context = {
+        "title": "Projects",
+        "projects": [
+            {"title": f"Project {i}", "link": f"https://example.com/{i}"}
+            for i in range(20_000)
+        ],
+    }
+
+    for label, enable in [
+        ("unbuffered", None),
+        ("5 items", lambda s: s.enable_buffering(5)),
+        ("100 items", lambda s: s.enable_buffering(100)),
+        ("8 KB", lambda s: s.enable_byte_buffering(8192)),
+        ("64 KB", lambda s: s.enable_byte_buffering(65536)),
+    ]:
+        start = time.perf_counter()
+        stream = template.stream(context)
+
+        if enable is not None:
+            enable(stream)
+
+        chunks = 0
+        first = 0.0
+
+        for chunk in stream:
+            chunk.encode()
+
+            if not chunks:
+                first = time.perf_counter() - start
+
+            chunks += 1
+
+        total = time.perf_counter() - start
+        print(
+            f"{label:<12} {chunks:7d} chunks {first * 1e3:7.2f} ms first"
+            f" {total * 1e3:8.1f} ms total"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,11 +12,14 @@ from types import TracebackType
 from urllib.parse import quote as _url_quote
 
 import click
+from jinja2 import ModuleLoader
+from jinja2 import PackedBytecodeCache
 from werkzeug.datastructures import Headers
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.exceptions import BadRequestKeyError
 from werkzeug.exceptions import HTTPException
 from werkzeug.exceptions import InternalServerError
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.routing import BuildError
 from werkzeug.routing import MapAdapter
 from werkzeug.routing import RequestRedirect
@@ -191,12 +194,18 @@ class Flask(App):
             "SESSION_COOKIE_SAMESITE": None,
             "SESSION_REFRESH_EACH_REQUEST": True,
             "MAX_CONTENT_LENGTH": None,
+            "MAX_JSON_DEPTH": None,
             "SEND_FILE_MAX_AGE_DEFAULT": None,
             "TRAP_BAD_REQUEST_ERRORS": None,
             "TRAP_HTTP_EXCEPTIONS": False,
             "EXPLAIN_TEMPLATE_LOADING": False,
             "PREFERRED_URL_SCHEME": "http",
             "TEMPLATES_AUTO_RELOAD": None,
+            "TEMPLATES_AUTO_RELOAD_INTERVAL": 0,
+            "TEMPLATES_BYTECODE_CACHE": None,
+            "TEMPLATES_PRECOMPILED": None,
+            "TEMPLATES_PROFILE": False,
+            "TEMPLATES_STREAM_BUFFER_SIZE": None,
             "MAX_COOKIE_SIZE": 4093,
         }
     )
@@ -364,6 +373,24 @@ class Flask(App):
         :attr:`jinja_options` after this will have no effect. Also adds
         Flask-related globals and filters to the environment.
 
+        .. versionchanged:: 3.0.4
+           ``Environment.auto_reload_interval`` set in accordance with
+           ``TEMPLATES_AUTO_RELOAD_INTERVAL`` configuration option.
+
+        .. versionchanged:: 3.0.4
+           A :class:`~jinja2.PackedBytecodeCache` is used if the
+           ``TEMPLATES_BYTECODE_CACHE`` configuration option is set.
+
+        .. versionchanged:: 3.0.4
+           Templates are loaded from the modules compiled by
+           ``flask templates compile`` if the ``TEMPLATES_PRECOMPILED``
+           configuration option is set.
+
+        .. versionchanged:: 3.0.4
+           Render times are recorded with
+           :meth:`jinja2.Environment.enable_profiling` if the
+           ``TEMPLATES_PROFILE`` configuration option is set.
+
         .. versionchanged:: 0.11
            ``Environment.auto_reload`` set in accordance with
            ``TEMPLATES_AUTO_RELOAD`` configuration option.
@@ -383,6 +410,25 @@ class Flask(App):
 
             options["auto_reload"] = auto_reload
 
+        if "auto_reload_interval" not in options:
+            options["auto_reload_interval"] = self.config[
+                "TEMPLATES_AUTO_RELOAD_INTERVAL"
+            ]
+
+        if "bytecode_cache" not in options:
+            bytecode_cache = self.config["TEMPLATES_BYTECODE_CACHE"]
+
+            if bytecode_cache is not None:
+                options["bytecode_cache"] = PackedBytecodeCache(bytecode_cache)
+
+        if "loader" not in options:
+            precompiled = self.config["TEMPLATES_PRECOMPILED"]
+
+            if precompiled is not None:
+                options["loader"] = ModuleLoader(
+                    precompiled, source_loader=self.create_global_jinja_loader()
+                )
+
         rv = self.jinja_environment(self, **options)
         rv.globals.update(
             url_for=self.url_for,
@@ -396,6 +442,10 @@ class Flask(App):
             g=g,
         )
         rv.policies["json.dumps_function"] = self.json.dumps
+
+        if self.config["TEMPLATES_PROFILE"]:
+            rv.enable_profiling()
+
         return rv
 
     def create_url_adapter(self, request: Request | None) -> MapAdapter | None:
@@ -869,12 +919,18 @@ class Flask(App):
         pre and postprocessing as well as HTTP exception catching and
         error handling.
 
+        .. versionchanged:: 3.0.4
+            A request whose ``Content-Length`` is larger than
+            :attr:`.Request.max_content_length` is rejected with a 413
+            error before :meth:`preprocess_request` is called.
+
         .. versionadded:: 0.7
         """
         self._got_first_request = True
 
         try:
             request_started.send(self, _async_wrapper=self.ensure_sync)
+            self._check_content_length(request)
             rv = self.preprocess_request()
             if rv is None:
                 rv = self.dispatch_request()
@@ -882,6 +938,17 @@ class Flask(App):
             rv = self.handle_user_exception(e)
         return self.finalize_request(rv)
 
+    def _check_content_length(self, request: Request) -> None:
+        # Reject a body that is too large for the route from the header,
+        # before any request handlers run or anything is read.
+        content_length = request.content_length
+
+        if content_length is not None:
+            max_length = request.max_content_length
+
+            if max_length is not None and content_length > max_length:
+                raise RequestEntityTooLarge()
+
     def finalize_request(
         self,
         rv: ft.ResponseReturnValue | HTTPException,
@@ -1262,6 +1329,12 @@ class Flask(App):
         before it's sent to the WSGI server.  By default this will
         call all the :meth:`after_request` decorated functions.
 
+        .. versionchanged:: 3.0.4
+            The session is only saved if it was accessed, or if the
+            request has a session cookie and
+            :data:`SESSION_REFRESH_EACH_REQUEST` is set, unless the
+            route is stateless.
+
         .. versionchanged:: 0.5
            As of Flask 0.5 the functions registered for after request
            execution are called in reverse order of registration.
@@ -1280,11 +1353,27 @@ class Flask(App):
                 for func in reversed(self.after_request_funcs[name]):
                     response = self.ensure_sync(func)(response)
 
-        if not self.session_interface.is_null_session(ctx.session):
+        # Skip saving the session if it was never used, unless the session
+        # cookie needs to be refreshed.
+        if (
+            ctx.session_opened or self._should_refresh_session(ctx.request)
+        ) and not self.session_interface.is_null_session(ctx.session):
             self.session_interface.save_session(self, ctx.session, response)
 
         return response
 
+    def _should_refresh_session(self, request: Request) -> bool:
+        # A permanent session is saved on every request to extend its
+        # expiration when SESSION_REFRESH_EACH_REQUEST is set. Whether the
+        # session is permanent is only known after opening it, so open it
+        # if the request has a session cookie, unless the route is
+        # stateless.
+        return (
+            self.config["SESSION_REFRESH_EACH_REQUEST"]
+            and not getattr(request.url_rule, "stateless", False)
+            and self.session_interface.get_cookie_name(self) in request.cookies
+        )
+
     def do_teardown_request(
         self,
         exc: BaseException | None = _sentinel,  # type: ignore[assignment]
@@ -574,6 +574,7 @@ class FlaskGroup(AppGroup):
             self.add_command(run_command)
             self.add_command(shell_command)
             self.add_command(routes_command)
+            self.add_command(templates_cli)
 
         self._loaded_plugin_commands = False
 
@@ -1089,6 +1090,140 @@ def routes_command(sort: str, all_methods: bool) -> None:
         click.echo(template.format(*row))
 
 
+templates_cli = AppGroup("templates", help="Work with the app's templates.")
+
+
+@templates_cli.command(
+    "precompile", short_help="Precompile templates to the bytecode cache."
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help=(
+        "The packed bytecode cache file to write. Defaults to the"
+        " 'TEMPLATES_BYTECODE_CACHE' config."
+    ),
+)
+def precompile_templates_command(output: str | None) -> None:
+    """Compile all the app's templates and write their bytecode to one
+    packed cache file. Run this at deploy time, and set the
+    'TEMPLATES_BYTECODE_CACHE' config to the file, so that workers don't
+    compile templates when they start.
+    """
+    from jinja2 import PackedBytecodeCache
+
+    if output is None:
+        output = current_app.config["TEMPLATES_BYTECODE_CACHE"]
+
+        if output is None:
+            raise click.UsageError(
+                "Pass '--output' or set the 'TEMPLATES_BYTECODE_CACHE' config."
+            )
+
+    names = PackedBytecodeCache(output).compile_templates(current_app.jinja_env)
+    click.echo(f"Compiled {len(names)} templates to {output!r}.")
+
+
+@templates_cli.command("compile", short_help="Compile templates to Python modules.")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(writable=True),
+    help=(
+        "The directory, or zip file if it ends with '.zip', to write. Defaults"
+        " to the 'TEMPLATES_PRECOMPILED' config."
+    ),
+)
+def compile_templates_command(output: str | None) -> None:
+    """Compile all the app's templates to Python modules. Run this at
+    deploy time, and set the 'TEMPLATES_PRECOMPILED' config to the
+    output, so that workers load templates without lexing, parsing or
+    compiling them. A template whose source changed after it was
+    compiled is loaded from the source instead.
+    """
+    if output is None:
+        output = current_app.config["TEMPLATES_PRECOMPILED"]
+
+        if output is None:
+            raise click.UsageError(
+                "Pass '--output' or set the 'TEMPLATES_PRECOMPILED' config."
+            )
+
+    compiled = 0
+
+    def log_function(message: str) -> None:
+        nonlocal compiled
+
+        if message.startswith("Compiled "):
+            compiled += 1
+        elif message.startswith("Could not compile "):
+            click.echo(message, err=True)
+
+    current_app.jinja_env.compile_templates(
+        output,
+        zip="deflated" if output.endswith(".zip") else None,
+        log_function=log_function,
+    )
+    click.echo(f"Compiled {compiled} templates to {output!r}.")
+
+
+@templates_cli.command(
+    "profile", short_help="Show where time is spent rendering templates."
+)
+@click.argument("paths", nargs=-1)
+@click.option(
+    "--requests",
+    "-n",
+    default=10,
+    show_default=True,
+    help="The number of times to request each path.",
+)
+@click.option(
+    "--limit",
+    "-l",
+    type=int,
+    default=20,
+    show_default=True,
+    help="The number of templates, blocks, and macros to show.",
+)
+def profile_templates_command(
+    paths: tuple[str, ...], requests: int, limit: int
+) -> None:
+    """Request each of the PATHS with the test client, and show the
+    templates, blocks, and macros that took the most time to render.
+    Defaults to requesting '/'.
+
+    To profile a running app instead, set the 'TEMPLATES_PROFILE'
+    config and report from 'app.jinja_env.profiler'.
+    """
+    jinja_env = current_app.jinja_env
+    previous = jinja_env.profiler
+    profiler = jinja_env.enable_profiling()
+    client = current_app.test_client()
+    failed = set()
+
+    try:
+        for _ in range(requests):
+            for path in paths or ("/",):
+                response = client.get(path)
+
+                if response.status_code >= 400 and path not in failed:
+                    failed.add(path)
+                    click.echo(f"GET {path} returned {response.status}.", err=True)
+    finally:
+        if previous is None:
+            jinja_env.disable_profiling()
+        else:
+            jinja_env.enable_profiling(previous)
+
+    if not profiler.stats():
+        click.echo("No templates were rendered.")
+        return
+
+    click.echo(profiler.report(limit))
+
+
 cli = FlaskGroup(
     name="flask",
     help="""\
@@ -7,6 +7,8 @@ import typing as t
 import uuid
 import weakref
 from datetime import date
+from datetime import datetime
+from itertools import islice
 
 from werkzeug.http import http_date
 
@@ -213,3 +215,220 @@ class DefaultJSONProvider(JSONProvider):
         return self._app.response_class(
             f"{self.dumps(obj, **dump_args)}\n", mimetype=self.mimetype
         )
+
+
+def _encode_html(o: t.Any) -> str:
+    return str(o.__html__())
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """A JSON provider for APIs that return large amounts of JSON. It
+    serializes the same types as :class:`DefaultJSONProvider`, with
+    these differences:
+
+    -   Types are serialized by looking up a function for the object's
+        type in :attr:`encoders`, instead of checking each type in turn.
+        Use :meth:`register_encoder` to add a type.
+    -   :meth:`response` passes UTF-8 bytes to the response, so they
+        aren't encoded again as the response is sent, and reuses
+        configured encoders between calls.
+    -   :meth:`response` streams a list or tuple with at least
+        :attr:`stream_threshold` items in chunks of bytes, so the full
+        output is never in memory at once. :meth:`stream_response` does
+        the same for any iterable, such as a database cursor.
+
+    To use it, set :attr:`app.json <flask.Flask.json>`.
+
+    .. code-block:: python
+
+        app.json = FastJSONProvider(app)
+
+    .. versionadded:: 3.0.4
+    """
+
+    encoders: dict[type, t.Callable[[t.Any], t.Any]] = {
+        date: http_date,
+        datetime: http_date,
+        decimal.Decimal: str,
+        uuid.UUID: str,
+    }
+    """Maps a type to a function that returns a valid JSON type for
+    objects of that type. Subclasses of a type use its function unless
+    they are registered themselves. Dataclasses and objects with an
+    ``__html__`` method are handled if no function is found.
+    """
+
+    stream_threshold = 1000
+    """:meth:`response` streams a list or tuple with at least this many
+    items when the output is compact. Set to ``None`` to never stream.
+    """
+
+    chunk_size = 65536
+    """The approximate size in bytes of each chunk of streamed output."""
+
+    def __init__(self, app: App) -> None:
+        super().__init__(app)
+        self.encoders = dict(self.encoders)
+        # The function found for each type seen, including subclasses.
+        self._type_encoders: dict[type, t.Callable[[t.Any], t.Any]] = {}
+        self._encoder_cache: dict[tuple[t.Any, ...], json.JSONEncoder] = {}
+
+    def register_encoder(
+        self, type: type, func: t.Callable[[t.Any], t.Any]
+    ) -> None:
+        """Serialize objects of the given type, and its subclasses, with
+        the function's return value.
+
+        :param type: The type to serialize.
+        :param func: Called with the object, returns a valid JSON type.
+        """
+        self.encoders[type] = func
+        self._type_encoders.clear()
+
+    def default(self, o: t.Any) -> t.Any:  # type: ignore[override]
+        """Look up the function to serialize the object in
+        :attr:`encoders` by its type, and call it.
+        """
+        cls = type(o)
+
+        try:
+            func = self._type_encoders[cls]
+        except KeyError:
+            func = self._find_encoder(cls)
+            self._type_encoders[cls] = func
+
+        return func(o)
+
+    def _find_encoder(self, cls: type) -> t.Callable[[t.Any], t.Any]:
+        for base in cls.__mro__:
+            if base in self.encoders:
+                return self.encoders[base]
+
+        if dataclasses.is_dataclass(cls):
+            return dataclasses.asdict
+
+        if hasattr(cls, "__html__"):
+            return _encode_html
+
+        return _default
+
+    def _get_encoder(self, **kwargs: t.Any) -> json.JSONEncoder:
+        """Return an encoder configured like :meth:`dumps` would be for
+        these arguments. Encoders are cached for the arguments that
+        :meth:`response` uses.
+        """
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        cls = kwargs.pop("cls", json.JSONEncoder)
+        kwargs.setdefault("default", self.default)
+
+        if cls is not json.JSONEncoder or kwargs["default"] != self.default:
+            return cls(**kwargs)  # type: ignore[no-any-return]
+
+        key = tuple(sorted((k, v) for k, v in kwargs.items() if k != "default"))
+
+        try:
+            return self._encoder_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # An argument isn't hashable, such as a list of separators.
+            return cls(**kwargs)  # type: ignore[no-any-return]
+
+        encoder = cls(**kwargs)
+
+        if len(self._encoder_cache) < 8:
+            self._encoder_cache[key] = encoder
+
+        return encoder
+
+    def dumps_bytes(self, obj: t.Any, **kwargs: t.Any) -> bytes:
+        """Serialize data as JSON to UTF-8 bytes. Takes the same
+        arguments as :meth:`dumps`.
+        """
+        return self._get_encoder(**kwargs).encode(obj).encode()
+
+    def iterencode(
+        self, iterable: t.Iterable[t.Any], **kwargs: t.Any
+    ) -> t.Iterator[bytes]:
+        """Serialize the items of an iterable as a JSON array, and
+        yield the UTF-8 bytes in chunks of about :attr:`chunk_size`.
+        Each item is encoded as it is reached, so the iterable can be a
+        generator or a database cursor. Takes the same arguments as
+        :meth:`dumps`, except ``indent``.
+        """
+        encode = self._get_encoder(**kwargs).encode
+        separator = kwargs.get("separators", (", ", ": "))[0]
+        chunk_size = self.chunk_size
+        iterator = iter(iterable)
+        # Encode a batch of items at a time, sized so that a batch is
+        # about one chunk, to avoid calling the encoder once per item.
+        batch_size = 64
+        buffer = ["["]
+        size = 1
+        first = True
+
+        while batch := list(islice(iterator, batch_size)):
+            # Encode the batch as an array and remove the brackets.
+            data = encode(batch)[1:-1]
+
+            if first:
+                first = False
+            else:
+                buffer.append(separator)
+
+            buffer.append(data)
+            size += len(data)
+
+            if size >= chunk_size:
+                yield "".join(buffer).encode()
+                buffer.clear()
+                size = 0
+
+            batch_size = max(1, min(4096, batch_size * chunk_size // (len(data) or 1)))
+
+        buffer.append("]\n")
+        yield "".join(buffer).encode()
+
+    def _response_args(self) -> dict[str, t.Any]:
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return {"indent": 2}
+
+        return {"separators": (",", ":")}
+
+    def response(self, *args: t.Any, **kwargs: t.Any) -> Response:
+        """Serialize the given arguments as JSON, like
+        :meth:`DefaultJSONProvider.response`. A list or tuple with at
+        least :attr:`stream_threshold` items is streamed, unless the
+        output is formatted for debugging.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        dump_args = self._response_args()
+
+        if (
+            self.stream_threshold is not None
+            and "indent" not in dump_args
+            and isinstance(obj, (list, tuple))
+            and len(obj) >= self.stream_threshold
+        ):
+            return self.stream_response(obj)
+
+        return self._app.response_class(
+            self.dumps_bytes(obj, **dump_args) + b"\n", mimetype=self.mimetype
+        )
+
+    def stream_response(self, iterable: t.Iterable[t.Any]) -> Response:
+        """Return a :class:`~flask.Response` that streams the items of
+        an iterable as a JSON array, using :meth:`iterencode`. The
+        iterable is consumed while the response is sent. If an item
+        can't be serialized, the error is raised after the status and
+        headers were already sent.
+
+        :param iterable: The items to serialize. Can be a generator or
+            a database cursor.
+        """
+        dump_args = self._response_args()
+        dump_args.pop("indent", None)
+        return self._app.response_class(
+            self.iterencode(iterable, **dump_args), mimetype=self.mimetype
+        )
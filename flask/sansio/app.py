@@ -647,8 +647,27 @@ class App(Scaffold):
         # Add the required methods now.
         methods |= required_methods
 
+        # The view can be marked as not using the session, and can limit
+        # the size of request data.
+        route_options = {}
+
+        for name, default in (
+            ("stateless", False),
+            ("max_content_length", None),
+            ("max_json_depth", None),
+        ):
+            value = options.pop(name, None)
+
+            if value is None:
+                value = getattr(view_func, name, default)
+
+            route_options[name] = value
+
         rule_obj = self.url_rule_class(rule, methods=methods, **options)
         rule_obj.provide_automatic_options = provide_automatic_options  # type: ignore[attr-defined]
+        rule_obj.stateless = bool(route_options["stateless"])  # type: ignore[attr-defined]
+        rule_obj.max_content_length = route_options["max_content_length"]  # type: ignore[attr-defined]
+        rule_obj.max_json_depth = route_options["max_json_depth"]  # type: ignore[attr-defined]
 
         self.url_map.add(rule_obj)
         if view_func is not None:
@@ -54,12 +54,39 @@ class Request(RequestBase):
 
     @property
     def max_content_length(self) -> int | None:  # type: ignore[override]
-        """Read-only view of the ``MAX_CONTENT_LENGTH`` config key."""
+        """Read-only view of the ``MAX_CONTENT_LENGTH`` config key, or
+        the ``max_content_length`` of the matched route if it sets one.
+
+        .. versionchanged:: 3.0.4
+            Routes can set their own limit.
+        """
+        limit = getattr(self.url_rule, "max_content_length", None)
+
+        if limit is not None:
+            return limit  # type: ignore[no-any-return]
+
         if current_app:
             return current_app.config["MAX_CONTENT_LENGTH"]  # type: ignore[no-any-return]
         else:
             return None
 
+    @property
+    def max_json_depth(self) -> int | None:  # type: ignore[override]
+        """Read-only view of the ``MAX_JSON_DEPTH`` config key, or the
+        ``max_json_depth`` of the matched route if it sets one.
+
+        .. versionadded:: 3.0.4
+        """
+        limit = getattr(self.url_rule, "max_json_depth", None)
+
+        if limit is not None:
+            return limit  # type: ignore[no-any-return]
+
+        if current_app:
+            return current_app.config["MAX_JSON_DEPTH"]  # type: ignore[no-any-return]
+        else:
+            return None
+
     @property
     def endpoint(self) -> str | None:
         """The endpoint that matched the request URL.
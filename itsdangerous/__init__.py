@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as t
 
+from .compact import CompactSerializer as CompactSerializer
 from .encoding import base64_decode as base64_decode
 from .encoding import base64_encode as base64_encode
 from .encoding import want_bytes as want_bytes
@@ -0,0 +1,241 @@
+"""A compact binary serialization format for signed payloads.
+
+The format is a subset of MessagePack: ``None``, booleans, integers
+that fit in 64 bits, floats, text, bytes, lists and tuples, and dicts.
+Unlike JSON, small numbers and short strings take a single byte of
+overhead and bytes don't need to be encoded as text, so small
+structured payloads are smaller.
+
+Each payload starts with a header of :data:`MARKER`, which can't start
+a JSON document, followed by the format :data:`VERSION`. This lets
+:class:`.URLSafeSerializer` tell compact payloads from JSON ones.
+"""
+
+from __future__ import annotations
+
+import struct
+import typing as t
+
+#: The first byte of a compact payload.
+MARKER = b"\x00"
+
+#: The version of the format, the second byte of a compact payload.
+VERSION = 1
+
+HEADER = MARKER + bytes((VERSION,))
+
+_pack_float = struct.Struct(">d").pack
+_unpack_float = struct.Struct(">d").unpack_from
+
+
+def is_compact(payload: bytes) -> bool:
+    """Check if a payload was dumped by :class:`CompactSerializer`."""
+    return payload[:1] == MARKER
+
+
+def _is_compact_serializer(serializer: t.Any) -> bool:
+    if isinstance(serializer, type):
+        return issubclass(serializer, CompactSerializer)
+
+    return isinstance(serializer, CompactSerializer)
+
+
+def _pack_length(
+    out: bytearray, n: int, fix: int, fix_max: int, codes: bytes
+) -> None:
+    # codes are the type codes for 8, 16, and 32 bit lengths, any of
+    # which may be 0 if that size doesn't exist for the type.
+    if n <= fix_max:
+        out.append(fix | n)
+    elif n <= 0xFF and codes[0]:
+        out.append(codes[0])
+        out.append(n)
+    elif n <= 0xFFFF:
+        out.append(codes[1])
+        out += n.to_bytes(2, "big")
+    elif n <= 0xFFFFFFFF:
+        out.append(codes[2])
+        out += n.to_bytes(4, "big")
+    else:
+        raise ValueError("Value is too large to serialize.")
+
+
+def _pack(out: bytearray, obj: t.Any) -> None:
+    if obj is None:
+        out.append(0xC0)
+    elif obj is False:
+        out.append(0xC2)
+    elif obj is True:
+        out.append(0xC3)
+    elif isinstance(obj, int):
+        if 0 <= obj <= 0x7F:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xFF)
+        elif obj > 0:
+            for size, code in ((1, 0xCC), (2, 0xCD), (4, 0xCE), (8, 0xCF)):
+                if obj < 1 << (size * 8):
+                    out.append(code)
+                    out += obj.to_bytes(size, "big")
+                    return
+
+            raise ValueError(f"Integer {obj} is too large to serialize.")
+        else:
+            for size, code in ((1, 0xD0), (2, 0xD1), (4, 0xD2), (8, 0xD3)):
+                if obj >= -(1 << (size * 8 - 1)):
+                    out.append(code)
+                    out += obj.to_bytes(size, "big", signed=True)
+                    return
+
+            raise ValueError(f"Integer {obj} is too small to serialize.")
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += _pack_float(obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        _pack_length(out, len(data), 0xA0, 31, b"\xd9\xda\xdb")
+        out += data
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_length(out, len(data), 0, -1, b"\xc4\xc5\xc6")
+        out += data
+    elif isinstance(obj, (list, tuple)):
+        _pack_length(out, len(obj), 0x90, 15, b"\x00\xdc\xdd")
+
+        for item in obj:
+            _pack(out, item)
+    elif isinstance(obj, dict):
+        _pack_length(out, len(obj), 0x80, 15, b"\x00\xde\xdf")
+
+        for key, value in obj.items():
+            _pack(out, key)
+            _pack(out, value)
+    else:
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not serializable in the"
+            " compact format."
+        )
+
+
+class _Unpacker:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, pos: int) -> None:
+        self.data = data
+        self.pos = pos
+
+    def take(self, n: int) -> bytes:
+        end = self.pos + n
+
+        if end > len(self.data):
+            raise ValueError("Unexpected end of compact payload.")
+
+        rv = self.data[self.pos : end]
+        self.pos = end
+        return rv
+
+    def uint(self, size: int) -> int:
+        return int.from_bytes(self.take(size), "big")
+
+    def unpack(self) -> t.Any:
+        code = self.take(1)[0]
+
+        if code <= 0x7F:
+            return code
+
+        if code >= 0xE0:
+            return code - 0x100
+
+        if 0xA0 <= code <= 0xBF:
+            return self.take(code & 0x1F).decode("utf-8")
+
+        if 0x90 <= code <= 0x9F:
+            return self.array(code & 0x0F)
+
+        if 0x80 <= code <= 0x8F:
+            return self.map(code & 0x0F)
+
+        if code == 0xC0:
+            return None
+
+        if code == 0xC2:
+            return False
+
+        if code == 0xC3:
+            return True
+
+        if 0xCC <= code <= 0xCF:
+            return self.uint(1 << (code - 0xCC))
+
+        if 0xD0 <= code <= 0xD3:
+            size = 1 << (code - 0xD0)
+            return int.from_bytes(self.take(size), "big", signed=True)
+
+        if code == 0xCB:
+            return _unpack_float(self.take(8))[0]
+
+        if 0xD9 <= code <= 0xDB:
+            return self.take(self.uint(1 << (code - 0xD9))).decode("utf-8")
+
+        if 0xC4 <= code <= 0xC6:
+            return self.take(self.uint(1 << (code - 0xC4)))
+
+        if code in (0xDC, 0xDD):
+            return self.array(self.uint(2 if code == 0xDC else 4))
+
+        if code in (0xDE, 0xDF):
+            return self.map(self.uint(2 if code == 0xDE else 4))
+
+        raise ValueError(f"Unsupported type code 0x{code:02x} in compact payload.")
+
+    def array(self, n: int) -> list[t.Any]:
+        return [self.unpack() for _ in range(n)]
+
+    def map(self, n: int) -> dict[t.Any, t.Any]:
+        rv = {}
+
+        for _ in range(n):
+            key = self.unpack()
+            rv[key] = self.unpack()
+
+        return rv
+
+
+class CompactSerializer:
+    """Serializes to the compact binary format instead of JSON. Pass it
+    as the ``serializer`` to any serializer.
+
+    .. code-block:: python
+
+        s = URLSafeSerializer("secret", serializer=CompactSerializer)
+        token = s.dumps({"id": 5, "roles": ["admin"]})
+
+    With :class:`.URLSafeSerializer` and
+    :class:`.URLSafeTimedSerializer`, the tokens are still text, and
+    tokens dumped with JSON can still be loaded, so an app can switch to
+    this format without invalidating existing tokens.
+
+    .. versionadded:: 2.2.1
+    """
+
+    @staticmethod
+    def dumps(obj: t.Any) -> bytes:
+        out = bytearray(HEADER)
+        _pack(out, obj)
+        return bytes(out)
+
+    @staticmethod
+    def loads(payload: bytes) -> t.Any:
+        if not is_compact(payload):
+            raise ValueError("Not a compact payload.")
+
+        if payload[1:2] != HEADER[1:]:
+            raise ValueError(f"Unsupported compact payload version {payload[1:2]!r}.")
+
+        unpacker = _Unpacker(payload, len(HEADER))
+        rv = unpacker.unpack()
+
+        if unpacker.pos != len(payload):
+            raise ValueError("Extra data after compact payload.")
+
+        return rv
@@ -18,6 +18,21 @@ class BadData(Exception):
     def __str__(self) -> str:
         return self.message
 
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # Pickle the attributes without calling __init__ again, so
+        # subclasses with other arguments keep all their data, such as
+        # errors returned from the worker processes of loads_many.
+        return _rebuild_error, (type(self), self.args, self.__dict__)
+
+
+def _rebuild_error(
+    cls: type[BadData], args: tuple[t.Any, ...], state: dict[str, t.Any]
+) -> BadData:
+    rv = cls.__new__(cls, *args)
+    rv.args = args
+    rv.__dict__.update(state)
+    return rv
+
 
 class BadSignature(BadData):
     """Raised if a signature does not match."""
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import importlib
 import json
+import multiprocessing
+import types
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 
 from .encoding import want_bytes
+from .exc import BadData
 from .exc import BadPayload
 from .exc import BadSignature
 from .signer import _make_keys_list
@@ -242,6 +247,11 @@ class Serializer(t.Generic[_TSerialized]):
         """
         return self.secret_keys[-1]
 
+    @property
+    def _dumps_text(self) -> bool:
+        """Whether :meth:`dumps` returns text rather than bytes."""
+        return self.is_text_serializer
+
     def load_payload(
         self, payload: bytes, serializer: _PDataSerializer[t.Any] | None = None
     ) -> t.Any:
@@ -316,7 +326,7 @@ class Serializer(t.Generic[_TSerialized]):
         payload = want_bytes(self.dump_payload(obj))
         rv = self.make_signer(salt).sign(payload)
 
-        if self.is_text_serializer:
+        if self._dumps_text:
             return rv.decode("utf-8")  # type: ignore[return-value]
 
         return rv  # type: ignore[return-value]
@@ -333,10 +343,16 @@ class Serializer(t.Generic[_TSerialized]):
         """Reverse of :meth:`dumps`. Raises :exc:`.BadSignature` if the
         signature validation fails.
         """
-        s = want_bytes(s)
+        return self._load_with(want_bytes(s), self.iter_unsigners(salt))
+
+    def _load_with(self, s: bytes, unsigners: cabc.Iterable[Signer]) -> t.Any:
+        """Unsign and load a value, trying each of the given signers.
+        Subclasses that add arguments to :meth:`loads` accept them here
+        as well.
+        """
         last_exception = None
 
-        for signer in self.iter_unsigners(salt):
+        for signer in unsigners:
             try:
                 return self.load_payload(signer.unsign(s))
             except BadSignature as err:
@@ -344,6 +360,115 @@ class Serializer(t.Generic[_TSerialized]):
 
         raise t.cast(BadSignature, last_exception)
 
+    def dumps_many(
+        self,
+        objs: cabc.Iterable[t.Any],
+        salt: str | bytes | None = None,
+        processes: int | None = None,
+    ) -> list[tuple[_TSerialized | None, Exception | None]]:
+        """Like :meth:`dumps`, but for many objects at once. One signer is
+        used for all of them.
+
+        Returns a list of ``(value, error)`` pairs in the same order as
+        the objects. If an object could not be serialized, the value is
+        ``None`` and the error is the exception, instead of raising it.
+
+        :param objs: The objects to serialize and sign.
+        :param salt: Override the salt to sign with.
+        :param processes: Split a very large batch over this many worker
+            processes. The workers are started fresh with the
+            ``forkserver`` or ``spawn`` method, not forked from this
+            process, so this is safe to call from a threaded server.
+            This serializer is sent to the workers, so its attributes
+            must be picklable, apart from modules such as ``json``.
+
+        .. versionadded:: 2.2.1
+        """
+        objs = list(objs)
+
+        if processes is not None:
+            return _map_pool(self, processes, _dumps_chunk, objs, salt, {})
+
+        return self._dumps_many(objs, salt)
+
+    def _dumps_many(
+        self, objs: list[t.Any], salt: str | bytes | None
+    ) -> list[tuple[_TSerialized | None, Exception | None]]:
+        signer = self.make_signer(salt)
+        rv: list[tuple[_TSerialized | None, Exception | None]] = []
+
+        for obj in objs:
+            try:
+                payload = want_bytes(self.dump_payload(obj))
+            except Exception as e:
+                rv.append((None, e))
+                continue
+
+            value = signer.sign(payload)
+
+            if self._dumps_text:
+                rv.append((value.decode("utf-8"), None))  # type: ignore[arg-type]
+            else:
+                rv.append((value, None))  # type: ignore[arg-type]
+
+        return rv
+
+    def loads_many(
+        self,
+        values: cabc.Iterable[str | bytes],
+        salt: str | bytes | None = None,
+        processes: int | None = None,
+    ) -> list[tuple[t.Any, BadData | None]]:
+        """Like :meth:`loads`, but for many values at once. The signers
+        are created once and used for all of them.
+
+        Returns a list of ``(obj, error)`` pairs in the same order as the
+        values. If a value could not be verified or loaded, the object is
+        ``None`` and the error is the :exc:`.BadData` exception, such as
+        :exc:`.BadSignature`, instead of raising it.
+
+        :param values: The signed values to verify and load.
+        :param salt: Override the salt to verify with.
+        :param processes: Split a very large batch over this many worker
+            processes, like :meth:`dumps_many`.
+
+        .. versionadded:: 2.2.1
+        """
+        return self._loads_many_batch(values, salt, processes, {})
+
+    def _loads_many_batch(
+        self,
+        values: cabc.Iterable[str | bytes],
+        salt: str | bytes | None,
+        processes: int | None,
+        load_kwargs: dict[str, t.Any],
+    ) -> list[tuple[t.Any, BadData | None]]:
+        values = list(values)
+
+        if processes is not None:
+            return _map_pool(self, processes, _loads_chunk, values, salt, load_kwargs)
+
+        return self._loads_many(values, salt, load_kwargs)
+
+    def _loads_many(
+        self,
+        values: list[str | bytes],
+        salt: str | bytes | None,
+        load_kwargs: dict[str, t.Any],
+    ) -> list[tuple[t.Any, BadData | None]]:
+        unsigners = list(self.iter_unsigners(salt))
+        rv: list[tuple[t.Any, BadData | None]] = []
+
+        for value in values:
+            try:
+                obj = self._load_with(want_bytes(value), unsigners, **load_kwargs)
+            except BadData as e:
+                rv.append((None, e))
+            else:
+                rv.append((obj, None))
+
+        return rv
+
     def load(self, f: t.IO[t.Any], salt: str | bytes | None = None) -> t.Any:
         """Like :meth:`loads` but loads from a file."""
         return self.loads(f.read(), salt)
@@ -404,3 +529,98 @@ class Serializer(t.Generic[_TSerialized]):
         .. versionadded:: 0.15
         """
         return self.loads_unsafe(f.read(), salt=salt)
+
+
+def _mp_context() -> t.Any:
+    # Forking a process that has other threads running, such as a
+    # threaded server, can deadlock the child on a lock another thread
+    # held. Start clean workers instead.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+
+    return multiprocessing.get_context("spawn")
+
+
+class _ModuleRef(t.NamedTuple):
+    """Stands in for a module, which can't be pickled, in the state of
+    a serializer sent to a worker.
+    """
+
+    name: str
+
+
+def _worker_state(
+    serializer: Serializer[t.Any],
+) -> tuple[type[Serializer[t.Any]], dict[str, t.Any]]:
+    state = {
+        key: _ModuleRef(value.__name__)
+        if isinstance(value, types.ModuleType)
+        else value
+        for key, value in vars(serializer).items()
+    }
+    return type(serializer), state
+
+
+# The serializer used by a worker process of a batch started with
+# dumps_many or loads_many.
+_worker_serializer: Serializer[t.Any] | None = None
+
+
+def _init_worker(cls: type[Serializer[t.Any]], state: dict[str, t.Any]) -> None:
+    global _worker_serializer
+    serializer = object.__new__(cls)
+
+    for key, value in state.items():
+        if isinstance(value, _ModuleRef):
+            value = importlib.import_module(value.name)
+
+        setattr(serializer, key, value)
+
+    _worker_serializer = serializer
+
+
+def _dumps_chunk(
+    args: tuple[list[t.Any], str | bytes | None, dict[str, t.Any]],
+) -> list[tuple[t.Any, Exception | None]]:
+    objs, salt, _ = args
+    return t.cast(Serializer[t.Any], _worker_serializer)._dumps_many(objs, salt)
+
+
+def _loads_chunk(
+    args: tuple[list[t.Any], str | bytes | None, dict[str, t.Any]],
+) -> list[tuple[t.Any, BadData | None]]:
+    values, salt, load_kwargs = args
+    serializer = t.cast(Serializer[t.Any], _worker_serializer)
+    return serializer._loads_many(values, salt, load_kwargs)
+
+
+def _map_pool(
+    serializer: Serializer[t.Any],
+    processes: int,
+    func: cabc.Callable[
+        [tuple[list[t.Any], str | bytes | None, dict[str, t.Any]]], list[t.Any]
+    ],
+    items: list[t.Any],
+    salt: str | bytes | None,
+    load_kwargs: dict[str, t.Any],
+) -> list[t.Any]:
+    """Split the items into a few chunks per process, run ``func`` on
+    each chunk in a pool of worker processes, and join the results in
+    order.
+    """
+    size = max(1, -(-len(items) // (processes * 4)))
+    chunks = [
+        (items[i : i + size], salt, load_kwargs) for i in range(0, len(items), size)
+    ]
+    rv: list[t.Any] = []
+
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=_mp_context(),
+        initializer=_init_worker,
+        initargs=_worker_state(serializer),
+    ) as executor:
+        for result in executor.map(func, chunks):
+            rv.extend(result)
+
+    return rv
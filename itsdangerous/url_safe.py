@@ -4,6 +4,9 @@ import typing as t
 import zlib
 
 from ._json import _CompactJSON
+from .compact import _is_compact_serializer
+from .compact import CompactSerializer
+from .compact import is_compact
 from .encoding import base64_decode
 from .encoding import base64_encode
 from .exc import BadPayload
@@ -16,10 +19,24 @@ class URLSafeSerializerMixin(Serializer[str]):
     """Mixed in with a regular serializer it will attempt to zlib
     compress the string to make it shorter if necessary. It will also
     base64 encode the string so that it can safely be placed in a URL.
+
+    Payloads dumped by :class:`.CompactSerializer` are detected when
+    loading, so tokens in either format can be loaded whether the
+    serializer is JSON or compact.
+
+    .. versionchanged:: 2.2.1
+        Detect compact payloads when loading. Dumping with
+        :class:`.CompactSerializer` returns text.
     """
 
     default_serializer: _PDataSerializer[str] = _CompactJSON
 
+    @property
+    def _dumps_text(self) -> bool:
+        # The payload is base64 encoded, so it's text even if the
+        # compact serializer produces bytes.
+        return self.is_text_serializer or _is_compact_serializer(self.serializer)
+
     def load_payload(
         self,
         payload: bytes,
@@ -50,6 +67,17 @@ class URLSafeSerializerMixin(Serializer[str]):
                     original_error=e,
                 ) from e
 
+        if serializer is None:
+            if is_compact(json):
+                if not _is_compact_serializer(self.serializer):
+                    serializer = CompactSerializer
+            elif _is_compact_serializer(self.serializer):
+                # A token dumped with JSON before switching to compact.
+                serializer = self.default_serializer
+
+        if serializer is not None:
+            kwargs["serializer"] = serializer
+
         return super().load_payload(json, *args, **kwargs)
 
     def dump_payload(self, obj: t.Any) -> bytes:
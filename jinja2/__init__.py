@@ -6,6 +6,7 @@ sandboxed environment.
 from .bccache import BytecodeCache as BytecodeCache
 from .bccache import FileSystemBytecodeCache as FileSystemBytecodeCache
 from .bccache import MemcachedBytecodeCache as MemcachedBytecodeCache
+from .bccache import PackedBytecodeCache as PackedBytecodeCache
 from .environment import Environment as Environment
 from .environment import Template as Template
 from .exceptions import TemplateAssertionError as TemplateAssertionError
@@ -26,6 +27,7 @@ from .loaders import PrefixLoader as PrefixLoader
 from .runtime import ChainableUndefined as ChainableUndefined
 from .runtime import DebugUndefined as DebugUndefined
 from .runtime import make_logging_undefined as make_logging_undefined
+from .runtime import RenderProfiler as RenderProfiler
 from .runtime import StrictUndefined as StrictUndefined
 from .runtime import Undefined as Undefined
 from .utils import clear_caches as clear_caches
@@ -1,5 +1,6 @@
 """Compiles nodes from the parser into Python code."""
 
+import sys
 import typing as t
 from contextlib import contextmanager
 from functools import update_wrapper
@@ -290,6 +291,159 @@ class UndeclaredNameVisitor(NodeVisitor):
         """Stop visiting a blocks."""
 
 
+def _getattr_chain(node: nodes.Getattr) -> t.Optional[t.Tuple[str, ...]]:
+    """Return the name and attributes of a lookup like ``a.b.c`` as
+    ``("a", "b", "c")``, or ``None`` if it doesn't start with a name.
+    """
+    attrs = []
+    expr: nodes.Node = node
+
+    while isinstance(expr, nodes.Getattr):
+        attrs.append(expr.attr)
+        expr = expr.node
+
+    if not isinstance(expr, nodes.Name) or expr.ctx != "load":
+        return None
+
+    attrs.append(expr.name)
+    return tuple(reversed(attrs))
+
+
+class LoopInvariantVisitor(NodeVisitor):
+    """A visitor that finds attribute lookups in a loop body that don't
+    change between iterations, because the name they start from is not
+    assigned in the body and none of its methods are called. Lookups in
+    nested functions, like macros and recursive loops, are not
+    collected, but their assignments are still taken into account.
+    """
+
+    def __init__(self) -> None:
+        self.lookups: t.List[t.Tuple[nodes.Getattr, t.Tuple[str, ...]]] = []
+        self.assigned: t.Set[str] = {"loop"}
+        self.collect = True
+
+    def invariant_lookups(
+        self,
+    ) -> t.Iterator[t.Tuple[nodes.Getattr, t.Tuple[str, ...]]]:
+        for node, chain in self.lookups:
+            if chain[0] not in self.assigned:
+                yield node, chain
+
+    @contextmanager
+    def nested_function(self) -> t.Iterator[None]:
+        collect = self.collect
+        self.collect = False
+
+        try:
+            yield
+        finally:
+            self.collect = collect
+
+    def visit_Getattr(self, node: nodes.Getattr) -> None:
+        chain = _getattr_chain(node)
+
+        if chain is None:
+            self.generic_visit(node)
+        elif self.collect:
+            self.lookups.append((node, chain))
+
+    def visit_Call(self, node: nodes.Call) -> None:
+        if isinstance(node.node, nodes.Getattr):
+            chain = _getattr_chain(node.node)
+
+            if chain is not None:
+                self.assigned.add(chain[0])
+
+        self.generic_visit(node)
+
+    def visit_Name(self, node: nodes.Name) -> None:
+        if node.ctx != "load":
+            self.assigned.add(node.name)
+
+    def visit_NSRef(self, node: nodes.NSRef) -> None:
+        self.assigned.add(node.name)
+
+    def visit_Import(self, node: nodes.Import) -> None:
+        self.assigned.add(node.target)
+
+    def visit_FromImport(self, node: nodes.FromImport) -> None:
+        for name in node.names:
+            self.assigned.add(name[1] if isinstance(name, tuple) else name)
+
+    def visit_For(self, node: nodes.For) -> None:
+        self.visit(node.target)
+        self.visit(node.iter)
+
+        if node.test is not None:
+            with self.nested_function():
+                self.visit(node.test)
+
+        if node.recursive:
+            with self.nested_function():
+                self.blockvisit(node.body)
+        else:
+            self.blockvisit(node.body)
+
+        self.blockvisit(node.else_)
+
+    def visit_Macro(self, node: nodes.Macro) -> None:
+        self.assigned.add(node.name)
+
+        with self.nested_function():
+            self.generic_visit(node)
+
+    def visit_CallBlock(self, node: nodes.CallBlock) -> None:
+        self.visit(node.call)
+
+        with self.nested_function():
+            for child in node.iter_child_nodes(exclude=("call",)):
+                self.visit(child)
+
+    def visit_Block(self, node: nodes.Block) -> None:
+        with self.nested_function():
+            self.generic_visit(node)
+
+    def blockvisit(self, body: t.Iterable[nodes.Node]) -> None:
+        for child in body:
+            self.visit(child)
+
+
+def merge_output(body: t.Iterable[nodes.Node]) -> t.List[nodes.Node]:
+    """Merge adjacent ``Output`` nodes, and adjacent template data in
+    them, so that each run of output is written with one statement.
+    """
+    rv: t.List[nodes.Node] = []
+
+    for node in body:
+        if isinstance(node, nodes.Output) and rv and isinstance(rv[-1], nodes.Output):
+            rv[-1] = nodes.Output(rv[-1].nodes + node.nodes, lineno=rv[-1].lineno)
+        else:
+            rv.append(node)
+
+    for idx, node in enumerate(rv):
+        if not isinstance(node, nodes.Output):
+            continue
+
+        children: t.List[nodes.Expr] = []
+
+        for child in node.nodes:
+            if (
+                children
+                and isinstance(child, nodes.TemplateData)
+                and isinstance(children[-1], nodes.TemplateData)
+            ):
+                children[-1] = nodes.TemplateData(
+                    children[-1].data + child.data, lineno=children[-1].lineno
+                )
+            else:
+                children.append(child)
+
+        if len(children) != len(node.nodes):
+            rv[idx] = nodes.Output(children, lineno=node.lineno)
+
+    return rv
+
+
 class CompilerExit(Exception):
     """Raised if the compiler encountered a situation where it just
     doesn't make sense to further process the code.  Any block that
@@ -371,6 +525,10 @@ class CodeGenerator(NodeVisitor):
         # Tracks the current context.
         self._context_reference_stack = ["context"]
 
+        # Maps loop invariant attribute lookups to the identifiers that
+        # cache them while the loop runs.
+        self._hoisted: t.Dict[int, str] = {}
+
     @property
     def optimized(self) -> bool:
         return self.optimizer is not None
@@ -445,7 +603,7 @@ class CodeGenerator(NodeVisitor):
         """
         try:
             self.writeline("pass")
-            for node in nodes:
+            for node in merge_output(nodes) if self.optimized else nodes:
                 self.visit(node, frame)
         except CompilerExit:
             pass
@@ -1231,6 +1389,32 @@ class CodeGenerator(NodeVisitor):
             iteration_indicator = self.temporary_identifier()
             self.writeline(f"{iteration_indicator} = 1")
 
+        # If enabled, attribute lookups that don't change between
+        # iterations are cached the first time they are evaluated.
+        # Assignment expressions need Python 3.8.
+        hoisted = []
+
+        if (
+            self.environment.cache_loop_lookups
+            and not node.recursive
+            and sys.version_info >= (3, 8)
+        ):
+            invariant = LoopInvariantVisitor()
+            invariant.visit(node.target)
+            invariant.blockvisit(node.body)
+            refs: t.Dict[t.Tuple[str, ...], str] = {}
+
+            for lookup, chain in invariant.invariant_lookups():
+                if id(lookup) in self._hoisted:
+                    continue
+
+                if chain not in refs:
+                    refs[chain] = self.temporary_identifier()
+                    self.writeline(f"{refs[chain]} = missing")
+
+                self._hoisted[id(lookup)] = refs[chain]
+                hoisted.append(id(lookup))
+
         self.writeline(self.choose_async("async for ", "for "), node)
         self.visit(node.target, loop_frame)
         if extended_loop:
@@ -1261,6 +1445,10 @@ class CodeGenerator(NodeVisitor):
 
         self.writeline("_loop_vars = {}")
         self.blockvisit(node.body, loop_frame)
+
+        for key in hoisted:
+            del self._hoisted[key]
+
         if node.else_:
             self.writeline(f"{iteration_indicator} = 0")
         self.outdent()
@@ -1712,6 +1900,11 @@ class CodeGenerator(NodeVisitor):
 
     @optimizeconst
     def visit_Getattr(self, node: nodes.Getattr, frame: Frame) -> None:
+        ref = self._hoisted.get(id(node))
+
+        if ref is not None:
+            self.write(f"({ref} if {ref} is not missing else ({ref} := ")
+
         if self.environment.is_async:
             self.write("(await auto_await(")
 
@@ -1722,6 +1915,9 @@ class CodeGenerator(NodeVisitor):
         if self.environment.is_async:
             self.write("))")
 
+        if ref is not None:
+            self.write("))")
+
     @optimizeconst
     def visit_Getitem(self, node: nodes.Getitem, frame: Frame) -> None:
         # slices bypass the environment getitem method.
@@ -1913,6 +2109,40 @@ class CodeGenerator(NodeVisitor):
     def visit_Break(self, node: nodes.Break, frame: Frame) -> None:
         self.writeline("break", node)
 
+    def visit_Concurrent(self, node: nodes.Concurrent, frame: Frame) -> None:
+        if not self.environment.is_async:
+            for child in node.body:
+                self.visit(child, frame)
+
+            return
+
+        # Render each child into a buffer in its own coroutine, then
+        # await them together and output the results in order.
+        funcs = []
+
+        for child in node.body:
+            func = self.temporary_identifier()
+            funcs.append(func)
+            child_frame = frame.copy()
+            child_frame.buffer = self.temporary_identifier()
+            self.writeline(f"async def {func}():", child)
+            self.indent()
+            self.writeline(f"{child_frame.buffer} = []")
+            self.visit(child, child_frame)
+            self.return_buffer_contents(child_frame, force_unescaped=True)
+            self.outdent()
+
+        calls = ", ".join(f"{func}()" for func in funcs)
+        self.writeline(f"for event in await render_concurrently(({calls},)):", node)
+        self.indent()
+        self.simple_write("event", frame)
+        self.outdent()
+
+    def visit_Flush(self, node: nodes.Flush, frame: Frame) -> None:
+        # Only output that goes straight to the stream can be flushed.
+        if frame.buffer is None and not frame.require_output_check:
+            self.writeline("yield flush_marker", node)
+
     def visit_Scope(self, node: nodes.Scope, frame: Frame) -> None:
         scope_frame = frame.inner()
         scope_frame.symbols.analyze_node(node)
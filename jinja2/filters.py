@@ -1,13 +1,16 @@
 """Built-in template filters used with the ``|`` operator."""
 
 import math
+import operator
 import random
 import re
 import typing
 import typing as t
 from collections import abc
+from functools import lru_cache
 from itertools import chain
 from itertools import groupby
+from itertools import islice
 
 from markupsafe import escape
 from markupsafe import Markup
@@ -125,14 +128,115 @@ def make_multi_attrgetter(
 
 def _prepare_attribute_parts(
     attr: t.Optional[t.Union[str, int]],
-) -> t.List[t.Union[str, int]]:
+) -> t.Tuple[t.Union[str, int], ...]:
     if attr is None:
-        return []
+        return ()
 
     if isinstance(attr, str):
-        return [int(x) if x.isdigit() else x for x in attr.split(".")]
+        return _split_attribute_path(attr)
 
-    return [attr]
+    return (attr,)
+
+
+@lru_cache(maxsize=256)
+def _split_attribute_path(attr: str) -> t.Tuple[t.Union[str, int], ...]:
+    return tuple(int(x) if x.isdigit() else x for x in attr.split("."))
+
+
+def _fast_lookup(
+    environment: "Environment",
+    values: t.List[t.Any],
+    parts: t.Tuple[t.Union[str, int], ...],
+    default: t.Optional[t.Any] = None,
+) -> t.Optional[t.List[t.Any]]:
+    """Look up the attribute path for every item at once with
+    :func:`operator.itemgetter`, or :func:`operator.attrgetter` for a
+    list of objects of one type that don't support item access. These
+    give the same result as :meth:`Environment.getitem`, so this is only
+    done if the environment doesn't override it, as the sandbox does.
+    Returns ``None`` if the fast lookup doesn't apply to these values.
+    """
+    from .environment import Environment
+
+    if type(environment).getitem is not Environment.getitem:
+        return None
+
+    keys: t.Optional[t.List[t.Any]] = values
+
+    try:
+        for part in parts:
+            keys = list(map(operator.itemgetter(part), keys))  # type: ignore
+    except Exception:
+        keys = None
+
+    if (
+        keys is None
+        and len(parts) == 1
+        and isinstance(parts[0], str)
+        and not hasattr(type(values[0]), "__getitem__")
+        and len(set(map(type, values))) == 1
+    ):
+        try:
+            keys = list(map(operator.attrgetter(parts[0]), values))
+        except Exception:
+            return None
+
+    if (
+        keys is not None
+        and default is not None
+        and any(isinstance(key, Undefined) for key in keys)
+    ):
+        return None
+
+    return keys
+
+
+def _lookup_keys(
+    environment: "Environment",
+    values: t.List[t.Any],
+    attribute: t.Optional[t.Union[str, int]],
+    postprocess: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+    default: t.Optional[t.Any] = None,
+) -> t.List[t.Any]:
+    """Returns the list of keys :func:`make_attrgetter` would return
+    for each item in ``values``, computed in one pass over the list.
+    """
+    keys = _fast_lookup(
+        environment, values, _prepare_attribute_parts(attribute), default
+    )
+
+    if keys is None:
+        getter = make_attrgetter(environment, attribute, default=default)
+        keys = list(map(getter, values))
+
+    if postprocess is ignore_case:
+        return _ignore_case_keys(keys)
+
+    if postprocess is not None:
+        return list(map(postprocess, keys))
+
+    return keys
+
+
+def _ignore_case_keys(keys: t.List[t.Any]) -> t.List[t.Any]:
+    """Apply :func:`ignore_case` to a list of keys, using
+    :meth:`str.lower` directly if they are all plain strings.
+    """
+    if len(set(map(type, keys))) == 1 and type(keys[0]) is str:
+        return list(map(str.lower, keys))
+
+    return list(map(ignore_case, keys))
+
+
+def _sort_order(keys: t.List[t.Any], reverse: bool = False) -> t.Sequence[int]:
+    """Returns the indexes of ``keys`` in stable sorted order. Keys that
+    are already in ascending order are detected while checking the same
+    pairs the sort would compare first, and aren't sorted again.
+    """
+    if not reverse and not any(map(operator.lt, islice(keys, 1, None), keys)):
+        return range(len(keys))
+
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
 
 
 def do_forceescape(value: "t.Union[str, HasHTML]") -> Markup:
@@ -370,15 +474,13 @@ def do_dictsort(
     else:
         raise FilterArgumentError('You can only sort by either "key" or "value"')
 
-    def sort_func(item: t.Tuple[t.Any, t.Any]) -> t.Any:
-        value = item[pos]
+    items = list(value.items())
 
-        if not case_sensitive:
-            value = ignore_case(value)
+    if case_sensitive:
+        return sorted(items, key=operator.itemgetter(pos), reverse=reverse)
 
-        return value
-
-    return sorted(value.items(), key=sort_func, reverse=reverse)
+    keys = _ignore_case_keys(list(map(operator.itemgetter(pos), items)))
+    return [items[i] for i in _sort_order(keys, reverse)]
 
 
 @pass_environment
@@ -431,10 +533,30 @@ def do_sort(
     .. versionchanged:: 2.6
        The ``attribute`` parameter was added.
     """
-    key_func = make_multi_attrgetter(
-        environment, attribute, postprocess=ignore_case if not case_sensitive else None
-    )
-    return sorted(value, key=key_func, reverse=reverse)
+    value = list(value)
+    postprocess = ignore_case if not case_sensitive else None
+
+    if isinstance(attribute, str) and "," in attribute:
+        keys: t.List[t.Any] = list(
+            zip(
+                *(
+                    _lookup_keys(environment, value, item, postprocess=postprocess)
+                    for item in attribute.split(",")
+                )
+            )
+        )
+    else:
+        keys = _lookup_keys(environment, value, attribute, postprocess=postprocess)
+
+        try:
+            return [value[i] for i in _sort_order(keys, reverse)]
+        except Exception:
+            # Compare one item tuples instead, which check equality before
+            # ordering, so equal values that can't be ordered, such as
+            # undefined, sort as before.
+            keys = list(zip(keys))
+
+    return [value[i] for i in _sort_order(keys, reverse)]
 
 
 @pass_environment
@@ -457,14 +579,20 @@ def do_unique(
     :param case_sensitive: Treat upper and lower case strings as distinct.
     :param attribute: Filter objects with unique values for this attribute.
     """
-    getter = make_attrgetter(
-        environment, attribute, postprocess=ignore_case if not case_sensitive else None
-    )
-    seen = set()
+    postprocess = ignore_case if not case_sensitive else None
 
-    for item in value:
-        key = getter(item)
+    if isinstance(value, (list, tuple)):
+        pairs: t.Iterable[t.Tuple[t.Any, V]] = zip(
+            _lookup_keys(environment, list(value), attribute, postprocess=postprocess),
+            value,
+        )
+    else:
+        getter = make_attrgetter(environment, attribute, postprocess=postprocess)
+        pairs = ((getter(item), item) for item in value)
 
+    seen = set()
+
+    for key, item in pairs:
         if key not in seen:
             seen.add(key)
             yield item
@@ -1250,21 +1378,16 @@ def sync_do_groupby(
     .. versionchanged:: 2.6
         The attribute supports dot notation for nested access.
     """
-    expr = make_attrgetter(
-        environment,
-        attribute,
-        postprocess=ignore_case if not case_sensitive else None,
-        default=default,
-    )
-    out = [
-        _GroupTuple(key, list(values))
-        for key, values in groupby(sorted(value, key=expr), expr)
-    ]
+    value = list(value)
+    keys = _lookup_keys(environment, value, attribute, default=default)
+    # Group on the lowercase keys, but return the real key from the first
+    # value in each group.
+    group_keys = keys if case_sensitive else _ignore_case_keys(keys)
+    out = []
 
-    if not case_sensitive:
-        # Return the real key from the first value instead of the lowercase key.
-        output_expr = make_attrgetter(environment, attribute, default=default)
-        out = [_GroupTuple(output_expr(values[0]), values) for _, values in out]
+    for _, group in groupby(_sort_order(group_keys), group_keys.__getitem__):
+        indexes = list(group)
+        out.append(_GroupTuple(keys[indexes[0]], [value[i] for i in indexes]))
 
     return out
 
@@ -1277,23 +1400,9 @@ async def do_groupby(
     default: t.Optional[t.Any] = None,
     case_sensitive: bool = False,
 ) -> "t.List[_GroupTuple]":
-    expr = make_attrgetter(
-        environment,
-        attribute,
-        postprocess=ignore_case if not case_sensitive else None,
-        default=default,
+    return sync_do_groupby(
+        environment, await auto_to_list(value), attribute, default, case_sensitive
     )
-    out = [
-        _GroupTuple(key, await auto_to_list(values))
-        for key, values in groupby(sorted(await auto_to_list(value), key=expr), expr)
-    ]
-
-    if not case_sensitive:
-        # Return the real key from the first value instead of the lowercase key.
-        output_expr = make_attrgetter(environment, attribute, default=default)
-        out = [_GroupTuple(output_expr(values[0]), values) for _, values in out]
-
-    return out
 
 
 @pass_environment
@@ -210,6 +210,18 @@ def count_newlines(value: str) -> int:
     return len(newline_re.findall(value))
 
 
+def _scoped_pattern(regex: t.Pattern[str]) -> str:
+    """Return the pattern of a compiled regex wrapped in a group that
+    applies its flags, so that it can be combined with other patterns.
+    """
+    flags = "".join(
+        name
+        for name, flag in (("i", re.I), ("m", re.M), ("s", re.S), ("x", re.X))
+        if regex.flags & flag
+    )
+    return f"(?{flags}:{regex.pattern})" if flags else f"(?:{regex.pattern})"
+
+
 def compile_rules(environment: "Environment") -> t.List[t.Tuple[str, str]]:
     """Compiles all the rules from the environment into a list of rules."""
     e = re.escape
@@ -595,6 +607,43 @@ class Lexer:
             ],
         }
 
+        # Without line statements and line comments, the states can be
+        # tokenized with one combined regex each, see _tokeniter_fast.
+        self._fast_rules: t.Optional[t.Dict[str, t.Pattern[str]]] = None
+        self._fast_start: t.Optional[str] = None
+
+        if (
+            environment.line_statement_prefix is None
+            and environment.line_comment_prefix is None
+        ):
+            tag_re = "|".join(
+                f"(?P<{rule.tokens}>{_scoped_pattern(rule.pattern)})"
+                for rule in tag_rules
+            )
+            self._fast_rules = {
+                "root": c(root_parts_re),
+                TOKEN_BLOCK_BEGIN: c(
+                    f"(?P<{TOKEN_BLOCK_END}>"
+                    f"{_scoped_pattern(self.rules[TOKEN_BLOCK_BEGIN][0].pattern)})"
+                    f"|{tag_re}"
+                ),
+                TOKEN_VARIABLE_BEGIN: c(
+                    f"(?P<{TOKEN_VARIABLE_END}>"
+                    f"{_scoped_pattern(self.rules[TOKEN_VARIABLE_BEGIN][0].pattern)})"
+                    f"|{tag_re}"
+                ),
+                # Used while braces are open, where end tags are operators.
+                TOKEN_OPERATOR: c(tag_re),
+            }
+            # If all tags start with the same character, data is skipped
+            # by finding that character before matching a tag.
+            start_chars = {
+                environment.block_start_string[:1],
+                environment.variable_start_string[:1],
+                environment.comment_start_string[:1],
+            }
+            self._fast_start = start_chars.pop() if len(start_chars) == 1 else None
+
     def _normalize_newlines(self, value: str) -> str:
         """Replace all newlines with the configured sequence in strings
         and template data.
@@ -676,16 +725,24 @@ class Lexer:
         """This method tokenizes the text and returns the tokens in a
         generator. Use this method if you just want to tokenize a template.
 
+        .. versionchanged:: 3.1.5
+            Environments without line statements and line comments use
+            a faster tokenizer with one combined regex per state.
+
         .. versionchanged:: 3.0
             Only ``\\n``, ``\\r\\n`` and ``\\r`` are treated as line
             breaks.
         """
-        lines = newline_re.split(source)[::2]
+        if "\r" in source:
+            source = source.replace("\r\n", "\n").replace("\r", "\n")
+
+        if not self.keep_trailing_newline and source[-1:] == "\n":
+            source = source[:-1]
 
-        if not self.keep_trailing_newline and lines[-1] == "":
-            del lines[-1]
+        if self._fast_rules is not None:
+            yield from self._tokeniter_fast(source, name, filename, state)
+            return
 
-        source = "\n".join(lines)
         pos = 0
         lineno = 1
         stack = ["root"]
@@ -866,3 +923,201 @@ class Lexer:
                 raise TemplateSyntaxError(
                     f"unexpected char {source[pos]!r} at {pos}", lineno, name, filename
                 )
+
+    def _tokeniter_fast(
+        self,
+        source: str,
+        name: t.Optional[str],
+        filename: t.Optional[str],
+        state: t.Optional[str],
+    ) -> t.Iterator[t.Tuple[int, str, str]]:
+        """Produce the same tokens as :meth:`tokeniter` for a source with
+        normalized newlines. Each state is matched with one combined
+        regex and dispatched on the name of the group that matched, data
+        is found with a search instead of a lazy match, and newlines are
+        only counted in tokens that can contain them.
+        """
+        rules = self._fast_rules
+        assert rules is not None
+        root_re = rules["root"]
+        start_char = self._fast_start
+        balanced_re = rules[TOKEN_OPERATOR]
+        comment_rule, comment_failure = self.rules[TOKEN_COMMENT_BEGIN]
+        raw_rule, raw_failure = self.rules[TOKEN_RAW_BEGIN]
+        lstrip_blocks = self.lstrip_blocks
+        pos = 0
+        lineno = 1
+        source_length = len(source)
+        balancing_stack: t.List[str] = []
+        line_starting = True
+
+        if state is None or state == "root":
+            state = "root"
+        else:
+            assert state in ("variable", "block"), "invalid state"
+            state += "_begin"
+
+        while True:
+            if state == "root":
+                if start_char is None:
+                    m = root_re.search(source, pos)
+                else:
+                    m = None
+                    start = source.find(start_char, pos)
+
+                    while start != -1:
+                        m = root_re.match(source, start)
+
+                        if m is not None:
+                            break
+
+                        start = source.find(start_char, start + 1)
+
+                if m is None:
+                    if pos < source_length:
+                        yield lineno, TOKEN_DATA, source[pos:]
+
+                    return
+
+                text = source[pos : m.start()]
+                state = m.lastgroup  # type: ignore[assignment]
+                strip_sign = m.group(m.lastindex + 1)  # type: ignore[operator]
+                newlines_stripped = 0
+
+                if strip_sign == "-":
+                    # Strip all whitespace between the text and the tag.
+                    stripped = text.rstrip()
+                    newlines_stripped = text[len(stripped) :].count("\n")
+                    text = stripped
+                elif (
+                    strip_sign != "+"
+                    and lstrip_blocks
+                    and state != TOKEN_VARIABLE_BEGIN
+                ):
+                    l_pos = text.rfind("\n") + 1
+
+                    if l_pos > 0 or line_starting:
+                        if whitespace_re.fullmatch(text, l_pos):
+                            text = text[:l_pos]
+
+                if text:
+                    yield lineno, TOKEN_DATA, text
+                    lineno += text.count("\n")
+
+                lineno += newlines_stripped
+                data = m.group(state)
+                yield lineno, state, data  # type: ignore[misc]
+
+                if state == TOKEN_RAW_BEGIN:
+                    lineno += data.count("\n")
+                    line_starting = data[-1:] == "\n"
+
+                pos = m.end()
+            elif state == TOKEN_BLOCK_BEGIN or state == TOKEN_VARIABLE_BEGIN:
+                m = (balanced_re if balancing_stack else rules[state]).match(
+                    source, pos
+                )
+
+                if m is None:
+                    if pos >= source_length:
+                        return
+
+                    raise TemplateSyntaxError(
+                        f"unexpected char {source[pos]!r} at {pos}",
+                        lineno,
+                        name,
+                        filename,
+                    )
+
+                token = m.lastgroup
+                data = m.group()
+
+                if token == TOKEN_OPERATOR:
+                    if data == "{":
+                        balancing_stack.append("}")
+                    elif data == "(":
+                        balancing_stack.append(")")
+                    elif data == "[":
+                        balancing_stack.append("]")
+                    elif data in ("}", ")", "]"):
+                        if not balancing_stack:
+                            raise TemplateSyntaxError(
+                                f"unexpected '{data}'", lineno, name, filename
+                            )
+
+                        expected_op = balancing_stack.pop()
+
+                        if expected_op != data:
+                            raise TemplateSyntaxError(
+                                f"unexpected '{data}', expected '{expected_op}'",
+                                lineno,
+                                name,
+                                filename,
+                            )
+
+                    yield lineno, token, data
+                elif token == TOKEN_WHITESPACE or token == TOKEN_STRING:
+                    yield lineno, token, data
+                    lineno += data.count("\n")
+                elif token == TOKEN_BLOCK_END or token == TOKEN_VARIABLE_END:
+                    yield lineno, token, data
+                    lineno += data.count("\n")
+                    line_starting = data[-1:] == "\n"
+                    state = "root"
+                else:
+                    yield lineno, token, data  # type: ignore[misc]
+
+                pos = m.end()
+            elif state == TOKEN_COMMENT_BEGIN:
+                m = comment_rule.pattern.match(source, pos)
+
+                if m is None:
+                    if pos >= source_length:
+                        return
+
+                    comment_failure.tokens[0](lineno, filename)  # type: ignore
+
+                text, data = m.groups()
+
+                if text:
+                    yield lineno, TOKEN_COMMENT, text
+                    lineno += text.count("\n")
+
+                yield lineno, TOKEN_COMMENT_END, data
+                lineno += data.count("\n")
+                line_starting = m.group()[-1:] == "\n"
+                state = "root"
+                pos = m.end()
+            else:
+                m = raw_rule.pattern.match(source, pos)
+
+                if m is None:
+                    if pos >= source_length:
+                        return
+
+                    raw_failure.tokens[0](lineno, filename)  # type: ignore
+
+                text, data, strip_sign = m.groups()
+                newlines_stripped = 0
+
+                if strip_sign == "-":
+                    stripped = text.rstrip()
+                    newlines_stripped = text[len(stripped) :].count("\n")
+                    text = stripped
+                elif strip_sign != "+" and lstrip_blocks:
+                    l_pos = text.rfind("\n") + 1
+
+                    if l_pos > 0 or line_starting:
+                        if whitespace_re.fullmatch(text, l_pos):
+                            text = text[:l_pos]
+
+                if text:
+                    yield lineno, TOKEN_DATA, text
+                    lineno += text.count("\n")
+
+                lineno += newlines_stripped
+                yield lineno, TOKEN_RAW_END, data
+                lineno += data.count("\n")
+                line_starting = m.group()[-1:] == "\n"
+                state = "root"
+                pos = m.end()
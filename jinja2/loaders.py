@@ -599,6 +599,20 @@ class ModuleLoader(BaseLoader):
     ... ])
 
     Templates can be precompiled with :meth:`Environment.compile_templates`.
+
+    If a ``source_loader`` is given, each precompiled module is checked
+    against the checksum of the template's current source. A template
+    that is missing or out of date is loaded from the source loader
+    instead, and the source loader's up to date check is used for auto
+    reloading.
+
+    >>> loader = ModuleLoader(
+    ...     '/path/to/compiled/templates',
+    ...     source_loader=FileSystemLoader('/path/to/templates'),
+    ... )
+
+    .. versionchanged:: 3.1.5
+        Added the ``source_loader`` parameter.
     """
 
     has_source_access = False
@@ -608,6 +622,7 @@ class ModuleLoader(BaseLoader):
         path: t.Union[
             str, "os.PathLike[str]", t.Sequence[t.Union[str, "os.PathLike[str]"]]
         ],
+        source_loader: t.Optional[BaseLoader] = None,
     ) -> None:
         package_name = f"_jinja2_module_templates_{id(self):x}"
 
@@ -629,6 +644,10 @@ class ModuleLoader(BaseLoader):
         # loader that created it goes out of business.
         self.module = mod
         self.package_name = package_name
+        self.source_loader = source_loader
+
+        if source_loader is not None:
+            self.has_source_access = source_loader.has_source_access
 
     @staticmethod
     def get_template_key(name: str) -> str:
@@ -638,6 +657,30 @@ class ModuleLoader(BaseLoader):
     def get_module_filename(name: str) -> str:
         return ModuleLoader.get_template_key(name) + ".py"
 
+    @staticmethod
+    def get_source_checksum(source: str) -> str:
+        """The checksum of a template's source that
+        :meth:`Environment.compile_templates` stores in the compiled
+        module as ``source_checksum``.
+
+        .. versionadded:: 3.1.5
+        """
+        return sha1(source.encode("utf-8")).hexdigest()
+
+    def get_source(
+        self, environment: "Environment", template: str
+    ) -> t.Tuple[str, t.Optional[str], t.Optional[t.Callable[[], bool]]]:
+        if self.source_loader is None:
+            return super().get_source(environment, template)
+
+        return self.source_loader.get_source(environment, template)
+
+    def list_templates(self) -> t.List[str]:
+        if self.source_loader is None:
+            return super().list_templates()
+
+        return self.source_loader.list_templates()
+
     @internalcode
     def load(
         self,
@@ -653,15 +696,30 @@ class ModuleLoader(BaseLoader):
             try:
                 mod = __import__(module, None, None, ["root"])
             except ImportError as e:
+                if self.source_loader is not None:
+                    return self.source_loader.load(environment, name, globals)
+
                 raise TemplateNotFound(name) from e
 
             # remove the entry from sys.modules, we only want the attribute
             # on the module object we have stored on the loader.
             sys.modules.pop(module, None)
 
+        uptodate = None
+
+        if self.source_loader is not None:
+            source, _, uptodate = self.source_loader.get_source(environment, name)
+
+            if mod.__dict__.get("source_checksum") != self.get_source_checksum(
+                source
+            ):
+                return self.source_loader.load(environment, name, globals)
+
         if globals is None:
             globals = {}
 
-        return environment.template_class.from_module_dict(
+        rv = environment.template_class.from_module_dict(
             environment, mod.__dict__, globals
         )
+        rv._uptodate = uptodate
+        return rv
@@ -84,6 +84,10 @@ class NativeCodeGenerator(CodeGenerator):
         if finalize.src is not None:
             self.write(")")
 
+    def visit_Flush(self, node: nodes.Flush, frame: Frame) -> None:
+        # The marker would be concatenated with native output.
+        pass
+
 
 class NativeEnvironment(Environment):
     """An environment that renders templates to native Python types."""
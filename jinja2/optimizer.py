@@ -46,3 +46,82 @@ class Optimizer(NodeTransformer):
                 pass
 
         return node
+
+    def visit_CondExpr(
+        self, node: nodes.CondExpr, *args: t.Any, **kwargs: t.Any
+    ) -> nodes.Node:
+        rv = self.generic_visit(node, *args, **kwargs)
+
+        # Pick the branch if only the test is constant.
+        if isinstance(rv, nodes.CondExpr):
+            try:
+                test = rv.test.as_const(args[0] if args else None)
+            except nodes.Impossible:
+                return rv
+
+            if test:
+                return rv.expr1
+
+            if rv.expr2 is not None:
+                return rv.expr2
+
+        return rv
+
+    def visit_And(self, node: nodes.And, *args: t.Any, **kwargs: t.Any) -> nodes.Node:
+        return self._fold_left(node, False, *args, **kwargs)
+
+    def visit_Or(self, node: nodes.Or, *args: t.Any, **kwargs: t.Any) -> nodes.Node:
+        return self._fold_left(node, True, *args, **kwargs)
+
+    def _fold_left(
+        self,
+        node: t.Union[nodes.And, nodes.Or],
+        short_circuit: bool,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> nodes.Node:
+        """If only the left side of ``and`` or ``or`` is constant, it
+        either decides the result or the right side is the result.
+        """
+        rv = self.generic_visit(node, *args, **kwargs)
+
+        if isinstance(rv, (nodes.And, nodes.Or)):
+            try:
+                left = rv.left.as_const(args[0] if args else None)
+            except nodes.Impossible:
+                return rv
+
+            if bool(left) is short_circuit:
+                return rv.left
+
+            return rv.right
+
+        return rv
+
+    def visit_Concat(
+        self, node: nodes.Concat, *args: t.Any, **kwargs: t.Any
+    ) -> nodes.Node:
+        rv = self.generic_visit(node, *args, **kwargs)
+
+        # Join runs of constant strings and numbers. Escaping them
+        # separately or together gives the same result.
+        if isinstance(rv, nodes.Concat):
+            merged: t.List[nodes.Expr] = []
+
+            for child in rv.nodes:
+                if (
+                    merged
+                    and isinstance(child, nodes.Const)
+                    and type(child.value) in {str, int, float}
+                    and isinstance(merged[-1], nodes.Const)
+                    and type(merged[-1].value) in {str, int, float}
+                ):
+                    merged[-1] = nodes.Const(
+                        f"{merged[-1].value}{child.value}", lineno=merged[-1].lineno
+                    )
+                else:
+                    merged.append(child)
+
+            rv.nodes = merged
+
+        return rv
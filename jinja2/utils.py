@@ -8,6 +8,7 @@ from collections import deque
 from random import choice
 from random import randrange
 from threading import Lock
+from time import monotonic
 from types import CodeType
 from urllib.parse import quote_from_bytes
 
@@ -567,6 +568,185 @@ class LRUCache:
     __copy__ = copy
 
 
+class ClockCache:
+    """A cache for many threads reading at once, such as the template
+    cache of an environment used by a threaded server.
+
+    Reads don't take a lock. Writes copy the mapping, change the copy,
+    and replace the mapping, so a read always sees a complete mapping.
+    Writing is slower than with :class:`LRUCache`, which is fine when
+    items are read much more often than they are added.
+
+    When the cache is full, the oldest item that wasn't read since the
+    last eviction is removed (the CLOCK algorithm, an approximation of
+    LRU). Optionally, items expire ``ttl`` seconds after being set.
+
+    :attr:`hits`, :attr:`misses`, and :attr:`evictions` count cache
+    use. They are updated without a lock, so with many threads they
+    are approximate.
+
+    .. versionadded:: 3.1.5
+    """
+
+    def __init__(self, capacity: int, ttl: t.Optional[float] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("'capacity' must be a positive number.")
+
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> [value, referenced, expires]
+        self._mapping: t.Dict[t.Any, t.List[t.Any]] = {}
+        self._wlock = Lock()
+
+    def __getstate__(self) -> t.Mapping[str, t.Any]:
+        state = self.__dict__.copy()
+        del state["_wlock"]
+        return state
+
+    def __setstate__(self, d: t.Mapping[str, t.Any]) -> None:
+        self.__dict__.update(d)
+        self._wlock = Lock()
+
+    def __getnewargs__(self) -> t.Tuple[t.Any, ...]:
+        return (self.capacity, self.ttl)
+
+    def copy(self) -> "ClockCache":
+        """Return a shallow copy of the instance."""
+        rv = self.__class__(self.capacity, self.ttl)
+        rv._mapping = {k: v.copy() for k, v in self._mapping.items()}
+        return rv
+
+    def stats(self) -> t.Dict[str, int]:
+        """Return the size, capacity, and counters of the cache."""
+        return {
+            "size": len(self._mapping),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: t.Any, default: t.Any = None) -> t.Any:
+        """Return an item from the cache dict or `default`"""
+        entry = self._mapping.get(key)
+
+        if entry is None or (entry[2] is not None and entry[2] <= monotonic()):
+            self.misses += 1
+            return default
+
+        entry[1] = True
+        self.hits += 1
+        return entry[0]
+
+    def setdefault(self, key: t.Any, default: t.Any = None) -> t.Any:
+        """Set `default` if the key is not in the cache otherwise
+        leave unchanged. Return the value of this key.
+        """
+        rv = self.get(key, missing)
+
+        if rv is missing:
+            self[key] = rv = default
+
+        return rv
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._wlock:
+            self._mapping = {}
+
+    def __contains__(self, key: t.Any) -> bool:
+        """Check if a key exists in this cache."""
+        entry = self._mapping.get(key)
+        return entry is not None and (entry[2] is None or entry[2] > monotonic())
+
+    def __len__(self) -> int:
+        """Return the current size of the cache."""
+        return len(self._mapping)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {dict(self.items())!r}>"
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        """Get an item from the cache and mark it as recently used.
+
+        Raise a `KeyError` if it does not exist or has expired.
+        """
+        rv = self.get(key, missing)
+
+        if rv is missing:
+            raise KeyError(key)
+
+        return rv
+
+    def __setitem__(self, key: t.Any, value: t.Any) -> None:
+        """Sets the value for an item, evicting an item if the cache is
+        full.
+        """
+        expires = None if self.ttl is None else monotonic() + self.ttl
+
+        with self._wlock:
+            mapping = self._mapping.copy()
+            mapping.pop(key, None)
+
+            if len(mapping) >= self.capacity:
+                self._evict(mapping)
+
+            mapping[key] = [value, False, expires]
+            self._mapping = mapping
+
+    def _evict(self, mapping: t.Dict[t.Any, t.List[t.Any]]) -> None:
+        # Give each item that was read a second chance by clearing its
+        # flag and moving it to the end. The loop ends once every item
+        # was moved, since its flag is clear then.
+        now = monotonic()
+
+        while True:
+            key = next(iter(mapping))
+            entry = mapping.pop(key)
+
+            if entry[1] and (entry[2] is None or entry[2] > now):
+                entry[1] = False
+                mapping[key] = entry
+                continue
+
+            self.evictions += 1
+            return
+
+    def __delitem__(self, key: t.Any) -> None:
+        """Remove an item from the cache dict.
+        Raise a `KeyError` if it does not exist.
+        """
+        with self._wlock:
+            mapping = self._mapping.copy()
+            del mapping[key]
+            self._mapping = mapping
+
+    def items(self) -> t.Iterable[t.Tuple[t.Any, t.Any]]:
+        """Return a list of items that haven't expired."""
+        now = monotonic()
+        return [
+            (key, entry[0])
+            for key, entry in self._mapping.items()
+            if entry[2] is None or entry[2] > now
+        ]
+
+    def values(self) -> t.Iterable[t.Any]:
+        """Return a list of all values."""
+        return [x[1] for x in self.items()]
+
+    def keys(self) -> t.Iterable[t.Any]:
+        """Return a list of all keys."""
+        return [x[0] for x in self.items()]
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self.keys())
+
+    __copy__ = copy
+
+
 def select_autoescape(
     enabled_extensions: t.Collection[str] = ("html", "htm", "xml"),
     disabled_extensions: t.Collection[str] = (),
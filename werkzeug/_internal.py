@@ -27,10 +27,18 @@ _missing = _Missing()
 
 
 def _wsgi_decoding_dance(s: str) -> str:
+    # ASCII is the same in latin1 and UTF-8, skip the round trip for the
+    # common case.
+    if s.isascii():
+        return s
+
     return s.encode("latin1").decode(errors="replace")
 
 
 def _wsgi_encoding_dance(s: str) -> str:
+    if s.isascii():
+        return s
+
     return s.encode().decode("latin1")
 
 
@@ -75,8 +83,8 @@ class _ColorStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
         super().__init__(stream)
 
 
-def _log(type: str, message: str, *args: t.Any, **kwargs: t.Any) -> None:
-    """Log a message to the 'werkzeug' logger.
+def _get_logger() -> logging.Logger:
+    """Get the 'werkzeug' logger.
 
     The logger is created the first time it is needed. If there is no
     level set, it is set to :data:`logging.INFO`. If there is no handler
@@ -94,7 +102,12 @@ def _log(type: str, message: str, *args: t.Any, **kwargs: t.Any) -> None:
         if not _has_level_handler(_logger):
             _logger.addHandler(_ColorStreamHandler())
 
-    getattr(_logger, type)(message.rstrip(), *args, **kwargs)
+    return _logger
+
+
+def _log(type: str, message: str, *args: t.Any, **kwargs: t.Any) -> None:
+    """Log a message to the 'werkzeug' logger. See :func:`_get_logger`."""
+    getattr(_get_logger(), type)(message.rstrip(), *args, **kwargs)
 
 
 @t.overload
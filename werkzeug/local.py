@@ -268,7 +268,7 @@ class _ProxyLookup:
         docs still works.
     """
 
-    __slots__ = ("bind_f", "fallback", "is_attr", "class_value", "name")
+    __slots__ = ("bind_f", "c_f", "fallback", "is_attr", "class_value", "name")
 
     def __init__(
         self,
@@ -278,6 +278,7 @@ class _ProxyLookup:
         is_attr: bool = False,
     ) -> None:
         bind_f: t.Callable[[LocalProxy[t.Any], t.Any], t.Callable[..., t.Any]] | None
+        c_f: t.Callable[..., t.Any] | None = None
 
         if hasattr(f, "__get__"):
             # A Python function, can be turned into a bound method.
@@ -288,18 +289,17 @@ class _ProxyLookup:
                 return f.__get__(obj, type(obj))  # type: ignore
 
         elif f is not None:
-            # A C function, use partial to bind the first argument.
-
-            def bind_f(
-                instance: LocalProxy[t.Any], obj: t.Any
-            ) -> t.Callable[..., t.Any]:
-                return partial(f, obj)
+            # A C function, use partial to bind the first argument. This
+            # is done directly in __get__ to avoid an extra call.
+            bind_f = None
+            c_f = f
 
         else:
             # Use getattr, which will produce a bound method.
             bind_f = None
 
         self.bind_f = bind_f
+        self.c_f = c_f
         self.fallback = fallback
         self.class_value = class_value
         self.is_attr = is_attr
@@ -315,7 +315,8 @@ class _ProxyLookup:
             return self
 
         try:
-            obj = instance._get_current_object()
+            # Bypass LocalProxy.__getattribute__, this is a private name.
+            obj = object.__getattribute__(instance, "_get_current_object")()
         except RuntimeError:
             if self.fallback is None:
                 raise
@@ -329,6 +330,9 @@ class _ProxyLookup:
 
             return fallback
 
+        if self.c_f is not None:
+            return partial(self.c_f, obj)
+
         if self.bind_f is not None:
             return self.bind_f(instance, obj)
 
@@ -370,6 +374,7 @@ class _ProxyIOp(_ProxyLookup):
             return i_op.__get__(obj, type(obj))  # type: ignore
 
         self.bind_f = bind_f
+        self.c_f = None
 
 
 def _l_to_r_op(op: F) -> F:
@@ -441,6 +446,20 @@ class LocalProxy(t.Generic[T]):
         isinstance(user, User)  # True
         issubclass(type(user), LocalProxy)  # True
 
+    Every operation on the proxy looks up the current object again. In
+    code that uses the object many times, such as a view that reads
+    ``request`` dozens of times, call :meth:`_get_current_object` once
+    and use the returned object instead.
+
+    .. code-block:: python
+
+        req = request._get_current_object()
+        user_agent = req.headers.get("User-Agent")
+
+    .. versionchanged:: 3.0.7
+        Attribute access and operations that proxy a built-in function
+        make fewer calls.
+
     .. versionchanged:: 2.2.2
         ``__wrapped__`` is set when wrapping an object, not only when
         wrapping a function, to prevent doctest from failing.
@@ -464,6 +483,7 @@ class LocalProxy(t.Generic[T]):
     """
 
     __slots__ = ("__wrapped", "_get_current_object")
+    __forward_public = True
 
     _get_current_object: t.Callable[[], T]
     """Return the current object this proxy is bound to. If the proxy is
@@ -510,6 +530,15 @@ class LocalProxy(t.Generic[T]):
 
                 return get_name(obj)
 
+        elif isinstance(local, ContextVar) and name is None:
+            # The most common case, don't call _identity on every access.
+
+            def _get_current_object() -> T:
+                try:
+                    return local.get()
+                except LookupError:
+                    raise RuntimeError(unbound_message) from None
+
         elif isinstance(local, ContextVar):
 
             def _get_current_object() -> T:
@@ -553,8 +582,30 @@ class LocalProxy(t.Generic[T]):
     __ge__ = _ProxyLookup(operator.ge)
     __hash__ = _ProxyLookup(hash)  # type: ignore[assignment]
     __bool__ = _ProxyLookup(bool, fallback=lambda self: False)
-    __getattr__ = _ProxyLookup(getattr)
-    # __getattribute__ triggered through __getattr__
+
+    def __getattribute__(self, name: str) -> t.Any:
+        # Attribute access is by far the most common operation on a proxy.
+        # The proxy itself only has private and dunder attributes, so
+        # forward public names directly instead of failing the lookup on
+        # the proxy and falling back to __getattr__, which is slow.
+        if name[:1] != "_" and type(self).__forward_public:
+            return getattr(
+                object.__getattribute__(self, "_get_current_object")(), name
+            )
+
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._get_current_object(), name)
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass may add public attributes or an instance dict, which
+        # must be looked up on the proxy first.
+        cls.__forward_public = cls.__dictoffset__ == 0 and all(
+            name.startswith("_") for name in dir(cls)
+        )
+
     __setattr__ = _ProxyLookup(setattr)  # type: ignore[assignment]
     __delattr__ = _ProxyLookup(delattr)  # type: ignore[assignment]
     __dir__ = _ProxyLookup(dir, fallback=lambda self: [])  # type: ignore[assignment]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as t
 import warnings
+from functools import lru_cache
 from pprint import pformat
 from threading import Lock
 from urllib.parse import quote
@@ -230,17 +231,9 @@ class Map:
         if path_info is None:
             path_info = "/"
 
-        # Port isn't part of IDNA, and might push a name over the 63 octet limit.
-        server_name, port_sep, port = server_name.partition(":")
-
-        try:
-            server_name = server_name.encode("idna").decode("ascii")
-        except UnicodeError as e:
-            raise BadHost() from e
-
         return MapAdapter(
             self,
-            f"{server_name}{port_sep}{port}",
+            _encode_server_name(server_name),
             script_name,
             subdomain,
             url_scheme,
@@ -299,13 +292,15 @@ class Map:
         env = _get_environ(environ)
         wsgi_server_name = get_host(env).lower()
         scheme = env["wsgi.url_scheme"]
-        upgrade = any(
-            v.strip() == "upgrade"
-            for v in env.get("HTTP_CONNECTION", "").lower().split(",")
-        )
+        connection = env.get("HTTP_CONNECTION")
+
+        if connection and env.get("HTTP_UPGRADE", "").lower() == "websocket":
+            upgrade = any(
+                v.strip() == "upgrade" for v in connection.lower().split(",")
+            )
 
-        if upgrade and env.get("HTTP_UPGRADE", "").lower() == "websocket":
-            scheme = "wss" if scheme == "https" else "ws"
+            if upgrade:
+                scheme = "wss" if scheme == "https" else "ws"
 
         if server_name is None:
             server_name = wsgi_server_name
@@ -379,6 +374,22 @@ class Map:
         return f"{type(self).__name__}({pformat(list(rules))})"
 
 
+@lru_cache(maxsize=128)
+def _encode_server_name(server_name: str) -> str:
+    """IDNA encode the host part of a server name. A server sees the same
+    few host names on every request, so the result is cached.
+    """
+    # Port isn't part of IDNA, and might push a name over the 63 octet limit.
+    server_name, port_sep, port = server_name.partition(":")
+
+    try:
+        server_name = server_name.encode("idna").decode("ascii")
+    except UnicodeError as e:
+        raise BadHost() from e
+
+    return f"{server_name}{port_sep}{port}"
+
+
 class MapAdapter:
     """Returned by :meth:`Map.bind` or :meth:`Map.bind_to_environ` and does
     the URL matching and building based on runtime information.